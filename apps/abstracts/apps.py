@@ -1,5 +1,12 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class AbstractsConfig(AppConfig):
     name = 'apps.abstracts'
+
+    def ready(self) -> None:
+        """Count the queries of every new database connection."""
+        from apps.abstracts.instrumentation import install_query_recorder
+
+        connection_created.connect(install_query_recorder, dispatch_uid="install_query_recorder")
@@ -0,0 +1,95 @@
+"""In-process benchmark runner of API endpoints."""
+
+import subprocess
+from threading import Lock, Thread
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from django.db import connections
+from django.test import Client
+
+from apps.abstracts.loadtest import LoadResult
+
+# Sends the request number ``index`` with the client and returns the status.
+Send = Callable[[Client, int], int]
+
+
+def run_scenario(url: str, send: Send, requests: int, concurrency: int) -> LoadResult:
+    """
+    Send the requests from ``concurrency`` threads and time each of them.
+
+    Every thread keeps its own test client and database connection for the
+    whole scenario, like the workers of a server.
+    """
+
+    result: LoadResult = LoadResult(url=url, connections=concurrency)
+    indexes = iter(range(requests))
+    lock: Lock = Lock()
+
+    def next_index() -> Optional[int]:
+        with lock:
+            return next(indexes, None)
+
+    def worker() -> None:
+        client: Client = Client()
+        try:
+            while (index := next_index()) is not None:
+                started_at: float = perf_counter()
+                try:
+                    status: int = send(client, index)
+                except Exception as error:
+                    with lock:
+                        result.errors[type(error).__name__] += 1
+                    continue
+                latency: float = (perf_counter() - started_at) * 1000
+                with lock:
+                    result.latencies.append(latency)
+                    result.statuses[status] += 1
+        finally:
+            connections.close_all()
+
+    threads: list[Thread] = [Thread(target=worker) for _ in range(concurrency)]
+    started_at: float = perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.elapsed = perf_counter() - started_at
+    return result
+
+
+def current_commit() -> Optional[str]:
+    """Get the git commit of the working tree, None outside of a repository."""
+
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_results(baseline: dict[str, Any], current: dict[str, Any]) -> list[dict[str, Any]]:
+    """Get the relative change of latency and throughput of the scenarios run in both results."""
+
+    previous: dict[str, dict[str, Any]] = {
+        scenario["name"]: scenario for scenario in baseline.get("scenarios", [])
+    }
+    changes: list[dict[str, Any]] = []
+    for scenario in current["scenarios"]:
+        before: Optional[dict[str, Any]] = previous.get(scenario["name"])
+        if before is None:
+            continue
+        changes.append(
+            {
+                "name": scenario["name"],
+                **{
+                    metric: (scenario[metric] - before[metric]) / before[metric] * 100 if before[metric] else None
+                    for metric in ("p50_ms", "p99_ms", "throughput")
+                },
+            }
+        )
+    return changes
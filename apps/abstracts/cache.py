@@ -0,0 +1,335 @@
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from hashlib import sha1
+from threading import Lock
+from time import monotonic, time
+from typing import Any, Iterable, NamedTuple, Optional
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+from rest_framework.request import Request
+
+
+class BaseCacheBackend:
+    """
+    Interface of the key-value stores used by the project caches.
+
+    Keys are strings, values are any picklable object and timeouts are in
+    seconds (``None`` means the entry never expires).
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value by its key or None if it is missing."""
+        raise NotImplementedError
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get the values of the keys which are present."""
+        values: dict[str, Any] = {}
+        for key in keys:
+            value: Optional[Any] = self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        """Store a value under the key."""
+        raise NotImplementedError
+
+    def incr(self, key: str, delta: int = 1, timeout: Optional[int] = None) -> int:
+        """
+        Add to the integer stored under the key, starting from 0 when it is missing.
+
+        The timeout only applies when the key is created. Returns the new value.
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Remove the key if it is present."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove every key."""
+        raise NotImplementedError
+
+
+class LocMemLRUCache(BaseCacheBackend):
+    """Thread-safe in-process cache bounded by entries count and evicted in LRU order."""
+
+    def __init__(self, max_entries: int = 1024, **options: Any) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[Optional[float], Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value by its key and mark it as recently used."""
+
+        with self._lock:
+            entry: Optional[tuple[Optional[float], Any]] = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+
+        expires_at: Optional[float] = None if timeout is None else monotonic() + timeout
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def incr(self, key: str, delta: int = 1, timeout: Optional[int] = None) -> int:
+        """Add to the integer stored under the key atomically."""
+
+        now: float = monotonic()
+        with self._lock:
+            entry: Optional[tuple[Optional[float], Any]] = self._entries.get(key)
+            if entry is None or (entry[0] is not None and entry[0] <= now):
+                entry = (None if timeout is None else now + timeout, 0)
+
+            value: int = entry[1] + delta
+            self._entries[key] = (entry[0], value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return value
+
+    def delete(self, key: str) -> None:
+        """Remove the key if it is present."""
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every key."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DjangoCacheBackend(BaseCacheBackend):
+    """
+    Adapter over a cache configured in Django's CACHES setting.
+
+    Lets the project caches run on the file-based, Memcached or Redis
+    backends shipped with Django.
+    """
+
+    def __init__(self, alias: str = "default", **options: Any) -> None:
+        self.alias = alias
+
+    @property
+    def _cache(self) -> Any:
+        return caches[self.alias]
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value by its key or None if it is missing."""
+        return self._cache.get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """Get the values of the keys which are present in one round trip."""
+        return self._cache.get_many(list(keys))
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        """Store a value under the key."""
+        self._cache.set(key, value, timeout)
+
+    def incr(self, key: str, delta: int = 1, timeout: Optional[int] = None) -> int:
+        """Add to the integer stored under the key, atomically on Memcached and Redis."""
+
+        self._cache.add(key, 0, timeout)
+        try:
+            return self._cache.incr(key, delta)
+        except ValueError:
+            # Expired between the two calls.
+            self._cache.set(key, delta, timeout)
+            return delta
+
+    def delete(self, key: str) -> None:
+        """Remove the key if it is present."""
+        self._cache.delete(key)
+
+    def clear(self) -> None:
+        """Remove every key."""
+        self._cache.clear()
+
+
+def build_cache_backend(config: dict[str, Any]) -> BaseCacheBackend:
+    """Instantiate the backend described by a ``{"BACKEND", "OPTIONS"}`` config."""
+
+    backend_class: type[BaseCacheBackend] = import_string(config["BACKEND"])
+    return backend_class(**config.get("OPTIONS", {}))
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Rendered response body stored in the response cache."""
+
+    status: int
+    content: bytes
+    content_type: str
+    # (Content-Encoding, body) pairs compressed so far, see apps.abstracts.compression.
+    # Stored under keys of their own, see ResponseCache.set_variant.
+    variants: tuple[tuple[str, bytes], ...] = ()
+
+
+class TagVersion(NamedTuple):
+    """Current version of an invalidation tag and when it was set, in seconds since the epoch."""
+
+    token: str
+    set_at: float
+
+
+class ResponseCacheKey(NamedTuple):
+    """Key of a response in the response cache and the versions of the tags it embeds."""
+
+    key: str
+    versions: tuple[TagVersion, ...]
+
+    @property
+    def invalidated_at(self) -> float:
+        """When the most recently invalidated tag of the response was invalidated."""
+        return max((version.set_at for version in self.versions), default=0.0)
+
+
+class ResponseCache:
+    """
+    Cache of rendered GET responses invalidated by tags.
+
+    Every entry is stored under a key that embeds the current version of each
+    of its tags. Invalidating a tag replaces its version, which makes all the
+    entries built with the old one unreachable while leaving entries of other
+    tags untouched. Unreachable entries expire or get evicted on their own.
+
+    Versions expire with the timeout of the entries: a process whose backend
+    didn't see the invalidation of another one, as with the in-process
+    backend, starts a new version within the timeout, like its entries
+    expire. The ETags of ``conditional_response`` are built from them too.
+    """
+
+    KEY_PREFIX = "response"
+
+    def __init__(self, backend: BaseCacheBackend, timeout: Optional[int] = None) -> None:
+        self.backend = backend
+        self.timeout = timeout
+
+    def get(self, key: str, encoding: Optional[str] = None) -> Optional[CachedResponse]:
+        """
+        Get the cached response stored under the key if there is one.
+
+        With an ``encoding``, its compressed variant is fetched in the same
+        round trip and returned as the only variant of the response.
+        """
+
+        if encoding is None:
+            response: Optional[CachedResponse] = self.backend.get(key)
+            return replace(response, variants=()) if response is not None else None
+
+        values: dict[str, Any] = self.backend.get_many([key, self._variant_key(key, encoding)])
+        response = values.get(key)
+        if response is None:
+            return None
+        variant: Optional[bytes] = values.get(self._variant_key(key, encoding))
+        return replace(response, variants=((encoding, variant),) if variant is not None else ())
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        """Store the rendered response under the key, its variants under keys of their own."""
+
+        self.backend.set(key, replace(response, variants=()), self.timeout)
+        for encoding, content in response.variants:
+            self.set_variant(key, encoding, content)
+
+    def set_variant(self, key: str, encoding: str, content: bytes) -> None:
+        """
+        Store a compressed variant of the response stored under the key.
+
+        Kept apart so adding a variant neither rewrites the response nor
+        restarts its timeout.
+        """
+        self.backend.set(self._variant_key(key, encoding), content, self.timeout)
+
+    def invalidate(self, *tags: str) -> None:
+        """Drop every entry built with any of the tags."""
+
+        for tag in tags:
+            self.backend.set(self._tag_key(tag), TagVersion(uuid4().hex, time()), self.timeout)
+
+    def tag_versions(self, tags: Iterable[str]) -> list[TagVersion]:
+        """Get the current version of the tags, creating missing ones."""
+
+        tag_keys: list[str] = [self._tag_key(tag) for tag in tags]
+        versions: dict[str, Any] = self.backend.get_many(tag_keys)
+
+        for tag_key in tag_keys:
+            if not isinstance(versions.get(tag_key), TagVersion):
+                # A fresh version never matches entries stored before the
+                # previous one was lost, so they can't come back to life. It
+                # is dated now, since the tag may just have been invalidated.
+                versions[tag_key] = TagVersion(uuid4().hex, time())
+                self.backend.set(tag_key, versions[tag_key], self.timeout)
+
+        return [versions[tag_key] for tag_key in tag_keys]
+
+    def make_key(self, request: Request, tags: Iterable[str]) -> ResponseCacheKey:
+        """
+        Build the key from the path, query string, auth state, media type and tag versions.
+
+        Build it once per request and use it to both read and store the
+        response: a key built after the view ran could embed versions
+        bumped by an invalidation the response predates.
+        """
+
+        sorted_tags: list[str] = sorted(tags)
+        versions: list[TagVersion] = self.tag_versions(sorted_tags)
+        user: Any = request.user
+        auth_state: str = f"user:{user.pk}" if user and user.is_authenticated else "anon"
+        query: str = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.lists()))
+        raw_key: str = "|".join(
+            (
+                request.path,
+                query,
+                auth_state,
+                getattr(request, "accepted_media_type", "") or "",
+                ",".join(sorted_tags),
+                ",".join(version.token for version in versions),
+            )
+        )
+        return ResponseCacheKey(
+            key=f"{self.KEY_PREFIX}:{sha1(raw_key.encode()).hexdigest()}",
+            versions=tuple(versions),
+        )
+
+    def _variant_key(self, key: str, encoding: str) -> str:
+        return f"{key}:{encoding}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.KEY_PREFIX}:tag:{tag}"
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide response cache configured by ``RESPONSE_CACHE``."""
+
+    global _response_cache
+    if _response_cache is None:
+        config: dict[str, Any] = settings.RESPONSE_CACHE
+        _response_cache = ResponseCache(
+            backend=build_cache_backend(config),
+            timeout=config.get("TIMEOUT"),
+        )
+    return _response_cache
@@ -0,0 +1,190 @@
+"""
+Negotiated compression of the API responses.
+
+gzip is always available; brotli and zstd are used when their modules are
+installed (``brotli``, and ``compression.zstd`` from Python 3.14 or
+``zstandard``). Responses stored in the response cache keep their
+compressed variants, see ``cache_response``, so a hot response is
+compressed once per encoding rather than once per request.
+"""
+
+import gzip
+from typing import Any, Callable, Mapping, Optional
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+from apps.abstracts.streaming import gzip_chunks
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from compression import zstd
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+
+def compress_zstd(content: bytes, level: int) -> bytes:
+    """Compress with whichever zstd module is installed."""
+
+    if zstd.__name__ == "zstandard":  # type: ignore
+        return zstd.ZstdCompressor(level=level).compress(content)  # type: ignore
+    return zstd.compress(content, level=level)  # type: ignore
+
+
+# Content-Encoding token -> (compressor, name of its level in COMPRESSION["LEVELS"]).
+CODECS: dict[str, tuple[Callable[[bytes, int], bytes], str]] = {
+    # mtime=0 keeps the output of equal bodies equal.
+    "gzip": (lambda content, level: gzip.compress(content, compresslevel=level, mtime=0), "GZIP"),
+}
+if brotli is not None:
+    CODECS["br"] = (lambda content, level: brotli.compress(content, quality=level), "BROTLI")
+if zstd is not None:
+    CODECS["zstd"] = (compress_zstd, "ZSTD")
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """Get the quality value of every coding listed in an ``Accept-Encoding`` header."""
+
+    qualities: dict[str, float] = {}
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality: float = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    return qualities
+
+
+def negotiate_encoding(request: HttpRequest, streaming: bool = False) -> Optional[str]:
+    """
+    Get the encoding to compress the response to the request with, None to send it as is.
+
+    The client's highest quality wins, ties go to the order of
+    ``COMPRESSION["ENCODINGS"]``. Streaming responses can only be gzipped.
+    """
+
+    qualities: dict[str, float] = parse_accept_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+    best: Optional[str] = None
+    best_quality: float = 0.0
+    for encoding in settings.COMPRESSION["ENCODINGS"]:
+        if encoding not in CODECS or (streaming and encoding != "gzip"):
+            continue
+        quality: float = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def is_compressible(response: HttpResponseBase) -> bool:
+    """Whether the response may be compressed, whatever its size."""
+
+    content_type: str = response.get("Content-Type", "").split(";")[0].strip().lower()
+    return (
+        settings.COMPRESSION["ENABLED"]
+        and 200 <= response.status_code < 300
+        and response.status_code != 204
+        and not response.has_header("Content-Encoding")
+        and content_type in settings.COMPRESSION["CONTENT_TYPES"]
+    )
+
+
+def compress(content: bytes, encoding: str) -> bytes:
+    """Compress a body with the level configured for the encoding."""
+
+    compressor, level_name = CODECS[encoding]
+    return compressor(content, settings.COMPRESSION["LEVELS"][level_name])
+
+
+def set_encoded_content(response: Any, encoding: str, content: bytes) -> None:
+    """Replace the body of the response with its encoded variant."""
+
+    response.content = content
+    response["Content-Length"] = str(len(content))
+    response["Content-Encoding"] = encoding
+    # The encoded body differs byte for byte, so a strong ETag becomes weak.
+    etag: Optional[str] = response.get("ETag")
+    if etag and etag.startswith('"'):
+        response["ETag"] = f"W/{etag}"
+
+
+def encode_response(
+    request: HttpRequest,
+    response: Any,
+    variants: Mapping[str, bytes],
+) -> Optional[tuple[str, bytes]]:
+    """
+    Compress a rendered response with the negotiated encoding, reusing a variant compressed earlier.
+
+    Returns the variant it had to compress, for the caller to store, and
+    None when it reused one or left the body as is.
+    """
+
+    if not is_compressible(response):
+        return None
+    patch_vary_headers(response, ("Accept-Encoding",))
+    # Spares the middleware a second attempt at bodies that didn't shrink.
+    response.encoding_negotiated = True
+
+    encoding: Optional[str] = negotiate_encoding(request)
+    content: bytes = response.content
+    if encoding is None or len(content) < settings.COMPRESSION["MIN_LENGTH"]:
+        return None
+
+    compressed: Optional[bytes] = variants.get(encoding)
+    fresh: Optional[tuple[str, bytes]] = None
+    if compressed is None:
+        compressed = compress(content, encoding)
+        fresh = (encoding, compressed)
+
+    if len(compressed) < len(content):
+        set_encoded_content(response, encoding, compressed)
+    return fresh
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress the responses the response cache didn't already encode.
+
+    Bodies below ``COMPRESSION["MIN_LENGTH"]`` and bodies that don't shrink
+    are sent as is. Streaming responses are compressed on the fly with gzip
+    only, the other codecs need the whole body.
+    """
+
+    def process_response(self, request: HttpRequest, response: HttpResponseBase) -> HttpResponseBase:
+        if getattr(response, "encoding_negotiated", False):
+            return response
+        if not response.streaming:
+            encode_response(request, response, {})
+            return response
+
+        if not is_compressible(response):
+            return response
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        encoding: Optional[str] = negotiate_encoding(request, streaming=True)
+        if encoding is not None:
+            response.streaming_content = gzip_chunks(  # type: ignore
+                response.streaming_content,  # type: ignore
+                settings.COMPRESSION["LEVELS"]["GZIP"],
+            )
+            del response["Content-Length"]
+            response["Content-Encoding"] = encoding
+        return response
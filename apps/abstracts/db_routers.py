@@ -0,0 +1,140 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any, Callable, Iterator, Optional
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.decorators import sync_and_async_middleware
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Set while the current request or task must read from the primary.
+_pinned_to_primary: ContextVar[bool] = ContextVar("pinned_to_primary", default=False)
+
+
+@contextmanager
+def pin_to_primary() -> Iterator[None]:
+    """Send every read of the block to the primary database."""
+
+    token = _pinned_to_primary.set(True)
+    try:
+        yield
+    finally:
+        _pinned_to_primary.reset(token)
+
+
+def is_pinned_to_primary() -> bool:
+    """Whether reads currently go to the primary database."""
+    return _pinned_to_primary.get()
+
+
+def replica_lag_seconds() -> int:
+    """
+    Get the seconds a replica may lag behind the primary, 0 without replicas.
+
+    The pin window of ``DATABASE_ROUTING`` is sized to cover the replication lag.
+    """
+    return settings.DATABASE_ROUTING["PIN_SECONDS"] if settings.DATABASE_REPLICAS else 0
+
+
+class WeightedRoundRobin:
+    """
+    Smooth weighted round-robin, as used by nginx upstreams.
+
+    Every pick raises each alias by its weight and lowers the picked one by
+    the total, which spreads the picks evenly instead of in bursts.
+    """
+
+    def __init__(self, weights: dict[str, int]) -> None:
+        self.weights = {alias: weight for alias, weight in weights.items() if weight > 0}
+        self.total = sum(self.weights.values())
+        self._current: dict[str, int] = dict.fromkeys(self.weights, 0)
+        self._lock = Lock()
+
+    def pick(self) -> Optional[str]:
+        """Get the next alias, None when there is none."""
+
+        if not self.weights:
+            return None
+
+        with self._lock:
+            for alias, weight in self.weights.items():
+                self._current[alias] += weight
+            picked: str = max(self._current, key=self._current.__getitem__)
+            self._current[picked] -= self.total
+            return picked
+
+
+class ReplicaRouter:
+    """
+    Database router sending the reads of the routed apps to read replicas.
+
+    Replicas and their weights come from ``DATABASE_REPLICAS`` and are picked
+    with a smooth weighted round-robin. Reads stay on the primary when the
+    request is pinned to it (see ``primary_pinning_middleware``) or inside a
+    transaction on the primary, so a request always sees its own writes.
+    Writes always go to the primary.
+    """
+
+    def __init__(self) -> None:
+        self.routed_apps: set[str] = set(settings.DATABASE_ROUTING["APPS"])
+        self.balancer: WeightedRoundRobin = WeightedRoundRobin(settings.DATABASE_REPLICAS)
+        self.aliases: set[str] = {DEFAULT_DB_ALIAS, *self.balancer.weights}
+
+    def db_for_read(self, model: type, **hints: Any) -> Optional[str]:
+        if model._meta.app_label not in self.routed_apps:
+            return None
+        if is_pinned_to_primary() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return self.balancer.pick()
+
+    def db_for_write(self, model: type, **hints: Any) -> Optional[str]:
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> Optional[bool]:
+        if obj1._state.db in self.aliases and obj2._state.db in self.aliases:
+            return True
+        return None
+
+
+@sync_and_async_middleware
+def primary_pinning_middleware(get_response: Callable) -> Callable:
+    """
+    Pin requests to the primary database for read-your-writes.
+
+    Unsafe requests are pinned and set a cookie which pins the requests of the
+    same client for ``DATABASE_ROUTING["PIN_SECONDS"]`` afterwards, covering
+    the replication lag.
+    """
+
+    cookie_name: str = settings.DATABASE_ROUTING["PIN_COOKIE"]
+    pin_seconds: int = settings.DATABASE_ROUTING["PIN_SECONDS"]
+
+    def must_pin(request: HttpRequest) -> bool:
+        return request.method not in SAFE_METHODS or cookie_name in request.COOKIES
+
+    def remember(request: HttpRequest, response: HttpResponseBase) -> HttpResponseBase:
+        if request.method not in SAFE_METHODS and pin_seconds > 0:
+            response.set_cookie(cookie_name, "1", max_age=pin_seconds, httponly=True, samesite="Lax")
+        return response
+
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request: HttpRequest) -> HttpResponseBase:
+            if not must_pin(request):
+                return await get_response(request)
+            with pin_to_primary():
+                return remember(request, await get_response(request))
+
+    else:
+
+        def middleware(request: HttpRequest) -> HttpResponseBase:  # type: ignore
+            if not must_pin(request):
+                return get_response(request)
+            with pin_to_primary():
+                return remember(request, get_response(request))
+
+    return middleware
@@ -1,16 +1,25 @@
 # Python modules
 from functools import wraps
-from typing import Any, Callable, Optional, Type, TypeVar
+from hashlib import sha1
+from time import time
+from typing import Any, Callable, Iterable, Optional, Type, TypeVar
 
 # Django modules
+from django.conf import settings
 from django.db.models import Manager, Model, QuerySet
+from django.http import HttpResponse, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 # Django REST Framework
 from rest_framework.request import Request as DRFRequest
 from rest_framework.response import Response as DRFResponse
 from rest_framework.serializers import Serializer
-from rest_framework.status import HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
+from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
 
 # Project modules
+from apps.abstracts.cache import CachedResponse, ResponseCache, ResponseCacheKey, TagVersion, get_response_cache
+from apps.abstracts.compression import encode_response, negotiate_encoding
+from apps.abstracts.db_routers import replica_lag_seconds
 
 
 T = TypeVar("T", bound=Model)
@@ -120,3 +129,162 @@ def find_queryset_object_by_query_pk(
         return wrapper
 
     return decorator
+
+
+def cache_response(
+    tags: Callable[[Any, DRFRequest, dict[str, Any]], Iterable[str]],
+) -> Callable:
+    """
+    Decorator to serve GET responses of a view action from the response cache.
+
+    Entries keep the bodies compressed for the negotiated encodings next to
+    them, so a hit is only compressed once per encoding. Misses read from the
+    replicas like any other request, but aren't stored until the latest
+    invalidation of their tags is older than the replication lag: a lagging
+    replica could still serve the rows the invalidation replaced.
+
+    - tags: Callable receiving the view, the request and the view kwargs and
+      returning the invalidation tags of the response.
+    """
+
+    def decorator(
+        func: Callable[[DRFRequest, tuple[Any, ...], dict[Any, Any]], DRFResponse],
+    ) -> Callable:
+        @wraps(func)
+        def wrapper(
+            self,
+            request: DRFRequest,
+            *args: tuple[Any, ...],
+            **kwargs: dict[Any, Any],
+        ) -> DRFResponse | HttpResponse:
+            """Return the cached response or render and store a fresh one."""
+            if request.method != "GET" or not settings.RESPONSE_CACHE["ENABLED"]:
+                return func(self, request, *args, **kwargs)  # type: ignore
+
+            cache: ResponseCache = get_response_cache()
+            # Built before the view runs, see ResponseCache.make_key.
+            cache_key: ResponseCacheKey = cache.make_key(request, tags(self, request, kwargs))
+            key: str = cache_key.key
+
+            cached: Optional[CachedResponse] = cache.get(key, negotiate_encoding(request))
+            if cached is not None:
+                hit: HttpResponse = HttpResponse(
+                    content=cached.content,
+                    status=cached.status,
+                    content_type=cached.content_type,
+                )
+                hit["X-Cache"] = "HIT"
+                variant: Optional[tuple[str, bytes]] = encode_response(request, hit, dict(cached.variants))
+                if variant is not None:
+                    cache.set_variant(key, *variant)
+                return hit
+
+            response: DRFResponse = func(self, request, *args, **kwargs)  # type: ignore
+            if response.status_code != HTTP_200_OK or not isinstance(response, DRFResponse):
+                return response
+
+            # Render here instead of in finalize_response to store the bytes.
+            response.accepted_renderer = request.accepted_renderer
+            response.accepted_media_type = request.accepted_media_type
+            response.renderer_context = self.get_renderer_context()
+            response.render()
+
+            content: bytes = response.content
+            variant = encode_response(request, response, {})
+            if time() - cache_key.invalidated_at >= replica_lag_seconds():
+                cache.set(
+                    key,
+                    CachedResponse(
+                        status=response.status_code,
+                        content=content,
+                        content_type=response["Content-Type"],
+                        variants=(variant,) if variant is not None else (),
+                    ),
+                )
+            response["X-Cache"] = "MISS"
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def conditional_response(
+    tags: Callable[[Any, DRFRequest, dict[str, Any]], Iterable[str]],
+) -> Callable:
+    """
+    Decorator to answer conditional GET requests of a view action.
+
+    The ETag and Last-Modified validators are derived from the response cache
+    versions of the tags, which every write bumps, so a matching If-None-Match
+    or If-Modified-Since is answered with 304 without querying the database.
+
+
+    - tags: Callable receiving the view, the request and the view kwargs and
+      returning the invalidation tags of the response, as for ``cache_response``.
+    """
+
+    def decorator(
+        func: Callable[[DRFRequest, tuple[Any, ...], dict[Any, Any]], DRFResponse],
+    ) -> Callable:
+        @wraps(func)
+        def wrapper(
+            self,
+            request: DRFRequest,
+            *args: tuple[Any, ...],
+            **kwargs: dict[Any, Any],
+        ) -> HttpResponseBase:
+            """Return 304 if the client copy is fresh, otherwise tag the response with validators."""
+            if request.method not in ("GET", "HEAD"):
+                return func(self, request, *args, **kwargs)  # type: ignore
+
+            versions: list[TagVersion] = get_response_cache().tag_versions(sorted(tags(self, request, kwargs)))
+            etag_parts: list[str] = [
+                request.get_full_path(),
+                getattr(request, "accepted_media_type", "") or "",
+                *(version.token for version in versions),
+            ]
+            # A version is dated when it replaces the previous one, so never
+            # before the write it follows.
+            last_modified: Optional[int] = int(max(version.set_at for version in versions)) if versions else None
+
+            etag: str = "W/" + quote_etag(sha1("|".join(etag_parts).encode()).hexdigest())
+
+            not_modified: Optional[HttpResponseBase] = get_conditional_response(
+                request,
+                etag=etag,
+                last_modified=last_modified,
+            )
+            if not_modified is not None:
+                return not_modified
+
+            response: HttpResponseBase = func(self, request, *args, **kwargs)  # type: ignore
+            # Like cache_response, a response that a lagging replica may have
+            # built from the rows a recent invalidation replaced isn't tagged.
+            invalidated_at: float = max((version.set_at for version in versions), default=0.0)
+            if response.status_code == HTTP_200_OK and time() - invalidated_at >= replica_lag_seconds():
+                response["ETag"] = etag
+                if last_modified is not None:
+                    response["Last-Modified"] = http_date(last_modified)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def query_budget(queries: int) -> Callable:
+    """
+    Decorator declaring the maximum number of queries a view action may run.
+
+    Checked by ``RequestMetricsMiddleware`` on every request of the action.
+
+
+    - queries: The number of queries allowed, authentication included.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        func.query_budget = queries  # type: ignore
+        return func
+
+    return decorator
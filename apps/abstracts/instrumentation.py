@@ -0,0 +1,212 @@
+"""Per-request query count and latency instrumentation."""
+
+import json
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Iterator, Optional
+
+from django.conf import settings
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.http import HttpRequest, HttpResponseBase
+from django.utils.deprecation import MiddlewareMixin
+
+from apps.abstracts.signals import request_measured
+
+logger = logging.getLogger("apps.request_metrics")
+
+_current_metrics: ContextVar[Optional["RequestMetrics"]] = ContextVar("request_metrics", default=None)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a view action runs more queries than its budget allows."""
+
+
+@dataclass
+class RequestMetrics:
+    """Measurements of a single request, times in milliseconds."""
+
+    method: str
+    path: str
+    view: str = ""
+    query_budget: Optional[int] = None
+    queries: int = 0
+    db_time: float = 0.0
+    view_time: float = 0.0
+    render_time: float = 0.0
+    total_time: float = 0.0
+    segments: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def over_budget(self) -> bool:
+        """Whether the request ran more queries than the budget of its view."""
+        return self.query_budget is not None and self.queries > self.query_budget
+
+    def server_timing(self) -> str:
+        """Format the measurements as a ``Server-Timing`` header value."""
+
+        entries: list[str] = [
+            f'db;dur={self.db_time:.2f};desc="{self.queries} queries"',
+            f"view;dur={self.view_time:.2f}",
+            f"render;dur={self.render_time:.2f}",
+            *(f"{name};dur={duration:.2f}" for name, duration in self.segments.items()),
+            f"total;dur={self.total_time:.2f}",
+        ]
+        return ", ".join(entries)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the JSON representation used by the log line."""
+
+        return {
+            "method": self.method,
+            "path": self.path,
+            "view": self.view,
+            "queries": self.queries,
+            "query_budget": self.query_budget,
+            "db_ms": round(self.db_time, 2),
+            "view_ms": round(self.view_time, 2),
+            "render_ms": round(self.render_time, 2),
+            "total_ms": round(self.total_time, 2),
+            **{f"{name}_ms": round(duration, 2) for name, duration in self.segments.items()},
+        }
+
+
+def get_current_metrics() -> Optional[RequestMetrics]:
+    """Get the metrics of the request being handled, if it is instrumented."""
+    return _current_metrics.get()
+
+
+@contextmanager
+def timed_segment(name: str) -> Iterator[None]:
+    """Time the block as a named segment of the current request, e.g. serialization."""
+
+    metrics: Optional[RequestMetrics] = get_current_metrics()
+    started_at: float = perf_counter()
+    try:
+        yield
+    finally:
+        if metrics is not None:
+            duration: float = (perf_counter() - started_at) * 1000
+            metrics.segments[name] = metrics.segments.get(name, 0.0) + duration
+
+
+def record_query(execute: Callable, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:
+    """Execute wrapper counting and timing the queries of the current request."""
+
+    metrics: Optional[RequestMetrics] = get_current_metrics()
+    if metrics is None:
+        return execute(sql, params, many, context)
+
+    started_at: float = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_time += (perf_counter() - started_at) * 1000
+
+
+def install_query_recorder(sender: Any, connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    """
+    Add the query recorder to a new database connection.
+
+    Installed once per connection rather than per request, so queries of every
+    alias and of the threads running the async ORM are counted too.
+    """
+
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+def resolve_view_name(view_func: Any, method: str) -> tuple[str, Optional[int]]:
+    """Get the ``ViewSet.action`` name of a view and the query budget of the action."""
+
+    view_class: Any = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+    if view_class is None:
+        return getattr(view_func, "__name__", repr(view_func)), None
+
+    actions: dict[str, str] = getattr(view_func, "actions", None) or {}
+    handler_name: str = actions.get(method.lower(), method.lower())
+    handler: Any = getattr(view_class, handler_name, None)
+    return f"{view_class.__name__}.{handler_name}", getattr(handler, "query_budget", None)
+
+
+class RequestMetricsMiddleware(MiddlewareMixin):
+    """
+    Record the query count, DB time and latency of every request.
+
+    Results are exposed in a ``Server-Timing`` header and a JSON log line on
+    the ``apps.request_metrics`` logger. When an action declared with
+    ``query_budget`` runs more queries than allowed, a warning is logged, or
+    ``QueryBudgetExceeded`` is raised when ``REQUEST_METRICS["RAISE_ON_BUDGET"]``
+    is on, which is meant for tests.
+    """
+
+    def process_request(self, request: HttpRequest) -> None:
+        if not settings.REQUEST_METRICS["ENABLED"]:
+            return
+
+        request.request_metrics = RequestMetrics(method=request.method or "", path=request.path)  # type: ignore
+        request._metrics_started_at = perf_counter()  # type: ignore
+        _current_metrics.set(request.request_metrics)  # type: ignore
+
+    def process_view(self, request: HttpRequest, view_func: Any, view_args: Any, view_kwargs: Any) -> None:
+        metrics: Optional[RequestMetrics] = getattr(request, "request_metrics", None)
+        if metrics is None:
+            return
+
+        metrics.view, metrics.query_budget = resolve_view_name(view_func, request.method or "")
+        request._metrics_view_started_at = perf_counter()  # type: ignore
+
+    def process_template_response(self, request: HttpRequest, response: Any) -> Any:
+        metrics: Optional[RequestMetrics] = getattr(request, "request_metrics", None)
+        if metrics is None:
+            return response
+
+        # DRF responses are rendered right after this hook.
+        render_started_at: float = perf_counter()
+        self._stop_view_timer(request, metrics, render_started_at)
+
+        def stop_render_timer(rendered: Any) -> None:
+            metrics.render_time = (perf_counter() - render_started_at) * 1000
+
+        response.add_post_render_callback(stop_render_timer)
+        return response
+
+    def process_response(self, request: HttpRequest, response: HttpResponseBase) -> HttpResponseBase:
+        metrics: Optional[RequestMetrics] = getattr(request, "request_metrics", None)
+        if metrics is None:
+            return response
+
+        finished_at: float = perf_counter()
+        self._stop_view_timer(request, metrics, finished_at)
+        metrics.total_time = (finished_at - request._metrics_started_at) * 1000  # type: ignore
+        _current_metrics.set(None)
+
+        if settings.REQUEST_METRICS["SERVER_TIMING"]:
+            response["Server-Timing"] = metrics.server_timing()
+        if settings.REQUEST_METRICS["LOG"]:
+            logger.info(json.dumps(metrics.as_dict()))
+
+        if metrics.over_budget:
+            message: str = (
+                f"{metrics.view} ran {metrics.queries} queries, "
+                f"over its budget of {metrics.query_budget} ({metrics.method} {metrics.path})."
+            )
+            if settings.REQUEST_METRICS["RAISE_ON_BUDGET"]:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+
+        response.request_metrics = metrics  # type: ignore
+        request_measured.send(sender=self.__class__, request=request, metrics=metrics)
+        return response
+
+    @staticmethod
+    def _stop_view_timer(request: HttpRequest, metrics: RequestMetrics, now: float) -> None:
+        """Record the view time once, when the view has returned."""
+
+        started_at: Optional[float] = getattr(request, "_metrics_view_started_at", None)
+        if started_at is not None:
+            metrics.view_time = (now - started_at) * 1000
+            request._metrics_view_started_at = None  # type: ignore
@@ -0,0 +1,135 @@
+"""Minimal asyncio HTTP/1.1 keep-alive load generator."""
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from statistics import quantiles
+from time import perf_counter
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+
+@dataclass
+class LoadResult:
+    """Latencies and outcome of a load run."""
+
+    url: str
+    connections: int
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second."""
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, percent: int) -> float:
+        """Latency percentile in milliseconds."""
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return quantiles(self.latencies, n=100)[percent - 1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the JSON representation."""
+        return {
+            "url": self.url,
+            "connections": self.connections,
+            "requests": len(self.latencies),
+            "elapsed": round(self.elapsed, 3),
+            "throughput": round(self.throughput, 1),
+            "p50_ms": round(self.percentile(50), 2),
+            "p99_ms": round(self.percentile(99), 2),
+            "statuses": dict(self.statuses),
+            "errors": dict(self.errors),
+        }
+
+
+async def read_response(reader: asyncio.StreamReader) -> tuple[int, bool]:
+    """Read one response, returning its status and whether the connection stays open."""
+
+    head: bytes = await reader.readuntil(b"\r\n\r\n")
+    lines: list[str] = head.decode("latin-1").split("\r\n")
+    status: int = int(lines[0].split(" ", 2)[1])
+    headers: dict[str, str] = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        while True:
+            size: int = int((await reader.readline()).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    elif "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    else:
+        await reader.read()
+        return status, False
+
+    return status, headers.get("connection", "").lower() != "close"
+
+
+async def run_connection(
+    url: str,
+    requests: int,
+    result: LoadResult,
+    start: asyncio.Event,
+    timeout: float,
+) -> None:
+    """Send the requests one after the other over a single keep-alive connection."""
+
+    parts = urlsplit(url)
+    host: str = parts.hostname or "127.0.0.1"
+    port: int = parts.port or 80
+    target: str = parts.path + (f"?{parts.query}" if parts.query else "")
+    request: bytes = (
+        f"GET {target} HTTP/1.1\r\nHost: {parts.netloc}\r\n"
+        "Accept: application/json\r\nConnection: keep-alive\r\n\r\n"
+    ).encode()
+
+    writer: Optional[asyncio.StreamWriter] = None
+    await start.wait()
+    try:
+        for _ in range(requests):
+            if writer is None:
+                reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+            started_at: float = perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status, keep_alive = await asyncio.wait_for(read_response(reader), timeout)
+            result.latencies.append((perf_counter() - started_at) * 1000)
+            result.statuses[status] += 1
+            if not keep_alive:
+                writer.close()
+                writer = None
+    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as error:
+        result.errors[type(error).__name__] += 1
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+async def run_load(url: str, connections: int, requests: int, timeout: float = 30.0) -> LoadResult:
+    """Spread the requests over the concurrent keep-alive connections."""
+
+    result: LoadResult = LoadResult(url=url, connections=connections)
+    start: asyncio.Event = asyncio.Event()
+    per_connection: list[int] = [
+        requests // connections + (1 if index < requests % connections else 0)
+        for index in range(connections)
+    ]
+    tasks: list[asyncio.Task] = [
+        asyncio.create_task(run_connection(url, count, result, start, timeout))
+        for count in per_connection
+        if count
+    ]
+
+    started_at: float = perf_counter()
+    start.set()
+    await asyncio.gather(*tasks)
+    result.elapsed = perf_counter() - started_at
+    return result
@@ -0,0 +1,78 @@
+from statistics import quantiles
+from time import perf_counter
+from typing import Any, Optional
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.core.signals import request_finished, request_started
+from django.db import connections
+
+
+class Command(BaseCommand):
+    """Measure the per-request cost of opening database connections."""
+
+    help = (
+        "Simulate requests running a single 'SELECT 1', with the request signals Django "
+        "uses to open and close connections. The same database is measured three ways. "
+        "With CONN_MAX_AGE=0 every request opens a new connection; this is the old prod "
+        "setup. With persistent connections (CONN_MAX_AGE > 0) a request reuses the "
+        "connection, plus a health check when CONN_HEALTH_CHECKS is on. The configured "
+        "mode uses the settings as they are, including DB_POOL. The gap between the "
+        "first row and the others is the connection setup that pooling removes. Run it "
+        "with the prod settings against a local Postgres, e.g. PROJECT_ENV_ID=prod "
+        "DB_HOST=127.0.0.1 python manage.py benchmark_db_connections."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--database", default="default", help="Database alias to measure.")
+        parser.add_argument("--requests", type=int, default=500, help="Simulated requests per mode.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        connection = connections[options["database"]]
+        settings_dict: dict[str, Any] = connection.settings_dict
+        configured: tuple[Any, Any] = (settings_dict["CONN_MAX_AGE"], settings_dict["CONN_HEALTH_CHECKS"])
+        pooled: bool = bool(settings_dict.get("OPTIONS", {}).get("pool"))
+
+        modes: list[tuple[str, Optional[tuple[int, bool]]]] = [("configured", None)]
+        if not pooled:
+            # The pool can't be combined with persistent connections.
+            modes = [
+                ("new connection per request", (0, False)),
+                ("persistent, health checks", (600, True)),
+                ("persistent, no health checks", (600, False)),
+                *modes,
+            ]
+
+        self.stdout.write(
+            f"{connection.vendor} database '{options['database']}': CONN_MAX_AGE={configured[0]} "
+            f"CONN_HEALTH_CHECKS={configured[1]} pool={pooled}"
+        )
+        try:
+            for name, overrides in modes:
+                connection.close()
+                settings_dict["CONN_MAX_AGE"], settings_dict["CONN_HEALTH_CHECKS"] = overrides or configured
+                self.report(name, connection, options["requests"])
+        finally:
+            settings_dict["CONN_MAX_AGE"], settings_dict["CONN_HEALTH_CHECKS"] = configured
+            connection.close()
+
+    def report(self, name: str, connection: Any, requests: int) -> None:
+        """Time the simulated requests and print the latency percentiles."""
+
+        timings: list[float] = []
+        connects: int = 0
+        for _ in range(requests):
+            started_at: float = perf_counter()
+            request_started.send(sender=self.__class__)
+            opened: bool = connection.connection is None
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            request_finished.send(sender=self.__class__)
+            timings.append((perf_counter() - started_at) * 1000)
+            connects += opened
+
+        percentiles: list[float] = quantiles(timings, n=100)
+        self.stdout.write(
+            f"{name:<30} p50={percentiles[49]:7.3f}ms p99={percentiles[98]:7.3f}ms "
+            f"connects={connects}/{requests}"
+        )
@@ -0,0 +1,51 @@
+import asyncio
+import json
+import resource
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.abstracts.loadtest import LoadResult, run_load
+
+
+class Command(BaseCommand):
+    """Load test running servers over concurrent keep-alive connections."""
+
+    help = (
+        "Send GET requests to each URL over concurrent HTTP/1.1 keep-alive connections "
+        "and report throughput and latency percentiles. Start the servers to compare "
+        "first, e.g. 'gunicorn settings.wsgi -w 4' and 'uvicorn settings.asgi:application "
+        "--workers 4', then pass one URL per server."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("urls", nargs="+", help="URLs to load, run one after the other.")
+        parser.add_argument("--connections", type=int, default=1000, help="Concurrent connections.")
+        parser.add_argument("--requests", type=int, default=20000, help="Requests per URL.")
+        parser.add_argument("--timeout", type=float, default=30.0, help="Seconds per request.")
+        parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # Every connection is a file descriptor.
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft < options["connections"] + 64:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (min(hard, options["connections"] + 64), hard))
+
+        results: list[LoadResult] = []
+        for url in options["urls"]:
+            results.append(
+                asyncio.run(run_load(url, options["connections"], options["requests"], options["timeout"]))
+            )
+
+        if options["json"]:
+            self.stdout.write(json.dumps([result.as_dict() for result in results], indent=2))
+            return
+
+        for result in results:
+            self.stdout.write(
+                f"{result.url}\n"
+                f"  {len(result.latencies)} requests over {result.connections} connections "
+                f"in {result.elapsed:.2f}s: {result.throughput:.1f} req/s, "
+                f"p50={result.percentile(50):.1f}ms p99={result.percentile(99):.1f}ms\n"
+                f"  statuses={dict(result.statuses)} errors={dict(result.errors)}"
+            )
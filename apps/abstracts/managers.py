@@ -0,0 +1,53 @@
+from typing import Any
+
+from django.db.models import Manager, QuerySet
+from django.utils import timezone as django_timezone
+
+from apps.abstracts.signals import post_soft_delete
+
+
+class SoftDeleteQuerySet(QuerySet):
+    """QuerySet aware of the soft delete columns of AbstractBaseModel."""
+
+    def alive(self) -> "SoftDeleteQuerySet":
+        """Keep only rows which haven't been soft deleted."""
+        return self.filter(deleted_at__isnull=True)
+
+    def deleted(self) -> "SoftDeleteQuerySet":
+        """Keep only rows which have been soft deleted."""
+        return self.filter(deleted_at__isnull=False)
+
+    def soft_delete(self) -> int:
+        """Soft delete every live row of the queryset with a single UPDATE."""
+
+        now = django_timezone.now()
+        if not post_soft_delete.has_listeners(self.model):
+            return self.alive().update(deleted_at=now, updated_at=now)
+
+        pks: list[Any] = list(self.alive().values_list("pk", flat=True))
+        if not pks:
+            return 0
+
+        updated: int = self.model.all_objects.filter(pk__in=pks).update(
+            deleted_at=now,
+            updated_at=now,
+        )
+        post_soft_delete.send(sender=self.model, pks=pks)
+        return updated
+
+
+class AliveManager(Manager.from_queryset(SoftDeleteQuerySet)):  # type: ignore
+    """
+    Manager which hides soft deleted rows.
+
+    Used as the default manager, so reverse relations and prefetches
+    filter deleted rows in SQL as well.
+    """
+
+    def get_queryset(self) -> SoftDeleteQuerySet:
+        """Get the queryset of live rows."""
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
+class AllObjectsManager(Manager.from_queryset(SoftDeleteQuerySet)):  # type: ignore
+    """Manager which returns every row, soft deleted ones included."""
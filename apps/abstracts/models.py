@@ -3,6 +3,9 @@ from typing import Any
 from django.db.models import DateTimeField, Model
 from django.utils import timezone as django_timezone
 
+from apps.abstracts.managers import AliveManager, AllObjectsManager
+from apps.abstracts.signals import post_soft_delete
+
 
 class AbstractBaseModel(Model):
     """
@@ -16,6 +19,9 @@ class AbstractBaseModel(Model):
         blank=True,
     )
 
+    objects = AliveManager()
+    all_objects = AllObjectsManager()
+
     class Meta:
         """Meta class for AbstractBaseModel."""
 
@@ -24,5 +30,9 @@ class AbstractBaseModel(Model):
     def delete(self, *args: tuple[Any, ...], **kwargs: dict[Any, Any]) -> None:  # type: ignore
         """Soft delete the object by setting deleted_at timestamp."""
 
+        if self.deleted_at is not None:
+            return
+
         self.deleted_at = django_timezone.now()
-        self.save(update_fields=["deleted_at"])
+        self.save(update_fields=["deleted_at", "updated_at"])
+        post_soft_delete.send(sender=self.__class__, pks=[self.pk])
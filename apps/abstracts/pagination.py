@@ -0,0 +1,204 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import datetime
+from json import JSONDecodeError, dumps, loads
+from typing import Any, NamedTuple, Optional
+
+from django.db.models import Model, Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class Cursor(NamedTuple):
+    """Position of a keyset page: the boundary row and the walk direction."""
+
+    position: datetime
+    pk: int
+    reverse: bool
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination over a ``(timestamp, id)`` pair.
+
+    Every page is a single indexed range scan bounded by the last row of the
+    previous page, so the cost of a page does not grow with its depth.
+    """
+
+    page_size: int = api_settings.PAGE_SIZE or 10
+    max_page_size: int = 100
+    page_size_query_param: str = "page_size"
+    cursor_query_param: str = "cursor"
+    invalid_cursor_message: str = "Invalid cursor."
+
+    # First item is the timestamp column, second one is the unique tie-breaker.
+    ordering: tuple[str, str] = ("-created_at", "-id")
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        request: Request,
+        view: Any = None,
+    ) -> list[Model]:
+        """Return the rows of the requested page."""
+
+        page_queryset: QuerySet = self.get_page_queryset(queryset, request)
+        return self.set_page(list(page_queryset))
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request) -> list[Model]:
+        """Return the rows of the requested page, fetched with the async ORM."""
+
+        page_queryset: QuerySet = self.get_page_queryset(queryset, request)
+        return self.set_page([row async for row in page_queryset])
+
+    def get_page_queryset(self, queryset: QuerySet, request: Request) -> QuerySet:
+        """Read the pagination parameters and build the query of the page, plus one row."""
+
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.cursor = self.decode_cursor(request)
+
+        ordering: tuple[str, str] = self._directed_ordering(self._is_reverse())
+        if self.cursor is not None:
+            queryset = queryset.filter(self._seek_filter(self.cursor, ordering))
+
+        return queryset.order_by(*ordering)[: self.page_size + 1]
+
+    def set_page(self, rows: list[Model]) -> list[Model]:
+        """Trim the fetched rows to the page and work out the navigation links."""
+
+        has_more: bool = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if self._is_reverse():
+            rows.reverse()
+            self.has_next = self.cursor is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data: Any) -> Response:
+        """Wrap the serialized page with its navigation links."""
+
+        return Response(
+            data={
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema: dict[str, Any]) -> dict[str, Any]:
+        """Describe the paginated response for schema generators."""
+
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request: Request) -> int:
+        """Read the page size from the query string, bounded by ``max_page_size``."""
+
+        raw_value: Optional[str] = request.query_params.get(self.page_size_query_param)
+        if raw_value is None or not raw_value.isdigit() or int(raw_value) == 0:
+            return self.page_size
+        return min(int(raw_value), self.max_page_size)
+
+    def get_next_link(self) -> Optional[str]:
+        """Build the link to the page after the current one."""
+
+        if not self.has_next or not self.page:
+            return None
+        return self._build_link(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        """Build the link to the page before the current one."""
+
+        if not self.has_previous or not self.page:
+            return None
+        return self._build_link(self.page[0], reverse=True)
+
+    def decode_cursor(self, request: Request) -> Optional[Cursor]:
+        """Decode the opaque cursor from the query string."""
+
+        encoded: Optional[str] = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            payload: dict[str, Any] = loads(urlsafe_b64decode(encoded.encode("ascii")))
+            position: Optional[datetime] = parse_datetime(payload["p"])
+            pk: int = int(payload["i"])
+            reverse: bool = bool(payload.get("r", False))
+        except (BinasciiError, JSONDecodeError, KeyError, TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if position is None:
+            raise NotFound(self.invalid_cursor_message)
+
+        return Cursor(position=position, pk=pk, reverse=reverse)
+
+    def encode_cursor(self, cursor: Cursor) -> str:
+        """Encode a cursor into an opaque URL-safe token."""
+
+        payload: dict[str, Any] = {"p": cursor.position.isoformat(), "i": cursor.pk}
+        if cursor.reverse:
+            payload["r"] = 1
+        return urlsafe_b64encode(dumps(payload, separators=(",", ":")).encode()).decode("ascii")
+
+    def _build_link(self, row: Model | dict[str, Any], reverse: bool) -> str:
+        """Build a link that resumes the walk from the given boundary row, a model or a ``values()`` dict."""
+
+        position_field: str = self.ordering[0].lstrip("-")
+        pk_field: str = self.ordering[1].lstrip("-")
+        if isinstance(row, dict):
+            cursor: Cursor = Cursor(position=row[position_field], pk=row[pk_field], reverse=reverse)
+        else:
+            cursor = Cursor(position=getattr(row, position_field), pk=row.pk, reverse=reverse)
+        url: str = remove_query_param(self.base_url, self.cursor_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(cursor))
+
+    def _is_reverse(self) -> bool:
+        """Whether the current cursor walks backwards."""
+        return self.cursor is not None and self.cursor.reverse
+
+    def _directed_ordering(self, reverse: bool) -> tuple[str, str]:
+        """Return the ordering to scan with, flipped when walking backwards."""
+
+        if not reverse:
+            return self.ordering
+        return tuple(  # type: ignore
+            field[1:] if field.startswith("-") else f"-{field}" for field in self.ordering
+        )
+
+    def _seek_filter(self, cursor: Cursor, ordering: tuple[str, str]) -> Q:
+        """
+        Build the ``(position, id)`` row comparison against the cursor.
+
+        Written as ``position <= p AND (position < p OR id < i)`` so the
+        database can use the leading column as an index range condition.
+        """
+
+        position_field, pk_field = (field.lstrip("-") for field in ordering)
+        strict, loose = ("lt", "lte") if ordering[0].startswith("-") else ("gt", "gte")
+        pk_lookup: str = "lt" if ordering[1].startswith("-") else "gt"
+
+        return Q(**{f"{position_field}__{loose}": cursor.position}) & (
+            Q(**{f"{position_field}__{strict}": cursor.position})
+            | Q(**{f"{pk_field}__{pk_lookup}": cursor.pk})
+        )
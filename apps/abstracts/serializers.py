@@ -0,0 +1,122 @@
+from typing import Any, Iterable, NamedTuple, Optional
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model
+from rest_framework.fields import Field
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.request import Request
+from rest_framework.serializers import ValidationError
+
+FIELDS_QUERY_PARAM = "fields"
+EXCLUDE_QUERY_PARAM = "exclude"
+
+
+class SparseFieldset(NamedTuple):
+    """Fields a request asked for and the model columns they are read from."""
+
+    fields: frozenset[str]
+    columns: tuple[str, ...]
+
+
+def parse_field_names(value: Optional[str]) -> list[str]:
+    """Split a comma separated list of field names."""
+    return [name.strip() for name in (value or "").split(",") if name.strip()]
+
+
+def select_field_names(request: Request, readable: Iterable[str]) -> Optional[frozenset[str]]:
+    """
+    Get the fields selected by the ``fields`` and ``exclude`` query parameters, None if neither is set.
+
+    Raises ``ValidationError`` for names the serializer can't output.
+    """
+
+    readable = list(readable)
+    included: list[str] = parse_field_names(request.query_params.get(FIELDS_QUERY_PARAM))
+    excluded: list[str] = parse_field_names(request.query_params.get(EXCLUDE_QUERY_PARAM))
+    if not included and not excluded:
+        return None
+
+    errors: dict[str, list[str]] = {}
+    for param, names in ((FIELDS_QUERY_PARAM, included), (EXCLUDE_QUERY_PARAM, excluded)):
+        if unknown := [name for name in names if name not in readable]:
+            errors[param] = [f"Unknown field: {name}." for name in unknown]
+    if errors:
+        raise ValidationError(detail=errors)
+
+    return frozenset(included or readable) - frozenset(excluded)
+
+
+def model_columns(model: type[Model], fields: Iterable[Field]) -> tuple[str, ...]:
+    """
+    Get the columns of the model the serializer fields read, as ``only()`` arguments.
+
+    Relations are reduced to their foreign key: the related rows are left to
+    ``select_related``/``prefetch_related``. Many-to-many, reverse and
+    computed fields don't map to a column and are skipped.
+    """
+
+    columns: list[str] = []
+    for field in fields:
+        if field.write_only or not field.source_attrs:
+            continue
+        try:
+            model_field: Any = model._meta.get_field(field.source_attrs[0])
+        except FieldDoesNotExist:
+            continue
+        if model_field.concrete and not model_field.many_to_many and model_field.name not in columns:
+            columns.append(model_field.name)
+    return tuple(columns)
+
+
+class SparseFieldsetMixin:
+    """
+    Model serializer whose output can be narrowed with ``?fields=`` and ``?exclude=``.
+
+    Both take comma separated field names. They only apply to safe requests
+    with the request in the context, so writes still validate every field,
+    and to the top-level serializer.
+    Use ``sparse_fieldset`` before querying to load only the columns needed.
+    """
+
+    def get_fields(self) -> dict[str, Field]:
+        fields: dict[str, Field] = super().get_fields()  # type: ignore
+        request: Optional[Request] = self.context.get("request")  # type: ignore
+        if request is None or request.method not in SAFE_METHODS:
+            return fields
+        # The query parameters address the top-level objects only, not nested serializers.
+        if self.root is not self and self.root is not self.parent:  # type: ignore
+            return fields
+
+        selected: Optional[frozenset[str]] = select_field_names(
+            request,
+            (name for name, field in fields.items() if not field.write_only),
+        )
+        if selected is None:
+            return fields
+        return {name: field for name, field in fields.items() if field.write_only or name in selected}
+
+    @classmethod
+    def sparse_fieldset(
+        cls,
+        request: Request,
+        required: Iterable[str] = (),
+    ) -> Optional[SparseFieldset]:
+        """
+        Get the fields the request selects and the columns to load for them, None if it selects none.
+
+        ``required`` columns are loaded anyway, e.g. the ones pagination reads.
+        """
+
+        if not any(
+            parse_field_names(request.query_params.get(param))
+            for param in (FIELDS_QUERY_PARAM, EXCLUDE_QUERY_PARAM)
+        ):
+            return None
+
+        serializer: Any = cls(context={"request": request})
+        fields: dict[str, Field] = dict(serializer.fields)
+        columns: tuple[str, ...] = model_columns(serializer.Meta.model, fields.values())
+        return SparseFieldset(
+            fields=frozenset(name for name, field in fields.items() if not field.write_only),
+            columns=(*columns, *(column for column in required if column not in columns)),
+        )
@@ -0,0 +1,14 @@
+from django.dispatch import Signal
+
+# Sent after rows of a soft deletable model have been marked deleted.
+# Arguments: sender (the model class), pks (list of primary keys).
+post_soft_delete = Signal()
+
+# Sent after rows have been inserted or updated with bulk_create, which
+# doesn't send post_save. Arguments: sender (the model class), pks (list of
+# primary keys).
+post_bulk_upsert = Signal()
+
+# Sent by RequestMetricsMiddleware once a request has been measured.
+# Arguments: sender (the middleware class), request, metrics (RequestMetrics).
+request_measured = Signal()
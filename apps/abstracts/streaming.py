@@ -0,0 +1,73 @@
+import csv
+import zlib
+from io import StringIO
+from itertools import islice
+from json import dumps
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+from django.db.models import Model, QuerySet
+from rest_framework.serializers import Serializer
+from rest_framework.utils.encoders import JSONEncoder
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+CSV_CONTENT_TYPE = "text/csv"
+GZIP_CONTENT_TYPE = "application/gzip"
+
+
+def iterate_in_chunks(queryset: QuerySet, chunk_size: int) -> Iterator[list[Model]]:
+    """Walk the queryset with a server-side cursor and yield lists of rows."""
+
+    rows: Iterator[Model] = queryset.iterator(chunk_size=chunk_size)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def iterate_values_in_chunks(
+    queryset: QuerySet,
+    fields: Sequence[str],
+    chunk_size: int,
+) -> Iterator[list[tuple[Any, ...]]]:
+    """Walk the queryset with a server-side cursor and yield lists of value tuples."""
+
+    rows: Iterator[tuple[Any, ...]] = queryset.values_list(*fields).iterator(chunk_size=chunk_size)
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def ndjson_lines(items: Iterable[Any]) -> bytes:
+    """Encode the items as newline delimited JSON."""
+
+    return b"".join(
+        dumps(item, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+        for item in items
+    )
+
+
+def stream_ndjson(
+    queryset: QuerySet,
+    serializer_class: type[Serializer],
+    chunk_size: int = 500,
+    context: Optional[dict[str, Any]] = None,
+) -> Iterator[bytes]:
+    """Serialize the queryset chunk by chunk into NDJSON, keeping memory flat."""
+
+    for chunk in iterate_in_chunks(queryset, chunk_size):
+        yield ndjson_lines(serializer_class(chunk, many=True, context=context or {}).data)
+
+
+def csv_lines(rows: Iterable[Sequence[Any]]) -> bytes:
+    """Encode the rows as CSV lines."""
+
+    buffer: StringIO = StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Compress a stream of chunks into a single gzip member, chunk by chunk."""
+
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        if compressed := compressor.compress(chunk):
+            yield compressed
+    yield compressor.flush()
@@ -0,0 +1,65 @@
+"""Test helpers built on the request metrics of ``RequestMetricsMiddleware``."""
+
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from django.conf import settings
+from django.http import HttpResponseBase
+from django.test import override_settings
+
+from apps.abstracts.instrumentation import RequestMetrics
+from apps.abstracts.signals import request_measured
+
+
+def enforce_query_budgets() -> override_settings:
+    """
+    Make requests exceeding the query budget of their action fail.
+
+    Usable as a class or method decorator of test cases; the test client then
+    re-raises ``QueryBudgetExceeded``.
+    """
+
+    return override_settings(
+        REQUEST_METRICS={**settings.REQUEST_METRICS, "ENABLED": True, "RAISE_ON_BUDGET": True},
+    )
+
+
+@contextmanager
+def capture_request_metrics() -> Iterator[list[RequestMetrics]]:
+    """Collect the metrics of every request measured inside the block."""
+
+    captured: list[RequestMetrics] = []
+
+    def collect(sender: Any, metrics: RequestMetrics, **kwargs: Any) -> None:
+        captured.append(metrics)
+
+    request_measured.connect(collect)
+    try:
+        yield captured
+    finally:
+        request_measured.disconnect(collect)
+
+
+class QueryBudgetTestMixin:
+    """``TestCase`` mixin with assertions on the request metrics of responses."""
+
+    def assertWithinQueryBudget(self, response: HttpResponseBase, queries: Optional[int] = None) -> None:
+        """
+        Assert the request ran no more queries than allowed.
+
+        Without ``queries``, the budget declared on the view action is used.
+        """
+
+        metrics: Optional[RequestMetrics] = getattr(response, "request_metrics", None)
+        if metrics is None:
+            self.fail("The response has no request metrics, is RequestMetricsMiddleware enabled?")  # type: ignore
+
+        budget: Optional[int] = metrics.query_budget if queries is None else queries
+        if budget is None:
+            self.fail(f"{metrics.view} declares no query budget.")  # type: ignore
+
+        if metrics.queries > budget:
+            self.fail(  # type: ignore
+                f"{metrics.view} ran {metrics.queries} queries, over its budget of {budget} "
+                f"({metrics.method} {metrics.path})."
+            )
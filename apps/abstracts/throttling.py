@@ -0,0 +1,137 @@
+from math import ceil
+from time import time
+from typing import Any, Optional
+
+from django.conf import settings
+from rest_framework.request import Request
+from rest_framework.throttling import BaseThrottle
+
+from apps.abstracts.cache import BaseCacheBackend, build_cache_backend
+
+RATE_PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# Request attribute holding the hits counted for it by the throttles of its view.
+REQUEST_HITS_ATTR = "_sliding_window_hits"
+
+_counter_store: Optional[BaseCacheBackend] = None
+
+
+def get_counter_store() -> BaseCacheBackend:
+    """Get the process-wide store of the throttle counters configured by ``THROTTLING``."""
+
+    global _counter_store
+    if _counter_store is None:
+        _counter_store = build_cache_backend(settings.THROTTLING)
+    return _counter_store
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """Parse a ``<requests>/<period>`` rate such as ``5/min`` into requests and seconds."""
+
+    requests, period = rate.split("/")
+    return int(requests), RATE_PERIODS[period[0]]
+
+
+class SlidingWindowCounter:
+    """
+    Approximate sliding window counter over fixed window buckets.
+
+    The count of the last ``window`` seconds is estimated as the count of the
+    current bucket plus the count of the previous one weighted by how much of
+    it still overlaps the window. Two counters per key, whatever the limit.
+    """
+
+    def __init__(self, store: BaseCacheBackend, limit: int, window: int) -> None:
+        self.store = store
+        self.limit = limit
+        self.window = window
+
+    def hit(self, key: str, now: Optional[float] = None) -> Optional[float]:
+        """
+        Count a hit of the key unless it is over the limit.
+
+        Returns None when the hit is allowed, otherwise the seconds to wait.
+        """
+
+        now = time() if now is None else now
+        bucket: int = int(now // self.window)
+        current_key: str = self.bucket_key(key, now)
+        previous_key: str = f"{key}:{bucket - 1}"
+
+        # Counted first, so concurrent hits each see a distinct count and
+        # can't all pass the check on the same value.
+        current: int = self.store.incr(current_key, timeout=self.window * 2) - 1
+        previous: int = self.store.get(previous_key) or 0
+        overlap: float = 1 - (now % self.window) / self.window
+
+        if current + previous * overlap >= self.limit:
+            # Rejected hits don't count.
+            self.store.incr(current_key, delta=-1, timeout=self.window * 2)
+            return self.wait(current, previous, now)
+        return None
+
+    def undo(self, key: str, now: float) -> None:
+        """Take back a hit of the key allowed at ``now``."""
+        self.store.incr(self.bucket_key(key, now), delta=-1, timeout=self.window * 2)
+
+    def bucket_key(self, key: str, now: float) -> str:
+        """Get the key of the bucket counting the hits of the key at ``now``."""
+        return f"{key}:{int(now // self.window)}"
+
+    def wait(self, current: int, previous: int, now: float) -> float:
+        """Get the seconds until the estimated count drops below the limit."""
+
+        if current >= self.limit or not previous:
+            return self.window - now % self.window
+        # The previous bucket weight decreases linearly until the next bucket.
+        overlap_needed: float = (self.limit - current) / previous
+        return max(0.0, (1 - overlap_needed) * self.window - now % self.window)
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    """
+    Throttle limiting each identity of the request with a sliding window counter.
+
+    The rate of the ``scope`` is read from ``THROTTLING["RATES"]``. Subclasses
+    choose what to count by overriding ``get_idents``; the request is throttled
+    when any of its identities is over the limit. A throttled request counts
+    for none of them, including those of the other sliding window throttles
+    of the view.
+    """
+
+    scope: str = ""
+
+    def __init__(self) -> None:
+        limit, window = parse_rate(settings.THROTTLING["RATES"][self.scope])
+        self.counter = SlidingWindowCounter(get_counter_store(), limit, window)
+        self.retry_after: Optional[float] = None
+
+    def get_idents(self, request: Request, view: Any) -> list[str]:
+        """Get the identities counted for the request."""
+        raise NotImplementedError
+
+    def allow_request(self, request: Request, view: Any) -> bool:
+        if not settings.THROTTLING["ENABLED"]:
+            return True
+
+        # DRF asks every throttle of the view, even after one rejected it.
+        hits: Optional[list[tuple[SlidingWindowCounter, str, float]]] = getattr(request, REQUEST_HITS_ATTR, [])
+        if hits is None:
+            return True
+
+        for ident in self.get_idents(request, view):
+            key: str = f"throttle:{self.scope}:{ident}"
+            now: float = time()
+            self.retry_after = self.counter.hit(key, now)
+            if self.retry_after is not None:
+                for counter, hit_key, hit_at in hits:
+                    counter.undo(hit_key, hit_at)
+                setattr(request, REQUEST_HITS_ATTR, None)
+                return False
+            hits.append((self.counter, key, now))
+
+        setattr(request, REQUEST_HITS_ATTR, hits)
+        return True
+
+    def wait(self) -> Optional[float]:
+        return ceil(self.retry_after) if self.retry_after is not None else None
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class BlogsConfig(AppConfig):
     name = "apps.blogs"
+
+    def ready(self) -> None:
+        """Connect the signal receivers."""
+        from apps.blogs import signals  # noqa: F401
@@ -0,0 +1,182 @@
+"""Bulk writes of the taxonomy tables (tags and categories)."""
+
+from dataclasses import dataclass, field, fields
+from typing import Any, Iterable, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from rest_framework.serializers import Serializer
+
+from apps.abstracts.models import AbstractBaseModel
+from apps.abstracts.signals import post_bulk_upsert
+from apps.blogs.serializers.taxonomy import TaxonomyBulkItemSerializer
+
+MAX_BULK_ITEMS = 1000
+
+
+@dataclass
+class BulkItemResult:
+    """Outcome of a single item of a bulk request."""
+
+    index: int
+    slug: Optional[str]
+    status: str
+    id: Optional[int] = None
+    errors: dict[str, list[str]] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Get the JSON representation, without empty keys."""
+        return {
+            item_field.name: getattr(self, item_field.name)
+            for item_field in fields(self)
+            if getattr(self, item_field.name) not in (None, {})
+        }
+
+
+def bulk_upsert_taxonomy(
+    model: type[AbstractBaseModel],
+    items: list[Any],
+    atomic: bool,
+) -> tuple[list[BulkItemResult], bool]:
+    """
+    Create or update taxonomy rows by slug.
+
+    Items are validated in one pass: field validation, duplicates inside the
+    payload, then a single ``IN`` lookup for the slugs and names already
+    stored. Valid items are written with one upserting ``bulk_create`` inside
+    a transaction, which also revives soft deleted rows. Names stored under
+    another slug by a concurrent request after the lookup are reported the
+    same way once the write fails on them.
+
+    In atomic mode nothing is written if any item is invalid.
+    Returns the per-item results and whether anything was written.
+    """
+
+    results: list[BulkItemResult] = []
+    valid: dict[int, dict[str, Any]] = {}
+    seen_slugs: set[str] = set()
+    seen_names: set[str] = set()
+    for index, item in enumerate(items):
+        slug: Optional[str] = item.get("slug") if isinstance(item, dict) else None
+        serializer: Serializer = TaxonomyBulkItemSerializer(data=item, context={"model": model})
+        if not serializer.is_valid():
+            results.append(
+                BulkItemResult(index=index, slug=slug, status="error", errors=dict(serializer.errors))
+            )
+            continue
+
+        data: dict[str, Any] = serializer.validated_data  # type: ignore
+        if data["slug"] in seen_slugs or data["name"] in seen_names:
+            results.append(
+                BulkItemResult(
+                    index=index,
+                    slug=slug,
+                    status="error",
+                    errors={"non_field_errors": ["Duplicated name or slug in the request."]},
+                )
+            )
+            continue
+
+        seen_slugs.add(data["slug"])
+        seen_names.add(data["name"])
+        valid[index] = data
+        results.append(BulkItemResult(index=index, slug=data["slug"], status="pending"))
+
+    stored_slugs: set[str] = reject_name_conflicts(model, valid, results)
+    while True:
+        if not valid or (atomic and len(valid) != len(items)):
+            for result in results:
+                if result.status == "pending":
+                    result.status = "skipped"
+            return results, False
+
+        try:
+            saved_ids: dict[str, int] = write_taxonomy(model, list(valid.values()))
+            break
+        except IntegrityError:
+            # Another request stored one of the names under another slug
+            # since the check: check again against the committed rows.
+            remaining: int = len(valid)
+            stored_slugs = reject_name_conflicts(model, valid, results)
+            if len(valid) == remaining:
+                raise
+
+    for index, data in valid.items():
+        results[index].status = "updated" if data["slug"] in stored_slugs else "created"
+        results[index].id = saved_ids[data["slug"]]
+    return results, True
+
+
+def reject_name_conflicts(
+    model: type[AbstractBaseModel],
+    valid: dict[int, dict[str, Any]],
+    results: list[BulkItemResult],
+) -> set[str]:
+    """
+    Turn the valid items whose name is stored under another slug into errors.
+
+    Looks the slugs and names up with a single ``IN`` query, drops the
+    conflicting items from ``valid`` and returns the slugs already stored.
+    """
+
+    stored: list[dict[str, Any]] = list(
+        model.all_objects.filter(
+            Q(slug__in=[data["slug"] for data in valid.values()])
+            | Q(name__in=[data["name"] for data in valid.values()])
+        ).values("id", "slug", "name")
+    )
+    slug_of_name: dict[str, str] = {row["name"]: row["slug"] for row in stored}
+
+    for index, data in list(valid.items()):
+        owner: Optional[str] = slug_of_name.get(data["name"])
+        if owner is not None and owner != data["slug"]:
+            results[index].status = "error"
+            results[index].errors = {"name": [f"Name is already used by '{owner}'."]}
+            del valid[index]
+    return {row["slug"] for row in stored}
+
+
+def write_taxonomy(model: type[AbstractBaseModel], items: list[dict[str, Any]]) -> dict[str, int]:
+    """Upsert the rows by slug in a transaction, reviving soft deleted ones, and get their ids by slug."""
+
+    objects: list[AbstractBaseModel] = [
+        model(name=data["name"], slug=data["slug"], deleted_at=None) for data in items
+    ]
+    with transaction.atomic():
+        model.all_objects.bulk_create(
+            objects,
+            batch_size=MAX_BULK_ITEMS,
+            update_conflicts=True,
+            unique_fields=["slug"],
+            update_fields=["name", "deleted_at", "updated_at"],
+        )
+        saved_ids: dict[str, int] = dict(
+            model.all_objects.filter(slug__in=[obj.slug for obj in objects]).values_list(  # type: ignore
+                "slug", "id"
+            )
+        )
+        transaction.on_commit(
+            lambda: post_bulk_upsert.send(sender=model, pks=list(saved_ids.values()))
+        )
+    return saved_ids
+
+
+def bulk_soft_delete_taxonomy(
+    model: type[AbstractBaseModel],
+    slugs: Iterable[str],
+) -> list[BulkItemResult]:
+    """Soft delete taxonomy rows by slug with a single UPDATE."""
+
+    slugs = list(slugs)
+    live: dict[str, int] = dict(model.objects.filter(slug__in=slugs).values_list("slug", "id"))
+    model.objects.filter(pk__in=live.values()).soft_delete()  # type: ignore
+
+    return [
+        BulkItemResult(
+            index=index,
+            slug=slug,
+            status="deleted" if slug in live else "not_found",
+            id=live.get(slug),
+        )
+        for index, slug in enumerate(slugs)
+    ]
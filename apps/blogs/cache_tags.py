@@ -0,0 +1,27 @@
+"""Invalidation tags of the cached blog responses."""
+
+POST_LIST = "posts"
+TAG_LIST = "tags"
+CATEGORY_LIST = "categories"
+# Bumped on any tag or category write, since posts embed both.
+TAXONOMY = "taxonomy"
+
+
+def post_detail(slug: str) -> str:
+    """Tag of a single post response."""
+    return f"post:{slug}"
+
+
+def post_comments(slug: str) -> str:
+    """Tag of the comment thread of a post."""
+    return f"post:{slug}:comments"
+
+
+def tag_detail(pk: int | str) -> str:
+    """Tag of a single tag response."""
+    return f"tag:{pk}"
+
+
+def category_detail(pk: int | str) -> str:
+    """Tag of a single category response."""
+    return f"category:{pk}"
@@ -0,0 +1,126 @@
+"""Bulk factories of blog content for benchmarks and load fixtures."""
+
+from itertools import cycle
+from typing import Any, Sequence
+
+from django.db import transaction
+
+from apps.abstracts.signals import post_bulk_upsert
+from apps.blogs.models import Category, Comments, Post, Tag
+from apps.blogs.stats import rebuild_post_stats
+from apps.users.models import User
+
+PostTag = Post.tags.through
+
+
+def create_tags(count: int, prefix: str, batch_size: int = 1000) -> list[Tag]:
+    """Insert ``count`` tags with ``<prefix>-tag-<index>`` slugs."""
+
+    tags: list[Tag] = Tag.objects.bulk_create(
+        [Tag(name=f"{prefix} tag {index}", slug=f"{prefix}-tag-{index}") for index in range(count)],
+        batch_size=batch_size,
+    )
+    post_bulk_upsert.send(sender=Tag, pks=[tag.pk for tag in tags])
+    return tags
+
+
+def create_categories(count: int, prefix: str, batch_size: int = 1000) -> list[Category]:
+    """Insert ``count`` categories with ``<prefix>-category-<index>`` slugs."""
+
+    categories: list[Category] = Category.objects.bulk_create(
+        [
+            Category(name=f"{prefix} category {index}", slug=f"{prefix}-category-{index}")
+            for index in range(count)
+        ],
+        batch_size=batch_size,
+    )
+    post_bulk_upsert.send(sender=Category, pks=[category.pk for category in categories])
+    return categories
+
+
+def create_posts(
+    count: int,
+    prefix: str,
+    authors: Sequence[User],
+    categories: Sequence[Category],
+    tags: Sequence[Tag],
+    tags_per_post: int = 3,
+    batch_size: int = 1000,
+) -> list[Post]:
+    """
+    Insert ``count`` published posts with ``<prefix>-post-<index>`` slugs.
+
+    Authors and categories are assigned round-robin and every post gets
+    ``tags_per_post`` consecutive tags, so the data is the same on every run.
+    """
+
+    authors_cycle = cycle(authors)
+    categories_cycle = cycle(categories or [None])
+    with transaction.atomic():
+        posts: list[Post] = Post.objects.bulk_create(
+            [
+                Post(
+                    author=next(authors_cycle),
+                    category=next(categories_cycle),
+                    title=f"{prefix} post {index}",
+                    slug=f"{prefix}-post-{index}",
+                    content=f"Synthetic content of the benchmark post number {index}. " * 10,
+                    status=Post.StatusChoices.PUBLISHED,
+                )
+                for index in range(count)
+            ],
+            batch_size=batch_size,
+        )
+
+        if tags:
+            PostTag.objects.bulk_create(
+                [
+                    PostTag(post_id=post.pk, tag_id=tags[(index + offset) % len(tags)].pk)
+                    for index, post in enumerate(posts)
+                    for offset in range(min(tags_per_post, len(tags)))
+                ],
+                batch_size=batch_size,
+            )
+        post_bulk_upsert.send(sender=Post, pks=[post.pk for post in posts])
+    return posts
+
+
+def create_comments(
+    posts: Sequence[Post],
+    authors: Sequence[User],
+    per_post: int,
+    batch_size: int = 1000,
+) -> int:
+    """
+    Insert ``per_post`` comments on every post, returning the number inserted.
+
+    ``bulk_create`` skips the signals maintaining the comment counters, so the
+    counters of the posts are rebuilt afterwards.
+    """
+
+    authors_cycle = cycle(authors)
+    comments: list[Comments] = [
+        Comments(post=post, author=next(authors_cycle), body=f"Benchmark comment {index}.")
+        for post in posts
+        for index in range(per_post)
+    ]
+    with transaction.atomic():
+        Comments.objects.bulk_create(comments, batch_size=batch_size)
+        rebuild_post_stats(Post.all_objects.filter(pk__in=[post.pk for post in posts]), batch_size=batch_size)
+    return len(comments)
+
+
+def delete_seeded(prefix: str) -> dict[str, Any]:
+    """Hard delete the rows created by the factories with the prefix."""
+
+    deleted: dict[str, Any] = {}
+    for model, lookup in (
+        (Post, {"slug__startswith": f"{prefix}-post-"}),
+        (Tag, {"slug__startswith": f"{prefix}-tag-"}),
+        (Category, {"slug__startswith": f"{prefix}-category-"}),
+        (User, {"email__startswith": f"{prefix}-"}),
+    ):
+        _, per_model = model.all_objects.filter(**lookup).delete()  # type: ignore
+        for label, count in per_model.items():
+            deleted[label] = deleted.get(label, 0) + count
+    return deleted
@@ -0,0 +1,64 @@
+"""Translation of the post list query parameters into indexed SQL."""
+
+from typing import Any
+
+from django.db.models import Count, Exists, OuterRef, QuerySet
+
+from apps.blogs.models import Post
+
+PostTag = Post.tags.through
+
+
+def filter_posts(queryset: QuerySet[Post], params: dict[str, Any]) -> QuerySet[Post]:
+    """Apply the validated post list filters to the queryset."""
+
+    if status := params.get("status"):
+        queryset = queryset.filter(status=status)
+
+    if author := params.get("author"):
+        queryset = queryset.filter(author_id=author)
+
+    if category := params.get("category"):
+        queryset = queryset.filter(category__slug=category, category__deleted_at__isnull=True)
+
+    if created_after := params.get("created_after"):
+        queryset = queryset.filter(created_at__gte=created_after)
+
+    if created_before := params.get("created_before"):
+        queryset = queryset.filter(created_at__lt=created_before)
+
+    if tags := params.get("tag"):
+        if params.get("tag_match") == "all":
+            queryset = queryset.filter(pk__in=posts_with_all_tags(set(tags)))
+        else:
+            queryset = queryset.filter(Exists(posts_with_any_tag(set(tags))))
+
+    return queryset
+
+
+def posts_with_any_tag(slugs: set[str]) -> QuerySet:
+    """Correlated EXISTS over the post-tag rows of the outer post."""
+
+    return PostTag.objects.filter(
+        post_id=OuterRef("pk"),
+        tag__slug__in=slugs,
+        tag__deleted_at__isnull=True,
+    )
+
+
+def posts_with_all_tags(slugs: set[str]) -> QuerySet:
+    """
+    Ids of the posts tagged with every slug.
+
+    A single ``GROUP BY post_id HAVING COUNT(tag_id) = n`` over the post-tag
+    rows instead of one join per tag.
+    """
+
+    return (
+        PostTag.objects.filter(tag__slug__in=slugs, tag__deleted_at__isnull=True)
+        .order_by()
+        .values("post_id")
+        .annotate(matched=Count("tag_id", distinct=True))
+        .filter(matched=len(slugs))
+        .values("post_id")
+    )
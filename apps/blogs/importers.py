@@ -0,0 +1,305 @@
+"""Streaming bulk import of posts with tag and category resolution."""
+
+import csv
+import json
+import re
+from dataclasses import dataclass, field
+from itertools import islice
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from django.db import transaction
+from django.utils.text import slugify
+
+from apps.abstracts.models import AbstractBaseModel
+from apps.abstracts.signals import post_bulk_upsert
+from apps.blogs.models import Category, Post, Tag
+from apps.users.models import User
+
+PostTag = Post.tags.through
+
+SLUG_RE = re.compile(r"^[-a-zA-Z0-9_]+$")
+CSV_LIST_SEPARATOR = "|"
+
+
+def iter_text_lines(stream: Iterable[bytes] | Iterable[str]) -> Iterator[str]:
+    """Iterate over the lines of a text or binary stream as text."""
+
+    for line in stream:
+        yield line.decode("utf-8") if isinstance(line, bytes) else line
+
+
+def read_jsonl(stream: Iterable[bytes] | Iterable[str]) -> Iterator[dict[str, Any]]:
+    """Read one JSON object per line, skipping blank lines."""
+
+    for line in iter_text_lines(stream):
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def read_csv(stream: Iterable[bytes] | Iterable[str]) -> Iterator[dict[str, Any]]:
+    """Read records from a CSV with a header row, ``tags`` being ``|`` separated."""
+
+    for row in csv.DictReader(iter_text_lines(stream)):
+        row["tags"] = [tag for tag in (row.get("tags") or "").split(CSV_LIST_SEPARATOR) if tag]
+        yield row
+
+
+READERS: dict[str, Callable[[Any], Iterator[dict[str, Any]]]] = {
+    "jsonl": read_jsonl,
+    "csv": read_csv,
+}
+
+CONTENT_TYPE_READERS: dict[str, Callable[[Any], Iterator[dict[str, Any]]]] = {
+    "application/x-ndjson": read_jsonl,
+    "application/jsonl": read_jsonl,
+    "text/csv": read_csv,
+}
+
+
+@dataclass
+class ImportReport:
+    """Running totals of an import."""
+
+    offset: int = 0
+    processed: int = 0
+    created: int = 0
+    skipped: int = 0
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Processed records per second."""
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self, max_errors: int = 100) -> dict[str, Any]:
+        """Get the JSON representation, with a bounded list of errors."""
+        return {
+            "offset": self.offset,
+            "processed": self.processed,
+            "created": self.created,
+            "skipped": self.skipped,
+            "errors": self.errors[:max_errors],
+            "elapsed": round(self.elapsed, 3),
+            "rate": round(self.rate, 1),
+        }
+
+
+class PostImporter:
+    """
+    Import posts from an iterable of records in fixed-size batches.
+
+    A record holds ``title``, ``slug``, ``content`` and optionally ``status``,
+    ``author`` (email), ``category`` (slug) and ``tags`` (list of slugs).
+    Tags, categories and authors are resolved through in-memory slug/email to
+    id maps filled with one ``IN`` query per batch; missing tags and categories
+    are created. Each batch is written in its own transaction with
+    ``bulk_create`` for posts and post-tag rows, so after a failure the import
+    can resume from the offset of the last committed batch. Posts whose slug
+    already exists are skipped. Unless ``allow_other_authors`` is set, the
+    ``author`` of the records is ignored and every post is authored by the
+    default author.
+    """
+
+    def __init__(
+        self,
+        default_author: User,
+        batch_size: int = 1000,
+        allow_other_authors: bool = True,
+    ) -> None:
+        self.default_author = default_author
+        self.batch_size = batch_size
+        self.allow_other_authors = allow_other_authors
+        self.tag_ids: dict[str, int] = {}
+        self.category_ids: dict[str, int] = {}
+        self.author_ids: dict[str, int] = {default_author.email: default_author.pk}
+
+    def run(
+        self,
+        records: Iterable[dict[str, Any]],
+        report: ImportReport,
+        on_batch: Optional[Callable[[ImportReport], None]] = None,
+    ) -> ImportReport:
+        """
+        Import the records after ``report.offset``, reporting after every committed batch.
+
+        The report is updated in place, so when reading the input fails its
+        offset is still the checkpoint to resume from.
+        """
+
+        started_at: float = perf_counter() - report.elapsed
+        records_iterator: Iterator[dict[str, Any]] = islice(records, report.offset, None)
+
+        while batch := list(islice(records_iterator, self.batch_size)):
+            self.import_batch(batch, report)
+            report.offset += len(batch)
+            report.processed += len(batch)
+            report.elapsed = perf_counter() - started_at
+            if on_batch is not None:
+                on_batch(report)
+        return report
+
+    def import_batch(self, batch: list[dict[str, Any]], report: ImportReport) -> None:
+        """Validate, resolve and write one batch of records."""
+
+        records: list[dict[str, Any]] = []
+        for position, record in enumerate(batch, start=report.offset):
+            error: Optional[str] = self.validate(record)
+            if error is not None:
+                slug: Any = record.get("slug") if isinstance(record, dict) else None
+                report.errors.append({"offset": position, "slug": slug, "error": error})
+            else:
+                records.append({**record, "_offset": position})
+        if not records:
+            return
+
+        with transaction.atomic():
+            existing: set[str] = set(
+                Post.all_objects.filter(slug__in=[record["slug"] for record in records]).values_list(
+                    "slug", flat=True
+                )
+            )
+            new_records: list[dict[str, Any]] = []
+            for record in records:
+                if record["slug"] in existing:
+                    report.skipped += 1
+                else:
+                    existing.add(record["slug"])
+                    new_records.append(record)
+
+            self.resolve_taxonomy(new_records)
+            self.resolve_authors(new_records, report)
+            new_records = [record for record in new_records if record.get("_author_id")]
+
+            posts: list[Post] = Post.all_objects.bulk_create(
+                [
+                    Post(
+                        author_id=record["_author_id"],
+                        title=record["title"],
+                        slug=record["slug"],
+                        content=record["content"],
+                        status=record.get("status") or Post.StatusChoices.DRAFT,
+                        category_id=self.category_ids.get(record.get("category") or ""),
+                    )
+                    for record in new_records
+                ],
+                batch_size=self.batch_size,
+            )
+            post_ids: dict[str, int] = {post.slug: post.pk for post in posts}
+            if any(pk is None for pk in post_ids.values()):
+                # Backends that can't return ids from a bulk insert.
+                post_ids = dict(
+                    Post.all_objects.filter(slug__in=post_ids).values_list("slug", "id")
+                )
+
+            PostTag.objects.bulk_create(
+                [
+                    PostTag(post_id=post_ids[record["slug"]], tag_id=self.tag_ids[tag])
+                    for record in new_records
+                    for tag in set(record.get("tags") or [])
+                    if tag in self.tag_ids
+                ],
+                batch_size=self.batch_size,
+                ignore_conflicts=True,
+            )
+            report.created += len(posts)
+
+            created_ids: list[int] = list(post_ids.values())
+            transaction.on_commit(lambda: post_bulk_upsert.send(sender=Post, pks=created_ids))
+
+    def validate(self, record: Any) -> Optional[str]:
+        """Get the reason the record can't be imported, if any."""
+
+        if not isinstance(record, dict):
+            return "Record must be an object."
+        for key in ("title", "slug", "content"):
+            if not isinstance(record.get(key), str) or not record[key]:
+                return f"'{key}' is required."
+        if len(record["title"]) > Post.TITLE_MAX_LENGTH:
+            return f"'title' is longer than {Post.TITLE_MAX_LENGTH} characters."
+        if len(record["slug"]) > 50 or not SLUG_RE.match(record["slug"]):
+            return "'slug' is not a valid slug."
+        if record.get("status") and record["status"] not in Post.StatusChoices.values:
+            return f"'status' must be one of {Post.StatusChoices.values}."
+
+        tags: Any = record.get("tags") or []
+        if not isinstance(tags, list) or not all(isinstance(tag, str) and SLUG_RE.match(tag) for tag in tags):
+            return "'tags' must be a list of slugs."
+        category: Any = record.get("category")
+        if category and (not isinstance(category, str) or not SLUG_RE.match(category)):
+            return "'category' must be a slug."
+        return None
+
+    def resolve_taxonomy(self, records: list[dict[str, Any]]) -> None:
+        """Make sure every tag and category of the records has an id in the maps."""
+
+        self._resolve(
+            Tag,
+            self.tag_ids,
+            {tag for record in records for tag in record.get("tags") or []},
+        )
+        self._resolve(
+            Category,
+            self.category_ids,
+            {record["category"] for record in records if record.get("category")},
+        )
+
+    def resolve_authors(self, records: list[dict[str, Any]], report: ImportReport) -> None:
+        """Attach the author id to the records, dropping the ones with unknown authors."""
+
+        if not self.allow_other_authors:
+            for record in records:
+                record["_author_id"] = self.default_author.pk
+            return
+
+        emails: set[str] = {
+            record["author"]
+            for record in records
+            if record.get("author") and record["author"] not in self.author_ids
+        }
+        if emails:
+            self.author_ids.update(
+                User.objects.filter(email__in=emails).values_list("email", "id")  # type: ignore
+            )
+
+        for record in records:
+            email: str = record.get("author") or self.default_author.email
+            record["_author_id"] = self.author_ids.get(email)
+            if record["_author_id"] is None:
+                report.errors.append(
+                    {
+                        "offset": record["_offset"],
+                        "slug": record["slug"],
+                        "error": f"Author '{email}' does not exist.",
+                    }
+                )
+
+    @staticmethod
+    def _resolve(model: type[AbstractBaseModel], ids: dict[str, int], slugs: set[str]) -> None:
+        """
+        Fill the slug to id map, creating the missing rows.
+
+        A missing row whose generated name is already taken is left out of the map.
+        """
+
+        missing: set[str] = slugs - ids.keys()
+        if not missing:
+            return
+
+        ids.update(model.all_objects.filter(slug__in=missing).values_list("slug", "id"))  # type: ignore
+        missing -= ids.keys()
+        if not missing:
+            return
+
+        model.all_objects.bulk_create(
+            [model(slug=slug, name=slugify(slug).replace("-", " ").title() or slug) for slug in missing],
+            ignore_conflicts=True,
+        )
+        created: dict[str, int] = dict(
+            model.all_objects.filter(slug__in=missing).values_list("slug", "id")  # type: ignore
+        )
+        ids.update(created)
+        if created:
+            transaction.on_commit(lambda: post_bulk_upsert.send(sender=model, pks=list(created.values())))
@@ -0,0 +1,272 @@
+import json
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any, Callable
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+from django.test import Client, override_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.abstracts.benchmark import Send, compare_results, current_commit, run_scenario
+from apps.abstracts.loadtest import LoadResult
+from apps.blogs.factories import (
+    create_categories,
+    create_comments,
+    create_posts,
+    create_tags,
+    delete_seeded,
+)
+from apps.blogs.models import Category, Post, Tag
+from apps.users.factories import create_users
+from apps.users.models import User
+
+PASSWORD = "benchmark-password"
+SCENARIOS = [
+    "post_list",
+    "post_detail",
+    "post_comments",
+    "tag_list",
+    "tag_create",
+    "tag_retrieve",
+    "tag_update",
+    "tag_delete",
+    "category_list",
+    "category_create",
+    "category_retrieve",
+    "category_update",
+    "category_delete",
+    "auth_login",
+    "auth_refresh",
+]
+
+
+class Command(BaseCommand):
+    """Benchmark the API hot paths on seeded data."""
+
+    help = (
+        "Seed users, taxonomy, posts and comments with bulk factories, send requests to the "
+        "post, comment, tag, category and auth endpoints in process and report the p50/p99 "
+        "latency and throughput of each. Throttling and the response cache are off unless "
+        "--throttle or --response-cache is passed. Seeded rows are deleted afterwards "
+        "unless --keep is passed."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--users", type=int, default=50, help="Number of seeded users.")
+        parser.add_argument("--posts", type=int, default=1000, help="Number of seeded posts.")
+        parser.add_argument("--tags", type=int, default=50, help="Number of seeded tags.")
+        parser.add_argument("--categories", type=int, default=10, help="Number of seeded categories.")
+        parser.add_argument("--tags-per-post", type=int, default=3, help="Number of tags of every post.")
+        parser.add_argument("--comments-per-post", type=int, default=5, help="Number of comments of every post.")
+        parser.add_argument("--requests", type=int, default=200, help="Requests per scenario.")
+        parser.add_argument("--concurrency", type=int, default=4, help="Concurrent clients.")
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            choices=SCENARIOS,
+            default=[],
+            help="Only run this scenario. Can be repeated.",
+        )
+        parser.add_argument("--output", help="Write the results as JSON to this path.")
+        parser.add_argument("--compare", help="Results JSON of a previous run to compare with.")
+        parser.add_argument("--throttle", action="store_true", help="Keep the throttles enabled.")
+        parser.add_argument("--response-cache", action="store_true", help="Keep the response cache enabled.")
+        parser.add_argument("--keep", action="store_true", help="Keep the seeded rows.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        baseline: dict[str, Any] = {}
+        if options["compare"]:
+            try:
+                with open(options["compare"]) as file:
+                    baseline = json.load(file)
+            except (OSError, ValueError) as error:
+                raise CommandError(f"Cannot read the results to compare with: {error}")
+
+        with override_settings(
+            THROTTLING={**settings.THROTTLING, "ENABLED": options["throttle"]},
+            RESPONSE_CACHE={**settings.RESPONSE_CACHE, "ENABLED": options["response_cache"]},
+            REQUEST_METRICS={**settings.REQUEST_METRICS, "LOG": False},
+        ):
+            results: dict[str, Any] = self.benchmark(options)
+
+        for change in compare_results(baseline, results) if baseline else []:
+            self.stdout.write(
+                f"{change['name']:<18} "
+                + " ".join(
+                    f"{metric}={value:+6.1f}%" if value is not None else f"{metric}=   n/a"
+                    for metric, value in change.items()
+                    if metric != "name"
+                )
+            )
+
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                json.dump(results, file, indent=2)
+            self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}."))
+
+    def benchmark(self, options: dict[str, Any]) -> dict[str, Any]:
+        """Seed the data, run the scenarios and clean up."""
+
+        prefix: str = f"bench-{uuid4().hex[:8]}"
+        try:
+            started_at: float = perf_counter()
+            fixtures: dict[str, Any] = self.seed(prefix, options)
+            seed_seconds: float = perf_counter() - started_at
+            self.stdout.write(
+                f"Seeded {options['users']} users, {options['posts']} posts, {options['tags']} tags, "
+                f"{options['categories']} categories and {fixtures['comments']} comments "
+                f"in {seed_seconds:.2f}s."
+            )
+
+            scenarios: list[dict[str, Any]] = []
+            for name in options["scenario"] or SCENARIOS:
+                url, send = self.build_scenario(name, prefix, fixtures)
+                result: LoadResult = run_scenario(url, send, options["requests"], options["concurrency"])
+                scenarios.append({"name": name, **result.as_dict()})
+                self.stdout.write(
+                    f"{name:<18} p50={result.percentile(50):8.1f}ms p99={result.percentile(99):8.1f}ms "
+                    f"throughput={result.throughput:7.1f}/s statuses={dict(result.statuses)}"
+                    + (f" errors={dict(result.errors)}" if result.errors else "")
+                )
+        finally:
+            if not options["keep"]:
+                delete_seeded(prefix)
+
+        return {
+            "commit": current_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "database": connection.vendor,
+            "options": {
+                name: options[name]
+                for name in (
+                    "users",
+                    "posts",
+                    "tags",
+                    "categories",
+                    "tags_per_post",
+                    "comments_per_post",
+                    "requests",
+                    "concurrency",
+                    "throttle",
+                    "response_cache",
+                )
+            },
+            "seed_seconds": round(seed_seconds, 3),
+            "scenarios": scenarios,
+        }
+
+    def seed(self, prefix: str, options: dict[str, Any]) -> dict[str, Any]:
+        """Insert the benchmark data with the bulk factories."""
+
+        users: list[User] = create_users(max(options["users"], 1), prefix, PASSWORD)
+        tags: list[Tag] = create_tags(options["tags"], prefix)
+        categories: list[Category] = create_categories(options["categories"], prefix)
+        posts: list[Post] = create_posts(
+            max(options["posts"], 1),
+            prefix,
+            users,
+            categories,
+            tags,
+            tags_per_post=options["tags_per_post"],
+        )
+        comments: int = create_comments(posts, users, options["comments_per_post"])
+
+        refresh_tokens: list[RefreshToken] = [RefreshToken.for_user(user) for user in users]
+        return {
+            "users": users,
+            "tags": tags,
+            "categories": categories,
+            "posts": posts,
+            "comments": comments,
+            "refresh_tokens": [str(token) for token in refresh_tokens],
+            "authorizations": [f"Bearer {token.access_token}" for token in refresh_tokens],
+        }
+
+    def build_scenario(self, name: str, prefix: str, fixtures: dict[str, Any]) -> tuple[str, Send]:
+        """Get the URL pattern and the request sender of a scenario."""
+
+        users: list[User] = fixtures["users"]
+        posts: list[Post] = fixtures["posts"]
+        authorizations: list[str] = fixtures["authorizations"]
+
+        def pick(items: list[Any], index: int) -> Any:
+            return items[index % len(items)]
+
+        if name == "post_list":
+            return "/api/blogs/posts", lambda client, index: client.get("/api/blogs/posts").status_code
+        if name == "post_detail":
+            return "/api/blogs/posts/<slug>", lambda client, index: client.get(
+                f"/api/blogs/posts/{pick(posts, index).slug}"
+            ).status_code
+        if name == "post_comments":
+            return "/api/blogs/posts/<slug>/comments", lambda client, index: client.get(
+                f"/api/blogs/posts/{pick(posts, index).slug}/comments"
+            ).status_code
+        if name == "auth_login":
+            return "/api/auth/login", lambda client, index: client.post(
+                "/api/auth/login",
+                {"email": pick(users, index).email, "password": PASSWORD},
+                content_type="application/json",
+            ).status_code
+        if name == "auth_refresh":
+            return "/api/auth/refresh", lambda client, index: client.post(
+                "/api/auth/refresh",
+                {"refresh": pick(fixtures["refresh_tokens"], index)},
+                content_type="application/json",
+            ).status_code
+
+        resource, operation = name.split("_")
+        collection: str = "tags" if resource == "tag" else "categories"
+        seeded: list[Tag | Category] = fixtures[collection]
+        # Rows created by the create scenario, used by the update and delete ones.
+        created: list[int] = fixtures.setdefault(f"created_{collection}", [])
+
+        def targets(index: int) -> int:
+            rows: list[Any] = created or [row.pk for row in seeded]
+            return pick(rows, index)
+
+        def write(method: Callable, path: str, index: int, data: Any = None) -> int:
+            return method(
+                path,
+                data,
+                content_type="application/json",
+                HTTP_AUTHORIZATION=pick(authorizations, index),
+            ).status_code
+
+        if operation == "list":
+            return f"/api/blogs/{collection}", lambda client, index: client.get(
+                f"/api/blogs/{collection}"
+            ).status_code
+        if operation == "retrieve":
+            return f"/api/blogs/{collection}/<id>", lambda client, index: client.get(
+                f"/api/blogs/{collection}/{targets(index)}"
+            ).status_code
+        if operation == "update":
+            return f"/api/blogs/{collection}/<id>", lambda client, index: write(
+                client.patch,
+                f"/api/blogs/{collection}/{targets(index)}",
+                index,
+                {"name": f"{prefix} {resource} renamed {index}"},
+            )
+        if operation == "delete":
+            return f"/api/blogs/{collection}/<id>", lambda client, index: write(
+                client.delete,
+                f"/api/blogs/{collection}/{targets(index)}",
+                index,
+            )
+
+        def create(client: Client, index: int) -> int:
+            response = client.post(
+                f"/api/blogs/{collection}",
+                {"name": f"{prefix} {resource} api {index}", "slug": f"{prefix}-{resource}-api-{index}"},
+                content_type="application/json",
+                HTTP_AUTHORIZATION=pick(authorizations, index),
+            )
+            if "Location" in response:
+                created.append(int(response["Location"].rsplit("/", 1)[1]))
+            return response.status_code
+
+        return f"/api/blogs/{collection}", create
@@ -0,0 +1,73 @@
+from typing import Any, Iterator
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+
+from apps.blogs.importers import ImportReport, PostImporter
+from apps.users.models import User
+
+
+class Rollback(Exception):
+    """Raised to discard the benchmark writes."""
+
+
+class Command(BaseCommand):
+    """Measure the throughput of the post importer on synthetic records."""
+
+    help = "Import synthetic posts inside a rolled back transaction and report the throughput."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--author", required=True, help="Email of the author of the posts.")
+        parser.add_argument("--count", type=int, default=10000, help="Number of posts imported.")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Records per batch.")
+        parser.add_argument("--tags", type=int, default=50, help="Number of distinct tags used.")
+        parser.add_argument(
+            "--tags-per-post",
+            type=int,
+            default=3,
+            help="Number of tags of every post.",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Commit the imported rows instead of rolling them back.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            author: User = User.objects.get(email=options["author"])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['author']}' does not exist.")
+
+        run_id: str = uuid4().hex[:8]
+
+        def records() -> Iterator[dict[str, Any]]:
+            for index in range(options["count"]):
+                yield {
+                    "title": f"Benchmark post {index}",
+                    "slug": f"bench-{run_id}-{index}",
+                    "content": f"Synthetic content of the benchmark post number {index}. " * 10,
+                    "status": "published",
+                    "category": f"bench-{run_id}-category-{index % 10}",
+                    "tags": [
+                        f"bench-{run_id}-tag-{(index + offset) % options['tags']}"
+                        for offset in range(options["tags_per_post"])
+                    ],
+                }
+
+        report: ImportReport = ImportReport()
+        try:
+            with transaction.atomic():
+                PostImporter(author, batch_size=options["batch_size"]).run(records(), report)
+                if not options["keep"]:
+                    raise Rollback
+        except Rollback:
+            pass
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {report.created} post(s) in {report.elapsed:.2f}s: "
+                f"{report.rate:.0f} posts/s with batches of {options['batch_size']}."
+            )
+        )
@@ -0,0 +1,109 @@
+from statistics import median
+from time import perf_counter
+from typing import Any, Callable
+from uuid import uuid4
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from apps.abstracts.renderers import FastJSONRenderer, orjson
+from apps.blogs.factories import create_categories, create_comments, create_posts, create_tags
+from apps.blogs.models import Category, Post, Tag
+from apps.blogs.serializers.fast import post_rows, serialize_post_rows
+from apps.blogs.serializers.post import PostSerializer
+from apps.blogs.taxonomy import TaxonomySnapshot, get_taxonomy_snapshot
+from apps.blogs.views.post import post_list_queryset
+from apps.users.factories import create_users
+from apps.users.models import User
+
+PASSWORD = "benchmark-password"
+
+
+class Command(BaseCommand):
+    """Check and time the fast path of the post payloads against PostSerializer."""
+
+    help = (
+        "Seed posts in a transaction that is rolled back, render them with PostSerializer and "
+        "JSONRenderer and with the fast path of apps.blogs.serializers.fast, fail if the bytes "
+        "differ and report the median time of both."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--count", type=int, default=10000, help="Number of seeded posts.")
+        parser.add_argument("--tags", type=int, default=50, help="Number of seeded tags.")
+        parser.add_argument("--categories", type=int, default=10, help="Number of seeded categories.")
+        parser.add_argument("--tags-per-post", type=int, default=3, help="Number of tags of every post.")
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs of every path.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with transaction.atomic():
+            prefix: str = f"bench-{uuid4().hex[:8]}"
+            self.seed(prefix, options)
+            posts = Post.objects.filter(slug__startswith=f"{prefix}-post-").order_by("-created_at", "-id")
+            # Built once, since a snapshot built in a transaction is never published.
+            snapshot: TaxonomySnapshot = get_taxonomy_snapshot(refresh=True)
+
+            def reference() -> bytes:
+                serializer: PostSerializer = PostSerializer(
+                    post_list_queryset().filter(pk__in=posts.values("pk")).order_by("-created_at", "-id"),
+                    many=True,
+                    context={"taxonomy_snapshot": snapshot},
+                )  # type: ignore
+                return JSONRenderer().render(serializer.data)
+
+            def fast() -> bytes:
+                return FastJSONRenderer().render(serialize_post_rows(list(post_rows(posts)), snapshot))
+
+            expected: bytes = reference()
+            actual: bytes = fast()
+            if actual != expected:
+                position: int = next(
+                    (index for index, (left, right) in enumerate(zip(expected, actual)) if left != right),
+                    min(len(expected), len(actual)),
+                )
+                raise CommandError(
+                    f"The fast path differs from PostSerializer at byte {position}: "
+                    f"{expected[position - 40:position + 40]!r} != {actual[position - 40:position + 40]!r}"
+                )
+            self.stdout.write(f"{options['count']} posts rendered to the same {len(expected)} bytes by both paths.")
+
+            reference_seconds: float = self.time(reference, options["repeat"])
+            fast_seconds: float = self.time(fast, options["repeat"])
+            transaction.set_rollback(True)
+
+        encoder: str = "orjson" if orjson is not None else "json"
+        self.stdout.write(f"{'PostSerializer + JSONRenderer':<32}{reference_seconds * 1000:9.1f}ms")
+        self.stdout.write(f"{f'Fast path + {encoder}':<32}{fast_seconds * 1000:9.1f}ms")
+        self.stdout.write(self.style.SUCCESS(f"Speedup: {reference_seconds / fast_seconds:.2f}x"))
+
+    def seed(self, prefix: str, options: dict[str, Any]) -> None:
+        """Insert the posts, with the edge cases the fast path has to render the same."""
+
+        users: list[User] = create_users(2, prefix, PASSWORD)
+        tags: list[Tag] = create_tags(max(options["tags"], 1), prefix)
+        categories: list[Category] = create_categories(max(options["categories"], 1), prefix)
+        posts: list[Post] = create_posts(
+            max(options["count"], 1),
+            prefix,
+            users,
+            categories,
+            tags,
+            tags_per_post=options["tags_per_post"],
+        )
+        # Comment timestamps, posts without a category, a soft deleted tag
+        # and characters JSONRenderer escapes.
+        create_comments(posts[::2], users, 1)
+        Post.objects.filter(pk__in=[post.pk for post in posts[1::7]]).update(category=None)
+        Post.objects.filter(pk=posts[0].pk).update(title="Ünïcødé \u2028\u2029 \"quoted\" \\ \x07 ✓")
+        tags[0].delete()
+
+    def time(self, render: Callable[[], bytes], repeat: int) -> float:
+        """Get the median duration of a path, in seconds."""
+
+        durations: list[float] = []
+        for _ in range(max(repeat, 1)):
+            started_at: float = perf_counter()
+            render()
+            durations.append(perf_counter() - started_at)
+        return median(durations)
@@ -0,0 +1,80 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Optional
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils import timezone as django_timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.blogs.exports import EXPORTS, OUTPUT_FORMATS, export_until, stream_export
+
+
+class Command(BaseCommand):
+    """Stream a blog table as NDJSON or CSV."""
+
+    help = (
+        "Export posts, comments, tags or categories, soft deleted rows included. "
+        "With --state only the rows updated since the previous run are exported."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("table", choices=list(EXPORTS))
+        parser.add_argument("--format", choices=OUTPUT_FORMATS, default="ndjson")
+        parser.add_argument("--gzip", action="store_true", help="Gzip the output.")
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="Output file, '-' (default) to write to stdout.",
+        )
+        parser.add_argument(
+            "--since",
+            help="Only export the rows updated after this ISO 8601 timestamp.",
+        )
+        parser.add_argument(
+            "--state",
+            type=Path,
+            help="File keeping the end of the exported window, used as --since by the next run.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Number of rows fetched per round trip.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        state: Optional[Path] = options["state"]
+        since_value: Optional[str] = options["since"]
+        if since_value is None and state and state.exists():
+            since_value = state.read_text().strip()
+
+        since: Optional[datetime] = None
+        if since_value:
+            since = parse_datetime(since_value)
+            if since is None:
+                raise CommandError(f"'{since_value}' is not an ISO 8601 timestamp.")
+            if django_timezone.is_naive(since):
+                since = django_timezone.make_aware(since)
+
+        until: datetime = export_until()
+        output: IO[bytes] = (
+            sys.stdout.buffer if options["output"] == "-" else open(options["output"], "wb")
+        )
+        try:
+            for chunk in stream_export(
+                options["table"],
+                options["format"],
+                until=until,
+                since=since,
+                compress=options["gzip"],
+                chunk_size=options["chunk_size"],
+            ):
+                output.write(chunk)
+        finally:
+            if output is not sys.stdout.buffer:
+                output.close()
+
+        if state:
+            state.write_text(until.isoformat())
+        self.stderr.write(f"Exported the {options['table']} updated until {until.isoformat()}.")
@@ -0,0 +1,92 @@
+import csv
+import sys
+from pathlib import Path
+from typing import IO, Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.blogs.importers import READERS, ImportReport, PostImporter
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    """Bulk import posts from a JSONL or CSV file."""
+
+    help = (
+        "Import posts in batches from a JSONL or CSV file ('-' for stdin), "
+        "creating the missing tags and categories."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path", help="Input file, '-' to read from stdin.")
+        parser.add_argument(
+            "--format",
+            choices=list(READERS),
+            help="Input format. Guessed from the file extension by default.",
+        )
+        parser.add_argument(
+            "--author",
+            required=True,
+            help="Email of the author of the records which don't name one.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of records written per transaction.",
+        )
+        parser.add_argument(
+            "--offset",
+            type=int,
+            help="Number of leading records to skip. Defaults to the checkpoint, if any.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            type=Path,
+            help="File storing the offset of the last committed batch, to resume from.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            author: User = User.objects.get(email=options["author"])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['author']}' does not exist.")
+
+        input_format: str = options["format"] or Path(options["path"]).suffix.lstrip(".")
+        if input_format not in READERS:
+            raise CommandError("Can't guess the input format, pass --format.")
+
+        checkpoint: Path | None = options["checkpoint"]
+        offset: int | None = options["offset"]
+        if offset is None:
+            offset = int(checkpoint.read_text()) if checkpoint and checkpoint.exists() else 0
+
+        def on_batch(report: ImportReport) -> None:
+            if checkpoint:
+                checkpoint.write_text(str(report.offset))
+            self.stdout.write(
+                f"offset={report.offset} created={report.created} skipped={report.skipped} "
+                f"errors={len(report.errors)} rate={report.rate:.0f} records/s"
+            )
+
+        importer: PostImporter = PostImporter(author, batch_size=options["batch_size"])
+        report: ImportReport = ImportReport(offset=offset)
+        stream: IO[str] = (
+            sys.stdin if options["path"] == "-" else open(options["path"], encoding="utf-8", newline="")
+        )
+        try:
+            importer.run(READERS[input_format](stream), report, on_batch=on_batch)
+        except (ValueError, csv.Error) as error:
+            raise CommandError(f"Malformed input after offset {report.offset}: {error}")
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        for error in report.errors:
+            self.stderr.write(f"{error}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {report.created} post(s) from {report.processed} record(s) "
+                f"in {report.elapsed:.1f}s ({report.rate:.0f} records/s)."
+            )
+        )
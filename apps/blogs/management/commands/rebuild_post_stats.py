@@ -0,0 +1,39 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.abstracts.cache import get_response_cache
+from apps.blogs.models import Post
+from apps.blogs.signals import post_tags
+from apps.blogs.stats import rebuild_post_stats
+
+
+class Command(BaseCommand):
+    """Recompute the denormalized comment counters of posts."""
+
+    help = "Recompute comments_count and last_comment_at of posts from their live comments."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of posts recomputed per query.",
+        )
+        parser.add_argument(
+            "--slug",
+            action="append",
+            default=[],
+            help="Only rebuild the post with this slug. Can be repeated.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        queryset = Post.all_objects.all()
+        if options["slug"]:
+            queryset = queryset.filter(slug__in=options["slug"])
+
+        rewritten: list[Post] = rebuild_post_stats(queryset, batch_size=options["batch_size"])
+        if rewritten:
+            get_response_cache().invalidate(*post_tags(post.slug for post in rewritten))
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt the counters of {len(rewritten)} post(s)."))
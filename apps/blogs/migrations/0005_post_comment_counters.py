@@ -0,0 +1,45 @@
+# Generated by Django 6.0.2 on 2026-10-18 03:06
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_comment_counters(apps, schema_editor):
+    """Count the live comments of the existing posts."""
+    Post = apps.get_model("blogs", "Post")
+    Comments = apps.get_model("blogs", "Comments")
+
+    live_comments = Comments.objects.filter(post=OuterRef("pk"), deleted_at__isnull=True)
+    Post.objects.update(
+        comments_count=Coalesce(
+            Subquery(
+                live_comments.order_by().values("post").annotate(count=Count("pk")).values("count")
+            ),
+            0,
+        ),
+        last_comment_at=Subquery(
+            live_comments.order_by("-created_at").values("created_at")[:1]
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogs', '0004_post_updated_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='last_comment_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(fill_comment_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 6.0.2 on 2026-10-18 03:30
+
+from django.db import migrations
+
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE blogs_post ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english'::regconfig, coalesce(content, '')), 'B')
+    ) STORED
+    """,
+    """
+    CREATE INDEX blogs_post_search_idx ON blogs_post
+    USING GIN (search_vector) WHERE deleted_at IS NULL
+    """,
+]
+
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS blogs_post_search_idx",
+    "ALTER TABLE blogs_post DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE blogs_post_fts USING fts5(
+        title, content, content='blogs_post', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER blogs_post_fts_ai AFTER INSERT ON blogs_post BEGIN
+        INSERT INTO blogs_post_fts(rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER blogs_post_fts_ad AFTER DELETE ON blogs_post BEGIN
+        INSERT INTO blogs_post_fts(blogs_post_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER blogs_post_fts_au AFTER UPDATE OF title, content ON blogs_post BEGIN
+        INSERT INTO blogs_post_fts(blogs_post_fts, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO blogs_post_fts(rowid, title, content)
+        VALUES (new.id, new.title, new.content);
+    END
+    """,
+    "INSERT INTO blogs_post_fts(blogs_post_fts) VALUES ('rebuild')",
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS blogs_post_fts_au",
+    "DROP TRIGGER IF EXISTS blogs_post_fts_ad",
+    "DROP TRIGGER IF EXISTS blogs_post_fts_ai",
+    "DROP TABLE IF EXISTS blogs_post_fts",
+]
+
+
+def run_vendor_sql(statements_by_vendor):
+    """Build a RunPython callable executing the statements of the current database vendor."""
+
+    def run(apps, schema_editor):
+        for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blogs', '0005_post_comment_counters'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_vendor_sql({"postgresql": POSTGRES_FORWARD, "sqlite": SQLITE_FORWARD}),
+            run_vendor_sql({"postgresql": POSTGRES_BACKWARD, "sqlite": SQLITE_BACKWARD}),
+        ),
+    ]
@@ -4,7 +4,10 @@ from django.db.models import (
     CharField,
     DateTimeField,
     ForeignKey,
+    Index,
     ManyToManyField,
+    PositiveIntegerField,
+    Q,
     SlugField,
     TextChoices,
     TextField,
@@ -63,9 +66,38 @@ class Post(AbstractBaseModel):
     category = ForeignKey(Category, on_delete=SET_NULL, related_name="posts", null=True, blank=True)
     tags = ManyToManyField(Tag, related_name="posts", blank=True, null=True)
     status = CharField(choices=StatusChoices.choices, default=StatusChoices.DRAFT)
+    # Denormalized from live comments, maintained by apps.blogs.stats.
+    comments_count = PositiveIntegerField(default=0)
+    last_comment_at = DateTimeField(null=True, blank=True)
     created_at = DateTimeField(auto_now_add=True)
     updated_at = DateTimeField(auto_now=True)
 
+    class Meta:
+        """Meta class for Post."""
+
+        indexes = [
+            Index(
+                fields=["-created_at", "-id"],
+                condition=Q(deleted_at__isnull=True),
+                name="blogs_post_live_created_idx",
+            ),
+            Index(
+                fields=["status", "-created_at"],
+                condition=Q(deleted_at__isnull=True),
+                name="blogs_post_live_status_idx",
+            ),
+            Index(
+                fields=["author", "created_at"],
+                condition=Q(deleted_at__isnull=True),
+                name="blogs_post_live_author_idx",
+            ),
+            # Covers MAX(updated_at) of the conditional GET validators.
+            Index(
+                fields=["updated_at"],
+                name="blogs_post_updated_idx",
+            ),
+        ]
+
 
 class Comments(AbstractBaseModel):
     """Model representing a comment on a blog post."""
@@ -74,3 +106,14 @@ class Comments(AbstractBaseModel):
     author = ForeignKey("users.User", on_delete=CASCADE)
     body = TextField()
     created_at = DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Meta class for Comments."""
+
+        indexes = [
+            Index(
+                fields=["post", "created_at"],
+                condition=Q(deleted_at__isnull=True),
+                name="blogs_comments_live_post_idx",
+            ),
+        ]
@@ -0,0 +1,15 @@
+from apps.abstracts.pagination import KeysetPagination
+
+
+class PostPagination(KeysetPagination):
+    """Newest-first keyset pagination for posts."""
+
+    ordering = ("-created_at", "-id")
+
+
+class CommentPagination(KeysetPagination):
+    """Oldest-first keyset pagination for the comment thread of a post."""
+
+    page_size = 50
+    max_page_size = 200
+    ordering = ("created_at", "id")
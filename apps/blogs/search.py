@@ -0,0 +1,157 @@
+"""Ranked full-text search over live posts."""
+
+import re
+from dataclasses import dataclass
+from html import escape
+from typing import Any
+
+from django.db import connections, router
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+from apps.blogs.models import Post
+
+# Snippet highlight markers, swapped for <mark> tags once the text is escaped.
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """Id of a matching post with its relevance and highlighted excerpt."""
+
+    post_id: int
+    rank: float
+    snippet: str
+
+
+class PostSearchBackend:
+    """
+    Base of the vendor specific post search implementations.
+
+    Every backend caps the number of candidate rows it ranks, which keeps the
+    latency of broad queries bounded however big the posts table grows.
+    """
+
+    max_candidates: int = 10000
+
+    def __init__(self, connection: BaseDatabaseWrapper) -> None:
+        self.connection = connection
+
+    def search(self, query: str, limit: int, offset: int) -> list[SearchHit]:
+        """Get the hits of the query ordered by relevance."""
+        raise NotImplementedError
+
+
+class PostgresPostSearch(PostSearchBackend):
+    """Search over the generated ``search_vector`` column and its GIN index."""
+
+    config: str = "english"
+    headline_options: str = (
+        f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+        "MaxFragments=2, MaxWords=30, MinWords=10"
+    )
+
+    def search(self, query: str, limit: int, offset: int) -> list[SearchHit]:
+        """
+        Rank the capped candidate set, then build headlines for the page rows only.
+
+        The candidates are the newest matches, so broad queries rank the same
+        rows, and page the same way, on every request.
+        """
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                """
+                WITH query AS (SELECT websearch_to_tsquery(%s::regconfig, %s) AS q),
+                candidates AS (
+                    SELECT post.id, post.search_vector
+                    FROM blogs_post post, query
+                    WHERE post.deleted_at IS NULL AND post.search_vector @@ query.q
+                    ORDER BY post.id DESC
+                    LIMIT %s
+                ),
+                page AS (
+                    SELECT candidates.id, ts_rank_cd(candidates.search_vector, query.q) AS rank
+                    FROM candidates, query
+                    ORDER BY rank DESC, candidates.id DESC
+                    LIMIT %s OFFSET %s
+                )
+                SELECT page.id, page.rank,
+                       ts_headline(%s::regconfig, post.content, query.q, %s)
+                FROM page
+                JOIN blogs_post post ON post.id = page.id, query
+                ORDER BY page.rank DESC, page.id DESC
+                """,
+                [
+                    self.config,
+                    query,
+                    self.max_candidates,
+                    limit,
+                    offset,
+                    self.config,
+                    self.headline_options,
+                ],
+            )
+            return [SearchHit(post_id=row[0], rank=row[1], snippet=row[2]) for row in cursor.fetchall()]
+
+
+class SqlitePostSearch(PostSearchBackend):
+    """Search over the ``blogs_post_fts`` FTS5 table, used for local development."""
+
+    snippet_tokens: int = 30
+
+    def search(self, query: str, limit: int, offset: int) -> list[SearchHit]:
+        """Rank matches with BM25, weighting titles over content."""
+
+        match: str = self.to_match_expression(query)
+        if not match:
+            return []
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT fts.rowid,
+                       -bm25(blogs_post_fts, 10.0, 1.0) AS rank,
+                       snippet(blogs_post_fts, 1, %s, %s, '...', %s)
+                FROM blogs_post_fts fts
+                JOIN blogs_post post ON post.id = fts.rowid
+                WHERE blogs_post_fts MATCH %s AND post.deleted_at IS NULL
+                ORDER BY rank DESC, fts.rowid DESC
+                LIMIT %s OFFSET %s
+                """,
+                [HIGHLIGHT_START, HIGHLIGHT_STOP, self.snippet_tokens, match, limit, offset],
+            )
+            return [SearchHit(post_id=row[0], rank=row[1], snippet=row[2]) for row in cursor.fetchall()]
+
+    @staticmethod
+    def to_match_expression(query: str) -> str:
+        """Turn free text into an FTS5 expression matching all of its words."""
+
+        words: list[str] = re.findall(r"\w+", query)
+        return " ".join(f'"{word}"' for word in words)
+
+
+SEARCH_BACKENDS: dict[str, type[PostSearchBackend]] = {
+    "postgresql": PostgresPostSearch,
+    "sqlite": SqlitePostSearch,
+}
+
+
+def get_post_search_backend() -> PostSearchBackend:
+    """Get the search backend of the database posts are read from."""
+
+    connection: BaseDatabaseWrapper = connections[router.db_for_read(Post)]
+    backend_class: type[PostSearchBackend] = SEARCH_BACKENDS.get(connection.vendor)  # type: ignore
+    if backend_class is None:
+        raise NotImplementedError(f"Post search isn't supported on '{connection.vendor}'.")
+    return backend_class(connection)
+
+
+def render_snippet(snippet: Any) -> str:
+    """Escape the snippet text and turn the highlight markers into <mark> tags."""
+
+    return (
+        escape(snippet or "")
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_STOP, "</mark>")
+    )
@@ -1,9 +1,16 @@
 from rest_framework.serializers import ModelSerializer
+from rest_framework.validators import UniqueValidator
 
+from apps.abstracts.serializers import SparseFieldsetMixin
 from apps.blogs.models import Category
 
 
-class CategorySerializer(ModelSerializer):
+class CategorySerializer(SparseFieldsetMixin, ModelSerializer):
     class Meta:
         model = Category
         fields = ["id", "name", "slug"]
+        # Soft deleted rows still hold their unique values in the table.
+        extra_kwargs = {
+            "name": {"validators": [UniqueValidator(queryset=Category.all_objects.all())]},
+            "slug": {"validators": [UniqueValidator(queryset=Category.all_objects.all())]},
+        }
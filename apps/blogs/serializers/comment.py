@@ -1,9 +1,10 @@
 from rest_framework.serializers import CharField, ModelSerializer, SlugField
 
+from apps.abstracts.serializers import SparseFieldsetMixin
 from apps.blogs.models import Comments
 
 
-class CommentSerializer(ModelSerializer):
+class CommentSerializer(SparseFieldsetMixin, ModelSerializer):
     author = CharField(source="author.email", read_only=True)
     post = SlugField(source="post.slug", read_only=True)
 
@@ -0,0 +1,12 @@
+from rest_framework.serializers import BooleanField, ChoiceField, DateTimeField, Serializer
+
+from apps.blogs.exports import OUTPUT_FORMATS
+
+
+class ExportQuerySerializer(Serializer):
+    output = ChoiceField(choices=OUTPUT_FORMATS, required=False, default="ndjson")
+    since = DateTimeField(required=False)
+    gzip = BooleanField(required=False, default=False)
+
+    class Meta:
+        fields = ["output", "since", "gzip"]
@@ -1,14 +1,127 @@
-from rest_framework.serializers import CharField, ModelSerializer
+from typing import Any
 
-from apps.blogs.models import Post
-from apps.blogs.serializers.category import CategorySerializer
-from apps.blogs.serializers.tag import TagSerializer
+from django.db.models import Model
+from rest_framework.relations import MANY_RELATION_KWARGS, ManyRelatedField
+from rest_framework.serializers import (
+    CharField,
+    ChoiceField,
+    DateTimeField,
+    IntegerField,
+    ListField,
+    ModelSerializer,
+    RelatedField,
+    Serializer,
+    SlugField,
+    SlugRelatedField,
+    ValidationError,
+)
+from rest_framework.validators import UniqueValidator
 
+from apps.abstracts.serializers import SparseFieldsetMixin
+from apps.blogs.models import Category, Post, Tag
+from apps.blogs.taxonomy import TaxonomySnapshot, TaxonomyTable, get_taxonomy_snapshot
 
-class PostSerializer(ModelSerializer):
+
+class TaxonomySnapshotField(RelatedField):
+    """
+    Read-only tag or category served from the taxonomy snapshot.
+
+    Only the primary key of the related row is read from the instance, so
+    posts don't need to join their category or load the tag columns. The
+    snapshot is taken once per serialization and kept in the context; pass it
+    as ``taxonomy_snapshot`` where the database can't be queried, e.g. in
+    async views.
+    """
+
+    def __init__(self, table: str, **kwargs: Any) -> None:
+        self.table = table
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    @classmethod
+    def many_init(cls, *args: Any, **kwargs: Any) -> Any:
+        # The list wrapper is built from the declared kwargs, not the child's.
+        kwargs["read_only"] = True
+        return super().many_init(*args, **kwargs)
+
+    def use_pk_only_optimization(self) -> bool:
+        return True
+
+    def get_snapshot(self) -> TaxonomySnapshot:
+        """Get the snapshot of the serialization."""
+
+        snapshot: TaxonomySnapshot = self.context.get("taxonomy_snapshot")  # type: ignore
+        if snapshot is None:
+            snapshot = self.context["taxonomy_snapshot"] = get_taxonomy_snapshot()
+        return snapshot
+
+    def to_representation(self, value: Any) -> dict[str, Any]:
+        table: TaxonomyTable = getattr(self.get_snapshot(), self.table)
+        data: dict[str, Any] = table.represent(value.pk)  # type: ignore
+        if data is None:
+            # Created after the snapshot was built, e.g. by another process.
+            snapshot: TaxonomySnapshot = get_taxonomy_snapshot(refresh=True)
+            self.context["taxonomy_snapshot"] = snapshot
+            data = getattr(snapshot, self.table).represent(value.pk)
+        return data
+
+
+class SlugListRelatedField(ManyRelatedField):
+    """Related rows written as a list of slugs, all looked up in a single query."""
+
+    def to_internal_value(self, data: Any) -> list[Model]:
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+
+        child: SlugRelatedField = self.child_relation  # type: ignore
+        slugs: list[Any] = list(data)
+        if any(not isinstance(slug, str) for slug in slugs):
+            child.fail("invalid")
+
+        rows: dict[str, Model] = {
+            getattr(row, child.slug_field): row
+            for row in child.get_queryset().filter(**{f"{child.slug_field}__in": set(slugs)})
+        }
+        for slug in slugs:
+            if slug not in rows:
+                child.fail("does_not_exist", slug_name=child.slug_field, value=slug)
+        return [rows[slug] for slug in slugs]
+
+
+class BulkSlugRelatedField(SlugRelatedField):
+    """``SlugRelatedField`` whose ``many=True`` list resolves every slug at once."""
+
+    @classmethod
+    def many_init(cls, *args: Any, **kwargs: Any) -> SlugListRelatedField:
+        list_kwargs: dict[str, Any] = {"child_relation": cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return SlugListRelatedField(**list_kwargs)
+
+
+class PostSerializer(SparseFieldsetMixin, ModelSerializer):
     author = CharField(source="author.email", read_only=True)
-    categories = CategorySerializer(many=True, read_only=True)
-    tags = TagSerializer(many=True, read_only=True)
+    category = TaxonomySnapshotField(table="categories")
+    tags = TaxonomySnapshotField(table="tags", many=True)
+    category_slug = SlugRelatedField(
+        source="category",
+        slug_field="slug",
+        queryset=Category.objects.all(),
+        write_only=True,
+        required=False,
+        allow_null=True,
+    )
+    tag_slugs = BulkSlugRelatedField(
+        source="tags",
+        slug_field="slug",
+        queryset=Tag.objects.all(),
+        many=True,
+        write_only=True,
+        required=False,
+    )
 
     class Meta:
         model = Post
@@ -18,9 +131,106 @@ class PostSerializer(ModelSerializer):
             "slug",
             "content",
             "status",
+            "comments_count",
+            "last_comment_at",
             "created_at",
             "updated_at",
             "author",
-            "categories",
+            "category",
             "tags",
+            "category_slug",
+            "tag_slugs",
         ]
+        # Soft deleted posts still hold their slugs in the table.
+        read_only_fields = ["comments_count", "last_comment_at"]
+        extra_kwargs = {
+            "slug": {"validators": [UniqueValidator(queryset=Post.all_objects.all())]},
+        }
+
+
+class PostSummarySerializer(SparseFieldsetMixin, ModelSerializer):
+    """Post with a database-computed ``excerpt`` instead of its content."""
+
+    author = CharField(source="author.email", read_only=True)
+    category = TaxonomySnapshotField(table="categories")
+    tags = TaxonomySnapshotField(table="tags", many=True)
+    # Annotated by the queryset, see post_summary_queryset.
+    excerpt = CharField(read_only=True)
+
+    class Meta:
+        model = Post
+        fields = [
+            "id",
+            "title",
+            "slug",
+            "excerpt",
+            "status",
+            "comments_count",
+            "last_comment_at",
+            "created_at",
+            "updated_at",
+            "author",
+            "category",
+            "tags",
+        ]
+        read_only_fields = fields
+
+
+class PostSearchQuerySerializer(Serializer):
+    q = CharField(required=True, min_length=2, max_length=200)
+    page = IntegerField(required=False, default=1, min_value=1, max_value=50)
+    page_size = IntegerField(required=False, default=10, min_value=1, max_value=50)
+
+    class Meta:
+        fields = ["q", "page", "page_size"]
+
+
+class PostImportQuerySerializer(Serializer):
+    offset = IntegerField(required=False, default=0, min_value=0)
+    batch_size = IntegerField(required=False, default=1000, min_value=1, max_value=5000)
+
+    class Meta:
+        fields = ["offset", "batch_size"]
+
+
+class PostListQuerySerializer(Serializer):
+    TAG_MATCH_CHOICES = ["any", "all"]
+    MAX_TAGS = 10
+
+    tag = ListField(child=SlugField(), required=False, max_length=MAX_TAGS)
+    tag_match = ChoiceField(choices=TAG_MATCH_CHOICES, required=False, default="any")
+    category = SlugField(required=False)
+    author = IntegerField(required=False, min_value=1)
+    status = ChoiceField(choices=Post.StatusChoices.choices, required=False)
+    created_after = DateTimeField(required=False)
+    created_before = DateTimeField(required=False)
+
+    class Meta:
+        fields = [
+            "tag",
+            "tag_match",
+            "category",
+            "author",
+            "status",
+            "created_after",
+            "created_before",
+        ]
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        """Validates the date range."""
+        created_after = attrs.get("created_after")
+        created_before = attrs.get("created_before")
+
+        if created_after and created_before and created_after >= created_before:
+            raise ValidationError(
+                detail={"created_before": ["Must be later than created_after."]}
+            )
+
+        return super().validate(attrs)
+
+
+class PostSummaryQuerySerializer(PostListQuerySerializer):
+    excerpt_length = IntegerField(required=False, default=200, min_value=20, max_value=1000)
+
+    class Meta:
+        fields = [*PostListQuerySerializer.Meta.fields, "excerpt_length"]
@@ -1,9 +1,16 @@
 from rest_framework.serializers import ModelSerializer
+from rest_framework.validators import UniqueValidator
 
+from apps.abstracts.serializers import SparseFieldsetMixin
 from apps.blogs.models import Tag
 
 
-class TagSerializer(ModelSerializer):
+class TagSerializer(SparseFieldsetMixin, ModelSerializer):
     class Meta:
         model = Tag
         fields = ["id", "name", "slug"]
+        # Soft deleted rows still hold their unique values in the table.
+        extra_kwargs = {
+            "name": {"validators": [UniqueValidator(queryset=Tag.all_objects.all())]},
+            "slug": {"validators": [UniqueValidator(queryset=Tag.all_objects.all())]},
+        }
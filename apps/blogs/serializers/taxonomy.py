@@ -0,0 +1,19 @@
+from typing import Any
+
+from rest_framework.fields import Field
+from rest_framework.serializers import CharField, Serializer, SlugField
+
+
+class TaxonomyBulkItemSerializer(Serializer):
+    """Item of a bulk write of tags or categories, the ``model`` in the context caps the name length."""
+
+    name = CharField()
+    slug = SlugField(max_length=50)
+
+    class Meta:
+        fields = ["name", "slug"]
+
+    def get_fields(self) -> dict[str, Field]:
+        fields: dict[str, Any] = super().get_fields()
+        fields["name"] = CharField(max_length=self.context["model"].NAME_MAX_LENGTH)
+        return fields
@@ -0,0 +1,218 @@
+from typing import Any, Iterable, Optional
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.abstracts.cache import get_response_cache
+from apps.abstracts.signals import post_bulk_upsert, post_soft_delete
+from apps.blogs import cache_tags
+from apps.blogs.models import Category, Comments, Post, Tag
+from apps.blogs.slugs import forget_post_slugs
+from apps.blogs.stats import record_comment_created, record_comments_deleted
+from apps.blogs.taxonomy import invalidate_taxonomy_snapshot
+from apps.users.models import User
+
+
+def invalidate_on_commit(tags: Iterable[str]) -> None:
+    """Invalidate cached responses once the current transaction is committed."""
+
+    tags = list(tags)
+    transaction.on_commit(lambda: get_response_cache().invalidate(*tags))
+
+
+def forget_slugs_on_commit(slugs: Iterable[str]) -> None:
+    """Drop the cached slug resolutions now and once the current transaction is committed."""
+
+    slugs = list(slugs)
+    forget_post_slugs(slugs)
+    transaction.on_commit(lambda: forget_post_slugs(slugs))
+
+
+def post_tags(slugs: Iterable[str]) -> list[str]:
+    """Get the tags of the responses which include the posts."""
+
+    tags: list[str] = [cache_tags.POST_LIST]
+    for slug in slugs:
+        tags += [cache_tags.post_detail(slug), cache_tags.post_comments(slug)]
+    return tags
+
+
+def taxonomy_tags(model: type[Tag] | type[Category], pks: Iterable[Any]) -> list[str]:
+    """Get the tags of the responses which include the tags or categories."""
+
+    if model is Tag:
+        return [cache_tags.TAG_LIST, cache_tags.TAXONOMY] + [cache_tags.tag_detail(pk) for pk in pks]
+    return [cache_tags.CATEGORY_LIST, cache_tags.TAXONOMY] + [
+        cache_tags.category_detail(pk) for pk in pks
+    ]
+
+
+@receiver(pre_save, sender=Post)
+def remember_post_slug(sender: type[Post], instance: Post, **kwargs: Any) -> None:
+    """Remember the stored slug of a post so a slug change drops the old URL too."""
+
+    instance._stored_slug = (  # type: ignore
+        Post.all_objects.filter(pk=instance.pk).values_list("slug", flat=True).first()
+        if instance.pk
+        else None
+    )
+
+
+@receiver(post_save, sender=Post)
+def invalidate_post(sender: type[Post], instance: Post, **kwargs: Any) -> None:
+    """Drop cached responses of a saved post."""
+
+    slugs: list[str] = [instance.slug]
+    stored_slug: Optional[str] = getattr(instance, "_stored_slug", None)
+    if stored_slug and stored_slug != instance.slug:
+        slugs.append(stored_slug)
+    invalidate_on_commit(post_tags(slugs))
+    forget_slugs_on_commit(slugs)
+
+
+@receiver(post_delete, sender=Post)
+def forget_deleted_post(sender: type[Post], instance: Post, **kwargs: Any) -> None:
+    """Drop the cached slug resolution of a post removed from the table."""
+
+    forget_slugs_on_commit([instance.slug])
+
+
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=Category)
+def forget_deleted_taxonomy(sender: type[Tag] | type[Category], instance: Tag | Category, **kwargs: Any) -> None:
+    """Outdate the taxonomy snapshot when a row is removed from the table."""
+
+    invalidate_taxonomy_snapshot()
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def invalidate_post_tags(
+    sender: Any,
+    instance: Post | Tag,
+    action: str,
+    reverse: bool,
+    pk_set: Optional[set[Any]],
+    **kwargs: Any,
+) -> None:
+    """Bump and drop cached responses of posts whose tags have changed."""
+
+    if action == "pre_clear" and reverse:
+        # The cleared posts are only known before the rows go.
+        instance._cleared_post_ids = list(  # type: ignore
+            Post.all_objects.filter(tags=instance).values_list("pk", flat=True)
+        )
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    post_ids: list[Any] = [instance.pk]
+    if reverse:
+        post_ids = list(pk_set or ()) if action != "post_clear" else instance._cleared_post_ids  # type: ignore
+    # The conditional GET validators and the incremental export read
+    # updated_at, which a change of the through rows alone leaves as is.
+    Post.all_objects.filter(pk__in=post_ids).update(updated_at=timezone.now())
+
+    if reverse:
+        # Posts were changed through a tag, drop every response embedding tags.
+        invalidate_on_commit([cache_tags.TAXONOMY])
+        forget_slugs_on_commit(Post.all_objects.filter(pk__in=post_ids).values_list("slug", flat=True))
+    else:
+        invalidate_on_commit(post_tags([instance.slug]))  # type: ignore
+        # The cached resolution holds the updated_at bumped above.
+        forget_slugs_on_commit([instance.slug])  # type: ignore
+
+
+@receiver(pre_save, sender=User)
+def remember_user_email(sender: type[User], instance: User, update_fields: Any = None, **kwargs: Any) -> None:
+    """Remember the stored email of a user, which posts and comments show as their author."""
+
+    instance._stored_email = (  # type: ignore
+        User.objects.filter(pk=instance.pk).values_list("email", flat=True).first()
+        if instance.pk and (update_fields is None or "email" in update_fields)
+        else None
+    )
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_posts(sender: type[User], instance: User, created: bool, **kwargs: Any) -> None:
+    """Drop cached responses showing the former email of a user."""
+
+    stored_email: Optional[str] = getattr(instance, "_stored_email", None)
+    if created or stored_email is None or stored_email == instance.email:
+        return
+
+    slugs: list[str] = list(
+        Post.all_objects.filter(Q(author=instance) | Q(comments__author=instance))
+        .values_list("slug", flat=True)
+        .distinct()
+    )
+    invalidate_on_commit(post_tags(slugs))
+
+
+@receiver(post_save, sender=Tag)
+def invalidate_tag(sender: type[Tag], instance: Tag, **kwargs: Any) -> None:
+    """Drop cached responses of a saved tag."""
+
+    invalidate_on_commit(taxonomy_tags(Tag, [instance.pk]))
+    invalidate_taxonomy_snapshot()
+
+
+@receiver(post_save, sender=Category)
+def invalidate_category(sender: type[Category], instance: Category, **kwargs: Any) -> None:
+    """Drop cached responses of a saved category."""
+
+    invalidate_on_commit(taxonomy_tags(Category, [instance.pk]))
+    invalidate_taxonomy_snapshot()
+
+
+@receiver(post_save, sender=Comments)
+def count_comment(
+    sender: type[Comments],
+    instance: Comments,
+    created: bool,
+    **kwargs: Any,
+) -> None:
+    """Count a new comment in its post and drop the cached responses showing it."""
+
+    if not created:
+        invalidate_on_commit([cache_tags.post_comments(instance.post.slug)])
+        return
+
+    record_comment_created(instance.post_id, instance.created_at)  # type: ignore
+    invalidate_on_commit(post_tags([instance.post.slug]))
+    # The cached resolution holds the updated_at the counter update bumped.
+    forget_slugs_on_commit([instance.post.slug])
+
+
+@receiver(post_soft_delete)
+def invalidate_soft_deleted(sender: Any, pks: list[Any], **kwargs: Any) -> None:
+    """Drop cached responses of soft deleted rows."""
+
+    if sender is Post:
+        slugs = list(Post.all_objects.filter(pk__in=pks).values_list("slug", flat=True))
+        invalidate_on_commit(post_tags(slugs))
+        forget_slugs_on_commit(slugs)
+    elif sender in (Tag, Category):
+        invalidate_on_commit(taxonomy_tags(sender, pks))
+        invalidate_taxonomy_snapshot()
+    elif sender is Comments:
+        post_ids: list[int] = record_comments_deleted(pks)
+        slugs = list(Post.all_objects.filter(pk__in=post_ids).values_list("slug", flat=True))
+        invalidate_on_commit(post_tags(slugs))
+        forget_slugs_on_commit(slugs)
+
+
+@receiver(post_bulk_upsert)
+def invalidate_bulk_upserted(sender: Any, pks: list[Any], **kwargs: Any) -> None:
+    """Drop cached responses of rows written with bulk_create."""
+
+    if sender is Post:
+        slugs = list(Post.all_objects.filter(pk__in=pks).values_list("slug", flat=True))
+        invalidate_on_commit(post_tags(slugs))
+        forget_slugs_on_commit(slugs)
+    elif sender in (Tag, Category):
+        invalidate_on_commit(taxonomy_tags(sender, pks))
+        invalidate_taxonomy_snapshot()
@@ -0,0 +1,113 @@
+"""Cache resolving post slugs to primary keys."""
+
+from datetime import datetime
+from typing import Any, Callable, Iterable, NamedTuple, Optional, TypeVar
+
+from django.conf import settings
+from django.db import connection
+from django.http import Http404
+
+from apps.abstracts.cache import BaseCacheBackend, build_cache_backend
+from apps.blogs.models import Post
+
+T = TypeVar("T")
+
+_slug_cache: Optional[BaseCacheBackend] = None
+
+
+class ResolvedSlug(NamedTuple):
+    """Primary key and last update of the live post with a slug."""
+
+    id: int
+    updated_at: datetime
+
+
+def get_slug_cache() -> BaseCacheBackend:
+    """Get the process-wide cache of post slugs configured by ``POST_SLUG_CACHE``."""
+
+    global _slug_cache
+    if _slug_cache is None:
+        _slug_cache = build_cache_backend(settings.POST_SLUG_CACHE)
+    return _slug_cache
+
+
+def slug_cache_key(slug: str) -> str:
+    """Get the cache key of a post slug."""
+    return f"post:slug:{slug}"
+
+
+def resolve_post_slug(slug: str) -> Optional[ResolvedSlug]:
+    """
+    Get the id and last update of the live post with the slug, None if there is none.
+
+    Misses are not cached, and neither are rows read inside a transaction,
+    which could still be rolled back.
+    """
+
+    cache: BaseCacheBackend = get_slug_cache()
+    cached: Optional[tuple[int, datetime]] = cache.get(slug_cache_key(slug))
+    if cached is not None:
+        return ResolvedSlug(*cached)
+
+    row: Optional[tuple[int, datetime]] = (
+        Post.objects.filter(slug=slug).values_list("id", "updated_at").first()  # type: ignore
+    )
+    if row is None:
+        return None
+
+    if not connection.in_atomic_block:
+        cache.set(slug_cache_key(slug), tuple(row), settings.POST_SLUG_CACHE["TIMEOUT"])
+    return ResolvedSlug(*row)
+
+
+def resolve_post_slug_or_404(slug: str) -> ResolvedSlug:
+    """Resolve the slug of a post, raising ``Http404`` if there is no live post with it."""
+
+    resolved: Optional[ResolvedSlug] = resolve_post_slug(slug)
+    if resolved is None:
+        raise Http404("No Post matches the given query.")
+    return resolved
+
+
+def find_post_by_slug(slug: str, fetch: Callable[[ResolvedSlug], Optional[T]]) -> T:
+    """
+    Fetch a live post through its cached resolution, raising ``Http404`` if there is none.
+
+    ``fetch`` gets the resolution and returns None when no live post has
+    both its id and slug. The cache of a process is only invalidated by the
+    writes of that process, so a miss may come from a post renamed or
+    deleted by another one: the entry is then dropped and the slug resolved
+    again from the database.
+    """
+
+    found: Optional[T] = fetch(resolve_post_slug_or_404(slug))
+    if found is None:
+        forget_post_slugs([slug])
+        found = fetch(resolve_post_slug_or_404(slug))
+    if found is None:
+        raise Http404("No Post matches the given query.")
+    return found
+
+
+def post_reference(slug: str, resolved: ResolvedSlug) -> Post:
+    """
+    Build a post holding only its id, slug and last update, the other fields deferred.
+
+    Enough to attach rows to the post and to serialize its slug without
+    loading it; any other field is loaded from the database on first access.
+    The resolution is trusted as is, check the post is still live first.
+    """
+
+    return Post.from_db(  # type: ignore
+        Post.objects.db,
+        ["id", "slug", "updated_at"],
+        [resolved.id, slug, resolved.updated_at],
+    )
+
+
+def forget_post_slugs(slugs: Iterable[Any]) -> None:
+    """Drop the cached resolution of the slugs."""
+
+    cache: BaseCacheBackend = get_slug_cache()
+    for slug in slugs:
+        cache.delete(slug_cache_key(slug))
@@ -0,0 +1,108 @@
+"""Maintenance of the denormalized comment counters of posts."""
+
+from datetime import datetime
+from typing import Any, Iterable
+
+from django.db.models import Count, F, OuterRef, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone as django_timezone
+
+from apps.blogs.models import Comments, Post
+
+
+def last_live_comment_at() -> Subquery:
+    """Subquery of the latest live comment timestamp of the outer post."""
+
+    return Subquery(
+        Comments.objects.filter(post=OuterRef("pk"))
+        .order_by("-created_at")
+        .values("created_at")[:1]
+    )
+
+
+def live_comments_count() -> Subquery:
+    """Subquery of the live comments count of the outer post."""
+
+    return Subquery(
+        Comments.objects.filter(post=OuterRef("pk"))
+        .order_by()
+        .values("post")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+
+
+def record_comment_created(post_id: int, created_at: datetime) -> None:
+    """Count a new comment in its post with a single atomic UPDATE."""
+
+    Post.all_objects.filter(pk=post_id).update(
+        comments_count=F("comments_count") + 1,
+        last_comment_at=Greatest(Coalesce("last_comment_at", Value(created_at)), Value(created_at)),
+        updated_at=django_timezone.now(),
+    )
+
+
+def record_comments_deleted(comment_pks: Iterable[Any]) -> list[int]:
+    """
+    Uncount soft deleted comments from their posts.
+
+    Returns the ids of the affected posts.
+    """
+
+    deleted_per_post: QuerySet = (
+        Comments.all_objects.filter(pk__in=list(comment_pks))
+        .order_by()
+        .values("post_id")
+        .annotate(count=Count("pk"))
+    )
+
+    post_ids: list[int] = []
+    for row in deleted_per_post:
+        Post.all_objects.filter(pk=row["post_id"]).update(
+            comments_count=Greatest(F("comments_count") - row["count"], Value(0)),
+            last_comment_at=last_live_comment_at(),
+            updated_at=django_timezone.now(),
+        )
+        post_ids.append(row["post_id"])
+    return post_ids
+
+
+def rebuild_post_stats(queryset: QuerySet[Post], batch_size: int = 1000) -> list[Post]:
+    """
+    Recompute the counters of the posts from their live comments.
+
+    Posts are walked in primary key batches and only the drifted ones are
+    written back, with a single bulk UPDATE per batch. Returns the rewritten posts.
+    """
+
+    rewritten: list[Post] = []
+    last_pk: int = 0
+    while True:
+        batch: list[Post] = list(
+            queryset.filter(pk__gt=last_pk)
+            .order_by("pk")
+            .only("pk", "slug", "comments_count", "last_comment_at")
+            .annotate(
+                live_count=Coalesce(live_comments_count(), 0),
+                live_last_at=last_live_comment_at(),
+            )[:batch_size]
+        )
+        if not batch:
+            return rewritten
+
+        now: datetime = django_timezone.now()
+        drifted: list[Post] = []
+        for post in batch:
+            if (post.comments_count, post.last_comment_at) != (post.live_count, post.live_last_at):  # type: ignore
+                post.comments_count = post.live_count  # type: ignore
+                post.last_comment_at = post.live_last_at  # type: ignore
+                post.updated_at = now
+                drifted.append(post)
+
+        if drifted:
+            Post.all_objects.bulk_update(
+                drifted,
+                fields=["comments_count", "last_comment_at", "updated_at"],
+            )
+            rewritten += drifted
+        last_pk = batch[-1].pk
@@ -0,0 +1,188 @@
+"""
+Immutable in-process snapshot of the tags and categories.
+
+Both tables are small and rarely written, so every process keeps them in
+memory and serves the list endpoints and the taxonomy embedded in posts from
+there. A snapshot is never modified: a write bumps a version counter once its
+transaction commits and the next read builds a new snapshot and swaps it in
+with a single assignment, so readers never take a lock.
+"""
+
+from dataclasses import dataclass
+from hashlib import sha1
+from threading import Lock
+from time import monotonic
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.http import HttpResponse, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import Serializer
+
+from apps.abstracts.cache import BaseCacheBackend, build_cache_backend
+from apps.abstracts.serializers import SparseFieldset, SparseFieldsetMixin
+from apps.blogs.models import Category, Tag
+
+VERSION_KEY = "taxonomy:version"
+
+
+class TaxonomyItem(NamedTuple):
+    """Tag or category as serialized by the API."""
+
+    id: int
+    name: str
+    slug: str
+
+
+@dataclass(frozen=True)
+class TaxonomyTable:
+    """Read-only view of one of the taxonomy tables."""
+
+    # Every row, soft deleted ones included since posts may still point to them.
+    items: Mapping[int, TaxonomyItem]
+    # Live rows only.
+    by_slug: Mapping[str, TaxonomyItem]
+    # Rendered JSON list of the live rows, ordered by id.
+    content: bytes
+    etag: str
+
+    def represent(self, pk: int) -> Optional[dict[str, Any]]:
+        """Get the serialized row, None if the snapshot doesn't know it."""
+
+        item: Optional[TaxonomyItem] = self.items.get(pk)
+        return item._asdict() if item is not None else None
+
+
+@dataclass(frozen=True)
+class TaxonomySnapshot:
+    """Tags and categories as of a version."""
+
+    version: int
+    built_at: float
+    tags: TaxonomyTable
+    categories: TaxonomyTable
+
+
+def build_table(model: type[Tag] | type[Category]) -> TaxonomyTable:
+    """Load a taxonomy table and render its list."""
+
+    items: dict[int, TaxonomyItem] = {}
+    live: list[TaxonomyItem] = []
+    for pk, name, slug, deleted_at in model.all_objects.order_by("id").values_list(  # type: ignore
+        "id",
+        "name",
+        "slug",
+        "deleted_at",
+    ):
+        items[pk] = TaxonomyItem(pk, name, slug)
+        if deleted_at is None:
+            live.append(items[pk])
+
+    content: bytes = JSONRenderer().render([item._asdict() for item in live])
+    return TaxonomyTable(
+        items=MappingProxyType(items),
+        by_slug=MappingProxyType({item.slug: item for item in live}),
+        content=content,
+        etag=quote_etag(sha1(content).hexdigest()),
+    )
+
+
+_version_store: Optional[BaseCacheBackend] = None
+_snapshot: Optional[TaxonomySnapshot] = None
+_build_lock: Lock = Lock()
+
+
+def get_version_store() -> BaseCacheBackend:
+    """Get the store of the snapshot version configured by ``TAXONOMY_SNAPSHOT``."""
+
+    global _version_store
+    if _version_store is None:
+        _version_store = build_cache_backend(settings.TAXONOMY_SNAPSHOT)
+    return _version_store
+
+
+def is_fresh(snapshot: Optional[TaxonomySnapshot], version: int) -> bool:
+    """Whether the snapshot can still be served."""
+
+    return (
+        snapshot is not None
+        and snapshot.version == version
+        and monotonic() - snapshot.built_at < settings.TAXONOMY_SNAPSHOT["TIMEOUT"]
+    )
+
+
+def get_taxonomy_snapshot(refresh: bool = False) -> TaxonomySnapshot:
+    """
+    Get the current snapshot, built from the database when it is missing or outdated.
+
+    Only builders serialize on a lock, readers of a fresh snapshot don't.
+    A snapshot built inside a transaction is returned but not published.
+    """
+
+    global _snapshot
+    version: int = get_version_store().get(VERSION_KEY) or 0
+    snapshot: Optional[TaxonomySnapshot] = _snapshot
+    if not refresh and is_fresh(snapshot, version):
+        return snapshot  # type: ignore
+
+    with _build_lock:
+        snapshot = _snapshot
+        if not refresh and is_fresh(snapshot, version):
+            return snapshot  # type: ignore
+
+        # Tagged with the version read before the queries, so a write
+        # committed meanwhile triggers another build.
+        snapshot = TaxonomySnapshot(
+            version=version,
+            built_at=monotonic(),
+            tags=build_table(Tag),
+            categories=build_table(Category),
+        )
+        if not connection.in_atomic_block:
+            _snapshot = snapshot
+        return snapshot
+
+
+def invalidate_taxonomy_snapshot() -> None:
+    """Outdate the snapshot of every process sharing the version store once the transaction commits."""
+
+    transaction.on_commit(lambda: get_version_store().incr(VERSION_KEY))
+
+
+def taxonomy_list_response(
+    request: Request,
+    table: TaxonomyTable,
+    serializer_class: type[SparseFieldsetMixin],
+) -> HttpResponseBase:
+    """
+    Serve the live rows of a table, with the pre-rendered JSON when JSON is negotiated.
+
+    A sparse fieldset is served by running the serializer over the snapshot items.
+    """
+
+    fieldset: Optional[SparseFieldset] = serializer_class.sparse_fieldset(request)
+    etag: str = table.etag
+    if fieldset is not None:
+        etag = quote_etag(sha1(f"{table.etag}:{','.join(sorted(fieldset.fields))}".encode()).hexdigest())
+
+    response: Optional[HttpResponseBase] = get_conditional_response(request, etag=etag)
+    if response is None:
+        if fieldset is not None:
+            serializer: Serializer = serializer_class(  # type: ignore
+                list(table.by_slug.values()),
+                many=True,
+                context={"request": request},
+            )
+            response = Response(serializer.data)
+        elif request.accepted_renderer.format == "json":  # type: ignore
+            response = HttpResponse(table.content, content_type=JSONRenderer.media_type)
+        else:
+            response = Response([item._asdict() for item in table.by_slug.values()])
+    response["ETag"] = etag
+    return response
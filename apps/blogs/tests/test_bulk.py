@@ -0,0 +1,119 @@
+from typing import Any
+from unittest import mock
+
+from django.http import HttpResponseBase
+from django.test import TestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.blogs import bulk
+from apps.blogs.factories import create_tags
+from apps.blogs.models import Category, Tag
+from apps.users.factories import create_users
+
+
+class TaxonomyBulkTests(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = create_users(1, "bulk", "bulk-password")[0]
+        cls.tags = create_tags(2, "bulk")
+
+    def setUp(self) -> None:
+        self.client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {RefreshToken.for_user(self.user).access_token}"
+
+    def upsert(self, items: list[Any], atomic: bool = False, path: str = "/api/blogs/tags/bulk") -> HttpResponseBase:
+        return self.client.post(
+            path + ("?atomic=true" if atomic else ""),
+            items,
+            content_type="application/json",
+        )
+
+    def statuses(self, response: HttpResponseBase) -> list[str]:
+        return [result["status"] for result in response.json()["results"]]
+
+    def test_creates_and_updates(self) -> None:
+        response = self.upsert(
+            [
+                {"name": "Bulk renamed", "slug": self.tags[0].slug},
+                {"name": "Bulk created", "slug": "bulk-created"},
+            ]
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.statuses(response), ["updated", "created"])
+        self.assertEqual(Tag.objects.get(slug=self.tags[0].slug).name, "Bulk renamed")
+        self.assertTrue(Tag.objects.filter(slug="bulk-created").exists())
+
+        response = self.upsert([{"name": "Bulk category", "slug": "bulk-category"}], path="/api/blogs/categories/bulk")
+        self.assertEqual(self.statuses(response), ["created"])
+        self.assertTrue(Category.objects.filter(slug="bulk-category").exists())
+
+    def test_partial_mode_writes_the_valid_items(self) -> None:
+        response = self.upsert(
+            [
+                {"name": "Bulk valid", "slug": "bulk-valid"},
+                {"name": "", "slug": "bulk-invalid"},
+                {"name": self.tags[1].name, "slug": "bulk-taken"},
+            ]
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.statuses(response), ["created", "error", "error"])
+        self.assertIn("name", response.json()["results"][2]["errors"])
+        self.assertTrue(Tag.objects.filter(slug="bulk-valid").exists())
+        self.assertFalse(Tag.objects.filter(slug__in=["bulk-invalid", "bulk-taken"]).exists())
+
+    def test_atomic_mode_writes_nothing_unless_all_valid(self) -> None:
+        response = self.upsert(
+            [
+                {"name": "Bulk valid", "slug": "bulk-valid"},
+                {"name": "", "slug": "bulk-invalid"},
+            ],
+            atomic=True,
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.statuses(response), ["skipped", "error"])
+        self.assertFalse(Tag.objects.filter(slug="bulk-valid").exists())
+
+    def test_duplicates_in_the_request(self) -> None:
+        response = self.upsert(
+            [
+                {"name": "Bulk first", "slug": "bulk-same"},
+                {"name": "Bulk second", "slug": "bulk-same"},
+                {"name": "Bulk first", "slug": "bulk-other"},
+            ]
+        )
+        self.assertEqual(self.statuses(response), ["created", "error", "error"])
+        self.assertEqual(Tag.objects.get(slug="bulk-same").name, "Bulk first")
+        self.assertFalse(Tag.objects.filter(slug="bulk-other").exists())
+
+    def test_name_stored_concurrently_in_partial_mode(self) -> None:
+        response = self.upsert_racing(atomic=False)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.statuses(response), ["error", "created"])
+        self.assertEqual(
+            response.json()["results"][0]["errors"],
+            {"name": ["Name is already used by 'bulk-raced-elsewhere'."]},
+        )
+        self.assertTrue(Tag.objects.filter(slug="bulk-valid").exists())
+
+    def test_name_stored_concurrently_in_atomic_mode(self) -> None:
+        response = self.upsert_racing(atomic=True)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.statuses(response), ["error", "skipped"])
+        self.assertFalse(Tag.objects.filter(slug__in=["bulk-raced", "bulk-valid"]).exists())
+
+    def upsert_racing(self, atomic: bool) -> HttpResponseBase:
+        """Upsert while another request stores the first name under another slug."""
+        check = bulk.reject_name_conflicts
+
+        def check_then_race(*args: Any) -> set[str]:
+            stored: set[str] = check(*args)
+            if not Tag.objects.filter(name="Bulk raced").exists():
+                # Committed by another request right after the lookup.
+                Tag.objects.create(name="Bulk raced", slug="bulk-raced-elsewhere")
+            return stored
+
+        items: list[dict[str, str]] = [
+            {"name": "Bulk raced", "slug": "bulk-raced"},
+            {"name": "Bulk valid", "slug": "bulk-valid"},
+        ]
+        with mock.patch("apps.blogs.bulk.reject_name_conflicts", side_effect=check_then_race):
+            return self.upsert(items, atomic=atomic)
@@ -0,0 +1,53 @@
+from django.test import TestCase
+
+from apps.blogs.factories import create_categories, create_posts, create_tags
+from apps.blogs.models import Post, Tag
+from apps.users.factories import create_users
+
+
+class ConditionalResponseTests(TestCase):
+    """Validators come from the response cache tag versions, so a 304 costs no query."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        users = create_users(1, "conditional", "conditional-password")
+        cls.tags = create_tags(2, "conditional")
+        cls.posts = create_posts(3, "conditional", users, create_categories(1, "conditional"), cls.tags)
+
+    def assertNotModified(self, path: str, etag: str) -> None:
+        with self.assertNumQueries(0):
+            response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_and_detail(self) -> None:
+        post: Post = self.posts[0]
+        for path in ["/api/blogs/posts", f"/api/blogs/posts/{post.slug}", "/api/blogs/posts/summary"]:
+            with self.subTest(path=path):
+                response = self.client.get(path)
+                self.assertEqual(response.status_code, 200)
+                self.assertIn("Last-Modified", response)
+                self.assertNotModified(path, response["ETag"])
+
+    def test_post_write_changes_the_etag(self) -> None:
+        post: Post = self.posts[0]
+        path: str = f"/api/blogs/posts/{post.slug}"
+        etag: str = self.client.get(path)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post.title = "Changed"
+            post.save()
+
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertNotModified(path, response["ETag"])
+
+    def test_taxonomy_write_changes_the_etag(self) -> None:
+        tag: Tag = self.tags[0]
+        etag: str = self.client.get("/api/blogs/posts")["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tag.name = "Renamed"
+            tag.save()
+
+        self.assertEqual(self.client.get("/api/blogs/posts", HTTP_IF_NONE_MATCH=etag).status_code, 200)
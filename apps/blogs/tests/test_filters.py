@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.test import TestCase, override_settings
+
+from apps.abstracts.testing import QueryBudgetTestMixin
+from apps.blogs.factories import create_categories, create_posts, create_tags
+from apps.users.factories import create_users
+
+# The page, the tag prefetch and the two tables of the taxonomy snapshot,
+# which isn't kept across test transactions.
+QUERIES = 4
+# An empty page skips the prefetch and the snapshot.
+EMPTY_PAGE_QUERIES = 1
+
+
+@override_settings(RESPONSE_CACHE={**settings.RESPONSE_CACHE, "ENABLED": False})
+class PostTagFiltersTests(QueryBudgetTestMixin, TestCase):
+    """The tag filters of the post list run a fixed number of queries, whatever the number of tags."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        users = create_users(1, "filters", "filters-password")
+        cls.categories = create_categories(2, "filters")
+        cls.tags = create_tags(5, "filters")
+        # Post i is tagged with tags i % 5 and (i + 1) % 5.
+        cls.posts = create_posts(20, "filters", users, cls.categories, cls.tags, tags_per_post=2)
+
+    def list_slugs(self, queries: int, **params: object) -> set[str]:
+        with self.assertNumQueries(queries):
+            response = self.client.get("/api/blogs/posts", {"page_size": 50, **params})
+        self.assertEqual(response.status_code, 200)
+        self.assertWithinQueryBudget(response)
+        return {post["slug"] for post in response.json()["results"]}
+
+    def expected_slugs(self, *indexes: set[int]) -> set[str]:
+        return {f"filters-post-{index}" for index in set.intersection(*indexes)}
+
+    def tagged(self, tag: int) -> set[int]:
+        return {index for index in range(20) if tag in (index % 5, (index + 1) % 5)}
+
+    def test_any_tag(self) -> None:
+        slugs = self.list_slugs(QUERIES, tag=[self.tags[0].slug])
+        self.assertEqual(slugs, self.expected_slugs(self.tagged(0)))
+
+        slugs = self.list_slugs(QUERIES, tag=[tag.slug for tag in self.tags[:3]], tag_match="any")
+        self.assertEqual(slugs, self.expected_slugs(self.tagged(0) | self.tagged(1) | self.tagged(2)))
+
+    def test_all_tags(self) -> None:
+        slugs = self.list_slugs(QUERIES, tag=[self.tags[0].slug, self.tags[1].slug], tag_match="all")
+        self.assertEqual(slugs, self.expected_slugs(self.tagged(0), self.tagged(1)))
+
+        slugs = self.list_slugs(EMPTY_PAGE_QUERIES, tag=[tag.slug for tag in self.tags[:3]], tag_match="all")
+        self.assertEqual(slugs, set())
+
+    def test_tags_combined_with_other_filters(self) -> None:
+        slugs = self.list_slugs(
+            QUERIES,
+            tag=[self.tags[0].slug, self.tags[1].slug],
+            tag_match="all",
+            category=self.categories[0].slug,
+            status="published",
+        )
+        self.assertEqual(slugs, self.expected_slugs(self.tagged(0), self.tagged(1), set(range(0, 20, 2))))
@@ -0,0 +1,54 @@
+from django.db import connection
+from django.db.models import QuerySet
+from django.test import TestCase
+
+from apps.blogs.factories import create_categories, create_comments, create_posts, create_tags
+from apps.blogs.filters import filter_posts
+from apps.blogs.models import Comments, Post
+from apps.blogs.pagination import CommentPagination, PostPagination
+from apps.blogs.views.post import post_list_queryset
+from apps.users.factories import create_users
+
+
+class LiveRowIndexesTests(TestCase):
+    """The partial indexes of migration 0003 serve the post list and the comment thread."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.users = create_users(2, "indexes", "indexes-password")
+        cls.posts = create_posts(
+            30,
+            "indexes",
+            cls.users,
+            create_categories(2, "indexes"),
+            create_tags(3, "indexes"),
+        )
+        create_comments(cls.posts[:3], cls.users, 5)
+
+    def setUp(self) -> None:
+        if connection.vendor == "postgresql":
+            # A few rows are cheaper to scan than to look up, keep the planner on the indexes.
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assertUsesIndex(self, queryset: QuerySet, index: str) -> None:
+        plan: str = queryset.explain()
+        self.assertIn(index, plan, f"{index} isn't in the query plan:\n{plan}")
+
+    def list_page(self, **params: str) -> QuerySet[Post]:
+        return filter_posts(post_list_queryset(), params).order_by(*PostPagination.ordering)[:21]
+
+    def test_post_list_uses_live_created_index(self) -> None:
+        self.assertUsesIndex(self.list_page(), "blogs_post_live_created_idx")
+
+    def test_status_filter_uses_live_status_index(self) -> None:
+        self.assertUsesIndex(self.list_page(status="published"), "blogs_post_live_status_idx")
+
+    def test_author_filter_uses_live_author_index(self) -> None:
+        self.assertUsesIndex(self.list_page(author=str(self.users[0].pk)), "blogs_post_live_author_idx")
+
+    def test_comment_thread_uses_live_post_index(self) -> None:
+        self.assertUsesIndex(
+            Comments.objects.filter(post=self.posts[0]).order_by(*CommentPagination.ordering)[:51],
+            "blogs_comments_live_post_idx",
+        )
@@ -0,0 +1,124 @@
+from typing import Any
+
+from django.conf import settings
+from django.http import HttpResponseBase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.abstracts.testing import QueryBudgetTestMixin, enforce_query_budgets
+from apps.blogs.factories import create_categories, create_comments, create_posts, create_tags
+from apps.blogs.models import Category, Post, Tag
+from apps.users.factories import create_users
+from apps.users.models import User
+
+
+@enforce_query_budgets()
+@override_settings(RESPONSE_CACHE={**settings.RESPONSE_CACHE, "ENABLED": False})
+class QueryBudgetTestCase(QueryBudgetTestMixin, TestCase):
+    """Run the budgeted actions with ``RAISE_ON_BUDGET``, as an authenticated user, on a small seeded blog."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.users = create_users(2, "budgets", "budgets-password")
+        cls.categories = create_categories(2, "budgets")
+        cls.tags = create_tags(4, "budgets")
+        cls.posts = create_posts(10, "budgets", cls.users, cls.categories, cls.tags)
+        create_comments(cls.posts[:2], cls.users, 3)
+
+    def setUp(self) -> None:
+        user: User = self.users[0]
+        self.client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {RefreshToken.for_user(user).access_token}"
+
+    def request(self, method: str, path: str, data: Any = None, status: int = 200) -> HttpResponseBase:
+        """Send a JSON request, assert its status and that it stayed within its budget."""
+
+        response: HttpResponseBase = getattr(self.client, method)(
+            path,
+            data,
+            **({} if method == "get" else {"content_type": "application/json"}),
+        )
+        self.assertEqual(response.status_code, status, getattr(response, "content", b"")[:500])
+        self.assertWithinQueryBudget(response)
+        return response
+
+
+class PostViewSetQueryBudgetTests(QueryBudgetTestCase):
+    def test_read_actions(self) -> None:
+        post: Post = self.posts[0]
+        self.request("get", "/api/blogs/posts")
+        self.request("get", "/api/blogs/posts", {"tag": [self.tags[0].slug], "fields": "title,tags"})
+        self.request("get", f"/api/blogs/posts/{post.slug}")
+        self.request("get", f"/api/blogs/posts/{post.slug}/comments")
+        self.request("get", "/api/blogs/posts/summary")
+
+    def test_write_actions(self) -> None:
+        payload: dict[str, Any] = {
+            "title": "Budgeted",
+            "slug": "budgets-budgeted",
+            "content": "Budgeted content.",
+            "status": "published",
+            "category_slug": self.categories[0].slug,
+            "tag_slugs": [self.tags[0].slug, self.tags[1].slug],
+        }
+        self.request("post", "/api/blogs/posts", payload, status=201)
+        self.request("patch", "/api/blogs/posts/budgets-budgeted", {"title": "Budgeted again"})
+        self.request(
+            "patch",
+            "/api/blogs/posts/budgets-budgeted",
+            {"tag_slugs": [self.tags[2].slug, self.tags[3].slug]},
+        )
+        self.request("put", "/api/blogs/posts/budgets-budgeted", {**payload, "tag_slugs": [self.tags[0].slug]})
+        self.request("post", "/api/blogs/posts/budgets-budgeted/comments", {"body": "Budgeted comment."}, status=201)
+        self.request("delete", "/api/blogs/posts/budgets-budgeted", status=204)
+
+    def test_replacing_many_tags(self) -> None:
+        post: Post = self.posts[0]
+        tags: list[Tag] = create_tags(12, "budgets-many")
+        # Warm the per-process caches so only the number of tags differs.
+        self.request("patch", f"/api/blogs/posts/{post.slug}", {"tag_slugs": [self.tags[0].slug]})
+        counts: list[int] = []
+        for size in [1, 4, 8, 12]:
+            post.tags.clear()
+            with CaptureQueriesContext(connection) as queries:
+                self.request("patch", f"/api/blogs/posts/{post.slug}", {"tag_slugs": [tag.slug for tag in tags[:size]]})
+            counts.append(len(queries))
+            self.assertEqual(
+                sorted(post.tags.values_list("slug", flat=True)),
+                sorted(tag.slug for tag in tags[:size]),
+            )
+        # Every slug is looked up at once, whatever the number of tags.
+        self.assertEqual(len(set(counts)), 1, counts)
+
+    def test_replacing_tags_with_an_unknown_slug(self) -> None:
+        post: Post = self.posts[0]
+        response = self.request(
+            "patch",
+            f"/api/blogs/posts/{post.slug}",
+            {"tag_slugs": [self.tags[0].slug, "budgets-unknown"]},
+            status=400,
+        )
+        self.assertIn("tag_slugs", response.json())
+
+
+class TagViewSetQueryBudgetTests(QueryBudgetTestCase):
+    def test_actions(self) -> None:
+        self.request("get", "/api/blogs/tags")
+        self.request("post", "/api/blogs/tags", {"name": "Budgeted", "slug": "budgets-budgeted"}, status=201)
+        tag: Tag = Tag.objects.get(slug="budgets-budgeted")
+        self.request("get", f"/api/blogs/tags/{tag.pk}")
+        self.request("patch", f"/api/blogs/tags/{tag.pk}", {"name": "Budgeted again"})
+        self.request("put", f"/api/blogs/tags/{tag.pk}", {"name": "Budgeted", "slug": "budgets-budgeted"})
+        self.request("delete", f"/api/blogs/tags/{tag.pk}", status=204)
+
+
+class CategoryViewSetQueryBudgetTests(QueryBudgetTestCase):
+    def test_actions(self) -> None:
+        self.request("get", "/api/blogs/categories")
+        self.request("post", "/api/blogs/categories", {"name": "Budgeted", "slug": "budgets-budgeted"}, status=201)
+        category: Category = Category.objects.get(slug="budgets-budgeted")
+        self.request("get", f"/api/blogs/categories/{category.pk}")
+        self.request("patch", f"/api/blogs/categories/{category.pk}", {"name": "Budgeted again"})
+        self.request("put", f"/api/blogs/categories/{category.pk}", {"name": "Budgeted", "slug": "budgets-budgeted"})
+        self.request("delete", f"/api/blogs/categories/{category.pk}", status=204)
@@ -0,0 +1,72 @@
+from typing import Any, Optional
+from unittest import mock
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, router
+from django.test import TransactionTestCase, override_settings
+
+from apps.abstracts.cache import get_response_cache
+from apps.abstracts.db_routers import ReplicaRouter
+from apps.blogs.factories import create_categories, create_posts, create_tags
+from apps.blogs.models import Post
+from apps.users.factories import create_users
+
+REPLICAS = {"replica_1": 1}
+
+
+class RecordingRouter(ReplicaRouter):
+    """ReplicaRouter recording the aliases it picks, the reads still run on the test database."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads: list[tuple[type, str]] = []
+
+    def db_for_read(self, model: type, **hints: Any) -> Optional[str]:
+        alias: Optional[str] = super().db_for_read(model, **hints)
+        if alias is None:
+            return None
+        self.reads.append((model, alias))
+        return DEFAULT_DB_ALIAS
+
+
+# Outside of TestCase, whose transaction would keep every read on the primary.
+@override_settings(
+    DATABASE_REPLICAS=REPLICAS,
+    DATABASE_ROUTING={**settings.DATABASE_ROUTING, "PIN_SECONDS": 5},
+    RESPONSE_CACHE={**settings.RESPONSE_CACHE, "ENABLED": True},
+)
+class ResponseCacheReplicaTests(TransactionTestCase):
+    """Response cache misses read from the replicas and aren't stored while the replicas may lag."""
+
+    def setUp(self) -> None:
+        users = create_users(1, "replicas", "replicas-password")
+        self.posts = create_posts(3, "replicas", users, create_categories(1, "replicas"), create_tags(2, "replicas"))
+        get_response_cache().backend.clear()
+
+        self.router = RecordingRouter()
+        patcher = mock.patch.object(router, "routers", [self.router])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def post_reads(self) -> set[str]:
+        return {alias for model, alias in self.router.reads if model is Post}
+
+    def assertMissReadsReplica(self, path: str) -> None:
+        self.router.reads.clear()
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(self.post_reads(), set(REPLICAS))
+
+    def test_list_and_detail_misses_read_from_replicas(self) -> None:
+        self.assertMissReadsReplica("/api/blogs/posts")
+        self.assertMissReadsReplica(f"/api/blogs/posts/{self.posts[0].slug}")
+
+    def test_misses_are_not_stored_within_the_replica_lag(self) -> None:
+        # The posts were just written, so their tags were just invalidated.
+        self.assertEqual(self.client.get("/api/blogs/posts")["X-Cache"], "MISS")
+        self.assertEqual(self.client.get("/api/blogs/posts")["X-Cache"], "MISS")
+
+        with override_settings(DATABASE_ROUTING={**settings.DATABASE_ROUTING, "PIN_SECONDS": 0}):
+            self.assertEqual(self.client.get("/api/blogs/posts")["X-Cache"], "MISS")
+            self.assertEqual(self.client.get("/api/blogs/posts")["X-Cache"], "HIT")
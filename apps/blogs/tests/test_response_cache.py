@@ -0,0 +1,66 @@
+from django.conf import settings
+from django.test import TestCase, override_settings
+
+from apps.abstracts.cache import get_response_cache
+from apps.blogs.factories import create_categories, create_comments, create_posts, create_tags
+from apps.blogs.models import Post
+from apps.users.factories import create_users
+from apps.users.models import User
+
+
+@override_settings(RESPONSE_CACHE={**settings.RESPONSE_CACHE, "ENABLED": True})
+class AuthorEmailInvalidationTests(TestCase):
+    """Cached posts and comments show their author's email, so changing it drops them."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.users = create_users(2, "email", "email-password")
+        cls.posts = create_posts(2, "email", cls.users[:1], create_categories(1, "email"), create_tags(2, "email"))
+        # Comments by the second user only, on the first post.
+        create_comments(cls.posts[:1], cls.users[1:], 2)
+
+    def setUp(self) -> None:
+        get_response_cache().backend.clear()
+
+    def get(self, path: str, cache: str) -> bytes:
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Cache"], cache, path)
+        return response.content
+
+    def change_email(self, user: User, email: str) -> None:
+        with self.captureOnCommitCallbacks(execute=True):
+            user.email = email
+            user.save()
+
+    def test_post_author(self) -> None:
+        post: Post = self.posts[0]
+        paths: list[str] = ["/api/blogs/posts", f"/api/blogs/posts/{post.slug}"]
+        for path in paths:
+            self.get(path, "MISS")
+            self.get(path, "HIT")
+
+        self.change_email(self.users[0], "email-renamed@example.com")
+
+        for path in paths:
+            self.assertIn(b"email-renamed@example.com", self.get(path, "MISS"))
+
+    def test_comment_author(self) -> None:
+        path: str = f"/api/blogs/posts/{self.posts[0].slug}/comments"
+        self.get(path, "MISS")
+        self.get(path, "HIT")
+
+        self.change_email(self.users[1], "commenter-renamed@example.com")
+
+        self.assertIn(b"commenter-renamed@example.com", self.get(path, "MISS"))
+
+    def test_other_changes_keep_the_cache(self) -> None:
+        path: str = f"/api/blogs/posts/{self.posts[0].slug}"
+        self.get(path, "MISS")
+
+        user: User = self.users[0]
+        with self.captureOnCommitCallbacks(execute=True):
+            user.first_name = "Renamed"
+            user.save()
+
+        self.get(path, "HIT")
@@ -0,0 +1,128 @@
+from typing import Any, Callable, Optional
+from unittest import mock
+
+from django.test import TestCase, TransactionTestCase
+
+from apps.blogs import taxonomy
+from apps.blogs.bulk import bulk_upsert_taxonomy
+from apps.blogs.factories import create_categories, create_posts, create_tags
+from apps.blogs.models import Category, Post, Tag
+from apps.blogs.serializers.fast import post_rows, serialize_post_rows
+from apps.blogs.serializers.post import PostSerializer
+from apps.blogs.taxonomy import VERSION_KEY, TaxonomySnapshot, get_taxonomy_snapshot, get_version_store
+from apps.users.factories import create_users
+
+
+def current_version() -> int:
+    return get_version_store().get(VERSION_KEY) or 0
+
+
+class TaxonomySnapshotInvalidationTests(TestCase):
+    """Taxonomy writes bump the snapshot version once their transaction commits."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.tags = create_tags(3, "snapshot")
+        cls.categories = create_categories(2, "snapshot")
+
+    def assertBumpsVersion(self, write: Callable[[], Any]) -> None:
+        version: int = current_version()
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            write()
+            # Nothing is bumped until the commit.
+            self.assertEqual(current_version(), version)
+        self.assertTrue(callbacks)
+        self.assertGreater(current_version(), version)
+
+    def test_save(self) -> None:
+        tag: Tag = self.tags[0]
+        tag.name = "Renamed tag"
+        self.assertBumpsVersion(tag.save)
+
+        category: Category = self.categories[0]
+        category.name = "Renamed category"
+        self.assertBumpsVersion(category.save)
+
+        snapshot: TaxonomySnapshot = get_taxonomy_snapshot()
+        self.assertEqual(snapshot.version, current_version())
+        self.assertEqual(snapshot.tags.represent(tag.pk)["name"], "Renamed tag")
+        self.assertEqual(snapshot.categories.represent(category.pk)["name"], "Renamed category")
+
+    def test_soft_delete(self) -> None:
+        tag: Tag = self.tags[0]
+        self.assertBumpsVersion(tag.delete)
+        self.assertBumpsVersion(Category.objects.filter(pk=self.categories[0].pk).soft_delete)
+
+        snapshot: TaxonomySnapshot = get_taxonomy_snapshot()
+        # Still known to the posts pointing to it, but no longer listed.
+        self.assertIsNotNone(snapshot.tags.represent(tag.pk))
+        self.assertNotIn(tag.slug, snapshot.tags.by_slug)
+        self.assertNotIn(self.categories[0].slug, snapshot.categories.by_slug)
+
+    def test_bulk_upsert(self) -> None:
+        items: list[dict[str, str]] = [
+            {"name": "Bulk renamed", "slug": self.tags[0].slug},
+            {"name": "Bulk created", "slug": "snapshot-bulk-created"},
+        ]
+        self.assertBumpsVersion(lambda: bulk_upsert_taxonomy(Tag, items, atomic=True))
+
+        snapshot: TaxonomySnapshot = get_taxonomy_snapshot()
+        self.assertEqual(snapshot.tags.by_slug[self.tags[0].slug].name, "Bulk renamed")
+        self.assertIn("snapshot-bulk-created", snapshot.tags.by_slug)
+
+    @mock.patch("apps.blogs.taxonomy._snapshot", None)
+    def test_not_published_inside_a_transaction(self) -> None:
+        snapshot: TaxonomySnapshot = get_taxonomy_snapshot()
+        self.assertIn(self.tags[0].slug, snapshot.tags.by_slug)
+        # TestCase runs every test in a transaction which could be rolled back.
+        self.assertIsNone(taxonomy._snapshot)
+
+
+class TaxonomySnapshotRefreshTests(TestCase):
+    """Rows unknown to the snapshot in use are served from a rebuilt one."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        users = create_users(1, "refresh", "refresh-password")
+        cls.tags = create_tags(2, "refresh")
+        cls.posts = create_posts(2, "refresh", users, create_categories(1, "refresh"), cls.tags)
+
+    def setUp(self) -> None:
+        # Built before the new rows, like the snapshot of a process which
+        # hasn't seen their invalidation yet.
+        self.stale: TaxonomySnapshot = get_taxonomy_snapshot(refresh=True)
+        self.post: Post = self.posts[0]
+        self.tag: Tag = Tag.objects.create(name="Refresh new tag", slug="refresh-new-tag")
+        self.category: Category = Category.objects.create(name="Refresh new category", slug="refresh-new-category")
+        self.post.tags.add(self.tag)
+        Post.objects.filter(pk=self.post.pk).update(category=self.category)
+        self.post.refresh_from_db()
+
+    def test_serializer(self) -> None:
+        context: dict[str, Any] = {"taxonomy_snapshot": self.stale}
+        data: dict[str, Any] = PostSerializer(self.post, context=context).data  # type: ignore
+
+        self.assertEqual(data["category"]["slug"], "refresh-new-category")
+        self.assertIn("refresh-new-tag", [tag["slug"] for tag in data["tags"]])
+        self.assertIsNot(context["taxonomy_snapshot"], self.stale)
+
+    def test_fast_path(self) -> None:
+        rows: list[dict[str, Any]] = list(post_rows(Post.objects.filter(pk=self.post.pk)))
+        data: dict[str, Any] = serialize_post_rows(rows, snapshot=self.stale)[0]
+
+        self.assertEqual(data["category"]["slug"], "refresh-new-category")
+        self.assertIn("refresh-new-tag", [tag["slug"] for tag in data["tags"]])
+
+
+class TaxonomySnapshotPublishTests(TransactionTestCase):
+    """Outside of a transaction the snapshot is published and shared by the next reads."""
+
+    @mock.patch("apps.blogs.taxonomy._snapshot", None)
+    def test_published_outside_a_transaction(self) -> None:
+        create_tags(2, "publish")
+        snapshot: TaxonomySnapshot = get_taxonomy_snapshot()
+        published: Optional[TaxonomySnapshot] = taxonomy._snapshot
+        self.assertIs(published, snapshot)
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_taxonomy_snapshot(), snapshot)
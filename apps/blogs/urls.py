@@ -1,7 +1,13 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
+from apps.blogs.views.async_post import (
+    AsyncPostCommentsView,
+    AsyncPostDetailView,
+    AsyncPostListView,
+)
 from apps.blogs.views.category import CategoryViewSet
+from apps.blogs.views.export import ExportViewSet
 from apps.blogs.views.post import PostViewSet
 from apps.blogs.views.tag import TagViewSet
 
@@ -25,7 +31,21 @@ router.register(
     basename="posts",
 )
 
+router.register(
+    prefix="exports",
+    viewset=ExportViewSet,
+    basename="exports",
+)
+
 
 urlpatterns = [
     path("blogs/", include(router.urls)),
+    # Async read path of the posts, served natively under ASGI.
+    path("blogs/async/posts", AsyncPostListView.as_view(), name="async-posts-list"),
+    path("blogs/async/posts/<slug:slug>", AsyncPostDetailView.as_view(), name="async-posts-detail"),
+    path(
+        "blogs/async/posts/<slug:slug>/comments",
+        AsyncPostCommentsView.as_view(),
+        name="async-posts-comments",
+    ),
 ]
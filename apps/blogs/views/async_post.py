@@ -0,0 +1,114 @@
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+from rest_framework.exceptions import APIException
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.status import HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND
+
+from apps.blogs.filters import filter_posts
+from apps.blogs.models import Comments, Post
+from apps.blogs.pagination import CommentPagination, PostPagination
+from apps.blogs.serializers.comment import CommentSerializer
+from apps.blogs.serializers.post import PostListQuerySerializer, PostSerializer
+from apps.blogs.views.post import post_list_queryset
+
+
+def render_json(data: Any, status: int = 200) -> HttpResponse:
+    """Render the data like the JSON renderer of the DRF views."""
+
+    renderer: JSONRenderer = JSONRenderer()
+    return HttpResponse(
+        content=renderer.render(data),
+        status=status,
+        content_type=renderer.media_type,
+    )
+
+
+class AsyncView(View):
+    """
+    Base of the async read-only views.
+
+    DRF views are synchronous, so these views run on Django's async request
+    path and only borrow DRF for parsing the query string, serializing and
+    rendering. Objects must be fully loaded before they are serialized. Post
+    serialization may rebuild the taxonomy snapshot, so it runs through
+    ``serialize_posts``.
+
+    They don't avoid threads: Django's async ORM methods (``aget``, async
+    iteration) run each query through ``sync_to_async``, so does
+    ``serialize_posts``, and the ``MiddlewareMixin`` middleware
+    (``RequestMetricsMiddleware``, ``CompressionMiddleware``) wrap their hooks
+    the same way, so a request hops to a thread and back several times.
+    Compare them with the DRF views using the ``loadtest`` command.
+    """
+
+    http_method_names = ["get", "head", "options"]
+
+    async def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:  # type: ignore
+        try:
+            return await super().dispatch(request, *args, **kwargs)  # type: ignore
+        except APIException as error:
+            return render_json({"detail": error.detail}, status=error.status_code)
+
+
+async def serialize_posts(posts: Post | list[Post], many: bool = False) -> Any:
+    """Serialize loaded posts in the ``sync_to_async`` thread, where the taxonomy snapshot can be built."""
+    return await sync_to_async(lambda: PostSerializer(posts, many=many).data)()
+
+
+class AsyncPostListView(AsyncView):
+    """Async version of the post list of ``PostViewSet``."""
+
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """List posts page by page, newest first, with the same filters."""
+
+        drf_request: Request = Request(request)
+        query_serializer = PostListQuerySerializer(data=drf_request.query_params)
+        if not query_serializer.is_valid():
+            return render_json(query_serializer.errors, status=HTTP_400_BAD_REQUEST)
+
+        paginator: PostPagination = PostPagination()
+        posts: list[Post] = await paginator.apaginate_queryset(  # type: ignore
+            filter_posts(post_list_queryset(), query_serializer.validated_data),  # type: ignore
+            drf_request,
+        )
+        data: list[dict[str, Any]] = await serialize_posts(posts, many=True)
+        return render_json(paginator.get_paginated_response(data).data)
+
+
+class AsyncPostDetailView(AsyncView):
+    """Async version of the post detail of ``PostViewSet``."""
+
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """Retrieve a post by its slug."""
+
+        try:
+            post: Post = await post_list_queryset().aget(slug=kwargs["slug"])
+        except Post.DoesNotExist:  # type: ignore
+            return render_json({"detail": "No Post matches the given query."}, status=HTTP_404_NOT_FOUND)
+
+        return render_json(await serialize_posts(post))
+
+
+class AsyncPostCommentsView(AsyncView):
+    """Async version of the comment list of ``PostViewSet``."""
+
+    async def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """List the comments of a post page by page, oldest first."""
+
+        try:
+            post: Post = await Post.objects.aget(slug=kwargs["slug"])  # type: ignore
+        except Post.DoesNotExist:  # type: ignore
+            return render_json({"detail": "No Post matches the given query."}, status=HTTP_404_NOT_FOUND)
+
+        paginator: CommentPagination = CommentPagination()
+        comments: list[Comments] = await paginator.apaginate_queryset(  # type: ignore
+            # The reverse manager already attaches the post to every comment.
+            post.comments.select_related("author"),  # type: ignore
+            Request(request),
+        )
+        serializer: CommentSerializer = CommentSerializer(comments, many=True)  # type: ignore
+        return render_json(paginator.get_paginated_response(serializer.data).data)
@@ -1,47 +1,44 @@
-from typing import Any
+from typing import Any, Optional
 
-from django.db.models import QuerySet
+from django.http import HttpResponseBase
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (HTTP_200_OK, HTTP_201_CREATED,
                                    HTTP_204_NO_CONTENT, HTTP_404_NOT_FOUND)
 from rest_framework.viewsets import ViewSet
 
+from apps.abstracts.decorators import (cache_response, conditional_response,
+                                       query_budget)
+from apps.abstracts.serializers import SparseFieldset
+from apps.blogs import cache_tags
 from apps.blogs.models import Category
 from apps.blogs.serializers.category import CategorySerializer
+from apps.blogs.taxonomy import get_taxonomy_snapshot, taxonomy_list_response
+from apps.blogs.views.taxonomy import TaxonomyBulkMixin
 
 
-class CategoryViewSet(ViewSet):
+class CategoryViewSet(TaxonomyBulkMixin, ViewSet):
     """ViewSet for managing blog categories."""
 
     serializer_class = CategorySerializer
-    queryset = Category.objects.filter(  # type: ignore
-        deleted_at__isnull=True,
-    )  # type: ignore
+    bulk_model = Category
+    queryset = Category.objects.all()  # type: ignore
 
-    def get_object(self) -> Category:
-        """Get a category by its ID."""
+    def get_object(self, fieldset: Optional[SparseFieldset] = None) -> Category:
+        """Get a category by its ID, with only the columns of the sparse fieldset if one is given."""
 
         self.queryset.filter(
             id=self.kwargs["pk"],  # type: ignore
         )
-        return self.queryset.get(id=self.kwargs["pk"])  # type: ignore
+        queryset = self.queryset if fieldset is None else self.queryset.only(*fieldset.columns)
+        return queryset.get(id=self.kwargs["pk"])  # type: ignore
 
-    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        """List all categories."""
-
-        all_categories: QuerySet[Category] = self.queryset.all()  # type: ignore
-
-        serializer: CategorySerializer = CategorySerializer(
-            all_categories,
-            many=True,
-        )  # type: ignore
-
-        return Response(
-            data=serializer.data,
-            status=HTTP_200_OK,
-        )
+    @query_budget(3)
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        """List all categories, from the taxonomy snapshot. ``fields`` and ``exclude`` narrow the returned fields."""
+        return taxonomy_list_response(request, get_taxonomy_snapshot().categories, CategorySerializer)
 
+    @query_budget(4)
     def create(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Create a new category."""
 
@@ -57,6 +54,7 @@ class CategoryViewSet(ViewSet):
             },
         )
 
+    @query_budget(4)
     def partial_update(
         self, request: Request, pk=None, *args: Any, **kwargs: Any
     ) -> Response:
@@ -82,6 +80,7 @@ class CategoryViewSet(ViewSet):
                 status=HTTP_404_NOT_FOUND,
             )
 
+    @query_budget(5)
     def update(self, request: Request, pk=None, *args: Any, **kwargs: Any) -> Response:
         """Update a category."""
 
@@ -105,6 +104,7 @@ class CategoryViewSet(ViewSet):
                 status=HTTP_404_NOT_FOUND,
             )
 
+    @query_budget(3)
     def destroy(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Delete a category."""
 
@@ -122,13 +122,19 @@ class CategoryViewSet(ViewSet):
                 status=HTTP_404_NOT_FOUND,
             )
 
+    @query_budget(2)
+    @conditional_response(tags=lambda view, request, kwargs: [cache_tags.category_detail(kwargs["pk"])])
+    @cache_response(tags=lambda view, request, kwargs: [cache_tags.category_detail(kwargs["pk"])])
     def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        """Retrieve a category."""
+        """Retrieve a category. ``fields`` and ``exclude`` narrow the returned fields."""
 
         try:
-            category: Category = self.get_object()
+            category: Category = self.get_object(CategorySerializer.sparse_fieldset(request))
 
-            serializer: CategorySerializer = CategorySerializer(category)  # type: ignore
+            serializer: CategorySerializer = CategorySerializer(
+                category,
+                context={"request": request},
+            )  # type: ignore
 
             return Response(
                 data=serializer.data,
@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Any
+
+from django.http import StreamingHttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.status import HTTP_404_NOT_FOUND
+from rest_framework.viewsets import ViewSet
+
+from apps.abstracts.streaming import CSV_CONTENT_TYPE, GZIP_CONTENT_TYPE, NDJSON_CONTENT_TYPE
+from apps.blogs.exports import EXPORTS, export_until, stream_export
+from apps.blogs.serializers.export import ExportQuerySerializer
+
+CONTENT_TYPES = {
+    "ndjson": NDJSON_CONTENT_TYPE,
+    "csv": CSV_CONTENT_TYPE,
+}
+
+
+class ExportViewSet(ViewSet):
+    """ViewSet streaming exports of the blog tables to admins."""
+
+    permission_classes = [IsAdminUser]
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response | StreamingHttpResponse:
+        """
+        Stream the posts, comments, tags or categories as NDJSON or CSV.
+
+        Pass the ``X-Export-Until`` header of the previous response as
+        ``since`` to only get the rows updated in between.
+        """
+
+        if kwargs["pk"] not in EXPORTS:
+            return Response(
+                data={"detail": f"Exports: {', '.join(EXPORTS)}."},
+                status=HTTP_404_NOT_FOUND,
+            )
+
+        query_serializer = ExportQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        options: dict[str, Any] = query_serializer.validated_data  # type: ignore
+        until: datetime = export_until()
+        filename: str = f"{kwargs['pk']}.{options['output']}" + (".gz" if options["gzip"] else "")
+
+        response: StreamingHttpResponse = StreamingHttpResponse(
+            stream_export(
+                kwargs["pk"],
+                options["output"],
+                until=until,
+                since=options.get("since"),
+                compress=options["gzip"],
+            ),
+            content_type=GZIP_CONTENT_TYPE if options["gzip"] else CONTENT_TYPES[options["output"]],
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        response["X-Export-Until"] = until.isoformat()
+        return response
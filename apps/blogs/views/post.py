@@ -1,35 +1,128 @@
-from typing import Any
-
-from django.db.models import QuerySet
+import csv
+from typing import Any, Optional
+
+from django.conf import settings
+from django.db.models import Case, F, Prefetch, QuerySet, TextField, Value, When
+from django.db.models.functions import Concat, Length, Substr
+from django.db.models.lookups import GreaterThan
+from django.http import StreamingHttpResponse
 from rest_framework.decorators import action
 from rest_framework.generics import get_object_or_404
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import BaseRenderer, JSONRenderer
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
     HTTP_204_NO_CONTENT,
+    HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
-    HTTP_401_UNAUTHORIZED
+    HTTP_401_UNAUTHORIZED,
+    HTTP_415_UNSUPPORTED_MEDIA_TYPE,
 )
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.viewsets import ViewSet
 
-from apps.blogs.models import Post
+from apps.abstracts.decorators import (
+    cache_response,
+    conditional_response,
+    query_budget,
+    validate_serializer_data,
+)
+from apps.abstracts.instrumentation import timed_segment
+from apps.abstracts.renderers import FastJSONRenderer
+from apps.abstracts.serializers import SparseFieldset
+from apps.abstracts.streaming import NDJSON_CONTENT_TYPE, stream_ndjson
+from apps.blogs import cache_tags
+from apps.blogs.filters import filter_posts
+from apps.blogs.importers import CONTENT_TYPE_READERS, ImportReport, PostImporter
+from apps.blogs.models import Category, Comments, Post, Tag
+from apps.blogs.pagination import CommentPagination, PostPagination
 from apps.blogs.serializers.comment import CommentSerializer
-from apps.blogs.serializers.post import PostSerializer
+from apps.blogs.serializers.fast import post_rows, serialize_post_rows
+from apps.blogs.search import SearchHit, get_post_search_backend, render_snippet
+from apps.blogs.slugs import find_post_by_slug, post_reference, resolve_post_slug_or_404
+from apps.blogs.serializers.post import (
+    PostImportQuerySerializer,
+    PostListQuerySerializer,
+    PostSearchQuerySerializer,
+    PostSerializer,
+    PostSummaryQuerySerializer,
+    PostSummarySerializer,
+)
+
+
+def post_list_tags(view: Any, request: Request, kwargs: dict[str, Any]) -> list[str]:
+    """Get the invalidation tags of a post list response."""
+    return [cache_tags.POST_LIST, cache_tags.TAXONOMY]
+
+
+def post_detail_tags(view: Any, request: Request, kwargs: dict[str, Any]) -> list[str]:
+    """Get the invalidation tags of a post detail response."""
+    return [cache_tags.post_detail(kwargs["pk"]), cache_tags.TAXONOMY]
+
+
+def post_list_queryset(fieldset: Optional[SparseFieldset] = None) -> QuerySet[Post]:
+    """
+    Get live posts with everything the serializer reads loaded up front.
+
+    Only the ids of the tags are loaded, the serializer takes the rest of the
+    taxonomy from the snapshot. With a sparse fieldset, only its columns are
+    loaded and the author and tags only when selected.
+    """
+
+    if fieldset is None:
+        return Post.objects.select_related(  # type: ignore
+            "author",
+        ).prefetch_related(
+            Prefetch("tags", queryset=Tag.objects.only("id").order_by("id")),
+        )
+
+    queryset: QuerySet[Post] = Post.objects.only(*fieldset.columns)  # type: ignore
+    if "author" in fieldset.fields:
+        queryset = queryset.select_related("author")
+    if "tags" in fieldset.fields:
+        queryset = queryset.prefetch_related(
+            Prefetch("tags", queryset=Tag.objects.only("id").order_by("id")),
+        )
+    return queryset
+
+
+def post_excerpt(length: int) -> Case:
+    """Get the content cut to ``length`` characters, with an ellipsis when cut, computed by the database."""
+
+    return Case(
+        When(
+            GreaterThan(Length("content"), length),
+            then=Concat(Substr("content", 1, length), Value("\u2026"), output_field=TextField()),
+        ),
+        default=F("content"),
+        output_field=TextField(),
+    )
+
+
+def post_summary_queryset(excerpt_length: int, fieldset: Optional[SparseFieldset] = None) -> QuerySet[Post]:
+    """Get live posts for the summary serializer, with the content left in the database."""
+
+    queryset: QuerySet[Post] = post_list_queryset(fieldset)
+    if fieldset is None:
+        queryset = queryset.defer("content")
+    if fieldset is None or "excerpt" in fieldset.fields:
+        queryset = queryset.annotate(excerpt=post_excerpt(excerpt_length))
+    return queryset
 
 
 class PostViewSet(ViewSet):
     """ViewSet for managing blog posts."""
 
     serializer_class = PostSerializer
-    queryset = Post.objects.filter(  # type: ignore
-        deleted_at__isnull=True,
-    )  # type: ignore
+    pagination_class = PostPagination
+    comments_stream_chunk_size = 500
+    queryset = Post.objects.all()  # type: ignore
 
     def get_permissions(self):
-        if self.action in ["create", "partial_update", "destroy"]:
+        if self.action in ["create", "partial_update", "destroy", "bulk_import"]:
             return [IsAuthenticated()]
         return [AllowAny()]
 
@@ -41,29 +134,85 @@ class PostViewSet(ViewSet):
         )
         return self.queryset.get(slug=self.kwargs["pk"])  # type: ignore
 
-    def get_object_by_slug(self) -> Post:
+    def get_object_by_slug(self, queryset: Optional[QuerySet[Post]] = None) -> Post:
         """Get a post by its slug."""
         return get_object_or_404(
-            self.queryset,
+            self.queryset if queryset is None else queryset,
             slug=self.kwargs["pk"],
-            deleted_at__isnull=True,
         )
 
+    def get_list_queryset(self, fieldset: Optional[SparseFieldset] = None) -> QuerySet[Post]:
+        """Get posts with everything the serializer reads loaded up front."""
+        return post_list_queryset(fieldset)
+
+    def get_pagination_columns(self) -> list[str]:
+        """Get the columns the keyset pagination reads from every row."""
+        return [field.lstrip("-") for field in self.pagination_class.ordering]
+
+    def use_fast_serialization(self) -> bool:
+        """Whether the read-only payloads are built by the fast path, see ``FAST_SERIALIZATION``."""
+        return settings.FAST_SERIALIZATION["ENABLED"]
+
+    def get_renderers(self) -> list[BaseRenderer]:
+        """
+        Swap the JSON renderer for the orjson one on the fast path actions.
+
+        Only their payloads are known to hold no floats, which orjson
+        formats differently, e.g. the search rank.
+        """
+
+        renderers: list[BaseRenderer] = super().get_renderers()
+        if not self.use_fast_serialization() or getattr(self, "action", None) not in ("list", "retrieve"):
+            return renderers
+        return [
+            FastJSONRenderer() if type(renderer) is JSONRenderer else renderer
+            for renderer in renderers
+        ]
+
+    @query_budget(5)
+    @conditional_response(tags=post_list_tags)
+    @cache_response(tags=post_list_tags)
+    @validate_serializer_data(PostListQuerySerializer)
     def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        """List all posts."""
+        """
+        List posts page by page, newest first.
+
+        Filters: tag (repeatable, with tag_match=any|all), category, author,
+        status, created_after and created_before. ``fields`` and ``exclude``
+        narrow the returned fields.
+        """
 
-        all_posts: QuerySet[Post] = self.queryset.all()  # type: ignore
+        fieldset: Optional[SparseFieldset] = PostSerializer.sparse_fieldset(
+            request,
+            required=self.get_pagination_columns(),
+        )
+        paginator: PostPagination = self.pagination_class()
+        if self.use_fast_serialization() and fieldset is None:
+            rows: list[dict[str, Any]] = paginator.paginate_queryset(
+                post_rows(filter_posts(Post.objects.all(), kwargs["validated_data"])),
+                request,
+                view=self,
+            )
+            with timed_segment("serialize"):
+                return paginator.get_paginated_response(serialize_post_rows(rows))
+
+        posts: list[Post] = paginator.paginate_queryset(
+            filter_posts(self.get_list_queryset(fieldset), kwargs["validated_data"]),
+            request,
+            view=self,
+        )
 
         serializer: PostSerializer = PostSerializer(
-            all_posts,
+            posts,
             many=True,
+            context={"request": request},
         )  # type: ignore
+        with timed_segment("serialize"):
+            data: list[dict[str, Any]] = serializer.data  # type: ignore
 
-        return Response(
-            data=serializer.data,
-            status=HTTP_200_OK,
-        )
+        return paginator.get_paginated_response(data)
 
+    @query_budget(10)
     def create(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Create a new post."""
 
@@ -79,16 +228,33 @@ class PostViewSet(ViewSet):
             },
         )
 
+    @query_budget(5)
+    @conditional_response(tags=post_detail_tags)
+    @cache_response(tags=post_detail_tags)
     def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        """Retrieve a post by its ID."""
+        """Retrieve a post by its ID. ``fields`` and ``exclude`` narrow the returned fields."""
+
+        fieldset: Optional[SparseFieldset] = PostSerializer.sparse_fieldset(request)
+        if self.use_fast_serialization() and fieldset is None:
+            row: dict[str, Any] = self.get_object_by_slug(post_rows(Post.objects.all()))  # type: ignore
+            with timed_segment("serialize"):
+                return Response(
+                    data=serialize_post_rows([row])[0],
+                    status=HTTP_200_OK,
+                )
 
         try:
-            post: Post = self.get_object_by_slug()  # type: ignore
+            post: Post = self.get_object_by_slug(self.get_list_queryset(fieldset))
 
-            serializer: PostSerializer = PostSerializer(post)  # type: ignore
+            serializer: PostSerializer = PostSerializer(
+                post,
+                context={"request": request},
+            )  # type: ignore
+            with timed_segment("serialize"):
+                data: dict[str, Any] = serializer.data  # type: ignore
 
             return Response(
-                data=serializer.data,
+                data=data,
                 status=HTTP_200_OK,
             )
         except Post.DoesNotExist:  # type: ignore
@@ -96,6 +262,7 @@ class PostViewSet(ViewSet):
                 status=HTTP_404_NOT_FOUND,
             )
 
+    @query_budget(5)
     def destroy(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Soft delete a post by its ID."""
 
@@ -112,6 +279,8 @@ class PostViewSet(ViewSet):
                 status=HTTP_404_NOT_FOUND,
             )
 
+    # Replacing the tags rewrites the post-tag rows, whatever their number.
+    @query_budget(14)
     def partial_update(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         try:
             post: Post = self.get_object_by_slug()  # type: ignore
@@ -135,6 +304,8 @@ class PostViewSet(ViewSet):
                 status=HTTP_404_NOT_FOUND,
             )
 
+    # Replacing the tags rewrites the post-tag rows, whatever their number.
+    @query_budget(16)
     def update(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         try:
             post: Post = self.get_object_by_slug()  # type: ignore
@@ -157,6 +328,7 @@ class PostViewSet(ViewSet):
                 status=HTTP_404_NOT_FOUND,
             )
 
+    @query_budget(4)
     @action(
         methods=["GET", "POST"],
         detail=True,
@@ -164,23 +336,66 @@ class PostViewSet(ViewSet):
         url_name="post-comments",
         permission_classes=[AllowAny],
     )
+    @cache_response(tags=lambda view, request, kwargs: [cache_tags.post_comments(kwargs["pk"])])
     def comments(self, request: Request, *args: Any, **kwargs: Any) -> Response:  # type: ignore
-        """List all comments for a post."""
-        post: Post = self.get_object_by_slug()  # type: ignore
+        """
+        List the comments of a post page by page, or add a comment.
+
+        Pass ``?stream=ndjson`` to stream the whole thread as NDJSON instead.
+        ``fields`` and ``exclude`` narrow the returned fields.
+        """
+        slug: str = kwargs["pk"]
 
         if request.method == "GET":
-            comments = post.comments.filter(deleted_at__isnull=True)  # type: ignore
-            serializer = CommentSerializer(comments, many=True)  # type: ignore
-            return Response(
-                data=serializer.data,
-                status=HTTP_200_OK,
+            # Only the id and slug of the post are needed, the slug cache has
+            # both, so a hot post isn't loaded at all.
+            post: Post = post_reference(slug, resolve_post_slug_or_404(slug))
+
+            # The reverse manager attaches the post to every comment, reading
+            # their post_id, which must not be deferred.
+            fieldset: Optional[SparseFieldset] = CommentSerializer.sparse_fieldset(
+                request,
+                required=["post", *(field.lstrip("-") for field in CommentPagination.ordering)],
             )
+            comments: QuerySet[Comments] = post.comments.all()  # type: ignore
+            if fieldset is not None:
+                comments = comments.only(*fieldset.columns)
+            if fieldset is None or "author" in fieldset.fields:
+                comments = comments.select_related("author")
+
+            if request.query_params.get("stream") == "ndjson":
+                return StreamingHttpResponse(
+                    stream_ndjson(
+                        comments.order_by("created_at", "id"),
+                        CommentSerializer,
+                        chunk_size=self.comments_stream_chunk_size,
+                        context={"request": request},
+                    ),
+                    content_type=NDJSON_CONTENT_TYPE,
+                )
+
+            paginator: CommentPagination = CommentPagination()
+            page: list[Comments] = paginator.paginate_queryset(comments, request, view=self)
+            serializer = CommentSerializer(page, many=True, context={"request": request})  # type: ignore
+            with timed_segment("serialize"):
+                data: list[dict[str, Any]] = serializer.data  # type: ignore
+            return paginator.get_paginated_response(data)
         elif request.method == "POST":
             try:
                 self.permission_classes = [IsAuthenticated]
                 self.check_permissions(request)
                 serializer = CommentSerializer(data=request.data)  # type: ignore
                 serializer.is_valid(raise_exception=True)
+                # Writes check the post is still live rather than trust an
+                # entry another process may not have invalidated yet.
+                post = find_post_by_slug(
+                    slug,
+                    lambda resolved: (
+                        post_reference(slug, resolved)
+                        if Post.objects.filter(pk=resolved.id, slug=slug).exists()
+                        else None
+                    ),
+                )
                 serializer.save(author=request.user, post=post)  # type: ignore
                 return Response(
                     data=serializer.data,
@@ -191,3 +406,151 @@ class PostViewSet(ViewSet):
                     data={"detail": "Unauthenticated."},
                     status=HTTP_404_NOT_FOUND,
                 )
+
+    @query_budget(5)
+    @action(
+        methods=["GET"],
+        detail=False,
+        url_path="summary",
+        url_name="post-summary",
+        permission_classes=[AllowAny],
+    )
+    @conditional_response(tags=post_list_tags)
+    @cache_response(tags=post_list_tags)
+    @validate_serializer_data(PostSummaryQuerySerializer)
+    def summary(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        List posts like ``list`` does, with an excerpt of the content instead of the content.
+
+        The excerpt is cut by the database to ``excerpt_length`` characters, so
+        the full content never leaves it. ``fields`` and ``exclude`` narrow
+        the returned fields.
+        """
+
+        fieldset: Optional[SparseFieldset] = PostSummarySerializer.sparse_fieldset(
+            request,
+            required=self.get_pagination_columns(),
+        )
+        paginator: PostPagination = self.pagination_class()
+        posts: list[Post] = paginator.paginate_queryset(
+            filter_posts(
+                post_summary_queryset(kwargs["validated_data"]["excerpt_length"], fieldset),
+                kwargs["validated_data"],
+            ),
+            request,
+            view=self,
+        )
+
+        serializer: PostSummarySerializer = PostSummarySerializer(
+            posts,
+            many=True,
+            context={"request": request},
+        )  # type: ignore
+        with timed_segment("serialize"):
+            data: list[dict[str, Any]] = serializer.data  # type: ignore
+
+        return paginator.get_paginated_response(data)
+
+    @action(
+        methods=["GET"],
+        detail=False,
+        url_path="search",
+        url_name="post-search",
+        permission_classes=[AllowAny],
+    )
+    @cache_response(tags=lambda view, request, kwargs: [cache_tags.POST_LIST, cache_tags.TAXONOMY])
+    @validate_serializer_data(PostSearchQuerySerializer)
+    def search(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Search live posts, most relevant first, with highlighted snippets."""
+
+        query: str = kwargs["validated_data"]["q"]
+        page: int = kwargs["validated_data"]["page"]
+        page_size: int = kwargs["validated_data"]["page_size"]
+
+        hits: list[SearchHit] = get_post_search_backend().search(
+            query,
+            limit=page_size + 1,
+            offset=(page - 1) * page_size,
+        )
+        has_next: bool = len(hits) > page_size
+        hits = hits[:page_size]
+
+        posts: dict[int, Post] = self.get_list_queryset().in_bulk(
+            [hit.post_id for hit in hits],
+        )
+        hits = [hit for hit in hits if hit.post_id in posts]
+        serializer: PostSerializer = PostSerializer(
+            [posts[hit.post_id] for hit in hits],
+            many=True,
+        )  # type: ignore
+
+        with timed_segment("serialize"):
+            rows: list[dict[str, Any]] = serializer.data  # type: ignore
+
+        results: list[dict[str, Any]] = []
+        for hit, data in zip(hits, rows):
+            data["rank"] = hit.rank
+            data["snippet"] = render_snippet(hit.snippet)
+            results.append(data)
+
+        url: str = request.build_absolute_uri()
+        return Response(
+            data={
+                "next": replace_query_param(url, "page", page + 1) if has_next else None,
+                "previous": replace_query_param(url, "page", page - 1) if page > 1 else None,
+                "results": results,
+            },
+            status=HTTP_200_OK,
+        )
+
+    @action(
+        methods=["POST"],
+        detail=False,
+        url_path="import",
+        url_name="post-import",
+        permission_classes=[IsAuthenticated],
+    )
+    def bulk_import(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Import posts from an NDJSON or CSV request body, authored by the current user.
+
+        The body is read line by line and written in batches. Only staff users
+        may name another author by email, the ``author`` of the records is
+        ignored for everyone else. Pass the ``offset`` of the returned report
+        to resume an interrupted import.
+        """
+
+        query_serializer = PostImportQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        options: dict[str, Any] = query_serializer.validated_data  # type: ignore
+
+        reader: Any = CONTENT_TYPE_READERS.get(request.content_type.split(";")[0].strip())
+        if reader is None:
+            return Response(
+                data={"detail": f"Supported content types: {', '.join(CONTENT_TYPE_READERS)}."},
+                status=HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            )
+        if request.stream is None:
+            return Response(
+                data={"detail": "The request body is empty."},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        importer: PostImporter = PostImporter(
+            default_author=request.user,  # type: ignore
+            batch_size=options["batch_size"],
+            allow_other_authors=request.user.is_staff,  # type: ignore
+        )
+        report: ImportReport = ImportReport(offset=options["offset"])
+        try:
+            importer.run(reader(request.stream), report)
+        except (ValueError, csv.Error) as error:
+            return Response(
+                data={"detail": f"Malformed input: {error}", **report.as_dict()},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            data=report.as_dict(),
+            status=HTTP_200_OK,
+        )
@@ -1,47 +1,44 @@
-from typing import Any
+from typing import Any, Optional
 
-from django.db.models import QuerySet
+from django.http import HttpResponseBase
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import (HTTP_200_OK, HTTP_201_CREATED,
                                    HTTP_204_NO_CONTENT, HTTP_404_NOT_FOUND)
 from rest_framework.viewsets import ViewSet
 
+from apps.abstracts.decorators import (cache_response, conditional_response,
+                                       query_budget)
+from apps.abstracts.serializers import SparseFieldset
+from apps.blogs import cache_tags
 from apps.blogs.models import Tag
 from apps.blogs.serializers.tag import TagSerializer
+from apps.blogs.taxonomy import get_taxonomy_snapshot, taxonomy_list_response
+from apps.blogs.views.taxonomy import TaxonomyBulkMixin
 
 
-class TagViewSet(ViewSet):
+class TagViewSet(TaxonomyBulkMixin, ViewSet):
     """ViewSet for managing blog tags."""
 
     serializer_class = TagSerializer
-    queryset = Tag.objects.filter(  # type: ignore
-        deleted_at__isnull=True,
-    )  # type: ignore
+    bulk_model = Tag
+    queryset = Tag.objects.all()  # type: ignore
 
-    def get_object(self) -> Tag:
-        """Get a tag by its ID."""
+    def get_object(self, fieldset: Optional[SparseFieldset] = None) -> Tag:
+        """Get a tag by its ID, with only the columns of the sparse fieldset if one is given."""
 
         self.queryset.filter(
             id=self.kwargs["pk"],  # type: ignore
         )
-        return self.queryset.get(id=self.kwargs["pk"])  # type: ignore
+        queryset = self.queryset if fieldset is None else self.queryset.only(*fieldset.columns)
+        return queryset.get(id=self.kwargs["pk"])  # type: ignore
 
-    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        """List all tags."""
-
-        all_tags: QuerySet[Tag] = self.queryset.all()  # type: ignore
-
-        serializer: TagSerializer = TagSerializer(
-            all_tags,
-            many=True,
-        )  # type: ignore
-
-        return Response(
-            data=serializer.data,
-            status=HTTP_200_OK,
-        )
+    @query_budget(3)
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        """List all tags, from the taxonomy snapshot. ``fields`` and ``exclude`` narrow the returned fields."""
+        return taxonomy_list_response(request, get_taxonomy_snapshot().tags, TagSerializer)
 
+    @query_budget(4)
     def create(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Create a new tag."""
 
@@ -57,6 +54,7 @@ class TagViewSet(ViewSet):
             },
         )
 
+    @query_budget(4)
     def partial_update(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Partially update a tag."""
 
@@ -80,6 +78,7 @@ class TagViewSet(ViewSet):
                 status=HTTP_404_NOT_FOUND,
             )
 
+    @query_budget(3)
     def destroy(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Soft delete a tag."""
 
@@ -95,6 +94,7 @@ class TagViewSet(ViewSet):
                 status=HTTP_404_NOT_FOUND,
             )
 
+    @query_budget(5)
     def update(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Update a tag."""
 
@@ -117,13 +117,19 @@ class TagViewSet(ViewSet):
                 status=HTTP_404_NOT_FOUND,
             )
 
+    @query_budget(2)
+    @conditional_response(tags=lambda view, request, kwargs: [cache_tags.tag_detail(kwargs["pk"])])
+    @cache_response(tags=lambda view, request, kwargs: [cache_tags.tag_detail(kwargs["pk"])])
     def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        """Retrieve a tag by its ID."""
+        """Retrieve a tag by its ID. ``fields`` and ``exclude`` narrow the returned fields."""
 
         try:
-            tag: Tag = self.get_object()  # type: ignore
+            tag: Tag = self.get_object(TagSerializer.sparse_fieldset(request))  # type: ignore
 
-            serializer: TagSerializer = TagSerializer(tag)  # type: ignore
+            serializer: TagSerializer = TagSerializer(
+                tag,
+                context={"request": request},
+            )  # type: ignore
 
             return Response(
                 data=serializer.data,
@@ -0,0 +1,62 @@
+from typing import Any
+
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
+
+from apps.abstracts.models import AbstractBaseModel
+from apps.blogs.bulk import (MAX_BULK_ITEMS, BulkItemResult,
+                             bulk_soft_delete_taxonomy, bulk_upsert_taxonomy)
+
+
+class TaxonomyBulkMixin:
+    """ViewSet mixin adding the ``bulk`` action to the tag and category viewsets."""
+
+    bulk_model: type[AbstractBaseModel]
+
+    @action(
+        methods=["POST", "DELETE"],
+        detail=False,
+        url_path="bulk",
+        url_name="bulk",
+        permission_classes=[IsAuthenticated],
+    )
+    def bulk(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Create or update rows by slug, or soft delete them.
+
+        POST takes an array of name/slug objects, DELETE an array of slugs.
+        Pass ``?atomic=true`` to POST to write nothing unless every item is valid.
+        """
+
+        items: Any = request.data
+        if not isinstance(items, list) or not 0 < len(items) <= MAX_BULK_ITEMS:
+            return Response(
+                data={"detail": f"Expected an array of 1 to {MAX_BULK_ITEMS} items."},
+                status=HTTP_400_BAD_REQUEST,
+            )
+
+        if request.method == "DELETE":
+            if not all(isinstance(slug, str) for slug in items):
+                return Response(
+                    data={"detail": "Expected an array of slugs."},
+                    status=HTTP_400_BAD_REQUEST,
+                )
+
+            results: list[BulkItemResult] = bulk_soft_delete_taxonomy(self.bulk_model, items)
+            return Response(
+                data={"results": [result.as_dict() for result in results]},
+                status=HTTP_200_OK,
+            )
+
+        results, written = bulk_upsert_taxonomy(
+            self.bulk_model,
+            items,
+            atomic=request.query_params.get("atomic") in ("1", "true"),
+        )
+        return Response(
+            data={"results": [result.as_dict() for result in results]},
+            status=HTTP_200_OK if written else HTTP_400_BAD_REQUEST,
+        )
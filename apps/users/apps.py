@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class UsersConfig(AppConfig):
     name = 'apps.users'
+
+    def ready(self) -> None:
+        """Connect the signal receivers."""
+        from apps.users import signals  # noqa: F401
@@ -0,0 +1,106 @@
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+
+from apps.abstracts.cache import BaseCacheBackend, build_cache_backend
+from apps.users.models import User
+
+# Enough for the permission checks and the ``me`` action; any other field is
+# loaded from the database on first access.
+CACHED_USER_FIELDS = [
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+    "date_joined",
+]
+
+_user_cache: Optional[BaseCacheBackend] = None
+
+
+def get_user_cache() -> BaseCacheBackend:
+    """Get the process-wide cache of authenticated users configured by ``AUTH_USER_CACHE``."""
+
+    global _user_cache
+    if _user_cache is None:
+        _user_cache = build_cache_backend(settings.AUTH_USER_CACHE)
+    return _user_cache
+
+
+def user_cache_key(user_id: Any) -> str:
+    """Get the cache key of the user state."""
+    return f"auth:user:{user_id}"
+
+
+def forget_cached_users(user_ids: Iterable[Any]) -> None:
+    """Drop the cached state of the users."""
+
+    cache: BaseCacheBackend = get_user_cache()
+    for user_id in user_ids:
+        cache.delete(user_cache_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication which caches the user it resolves from the token.
+
+    The fields of ``CACHED_USER_FIELDS`` are kept in a bounded cache for
+    ``AUTH_USER_CACHE["TIMEOUT"]`` seconds, so a token of a known user is
+    authenticated without querying the database. The user is rebuilt as a
+    model instance with the other fields deferred, which keeps saving it safe.
+    Entries are dropped when the user is saved or deleted.
+    """
+
+    def get_user(self, validated_token: Token) -> User:  # type: ignore
+        """Get the user of the token from the cache, loading and caching it on a miss."""
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # Revocation compares the password hash, which isn't cached.
+            return super().get_user(validated_token)  # type: ignore
+
+        try:
+            user_id: Any = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as error:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from error
+
+        cache: BaseCacheBackend = get_user_cache()
+        key: str = user_cache_key(user_id)
+        state: Optional[dict[str, Any]] = cache.get(key)
+        if state is None:
+            state = (
+                User.objects.filter(
+                    **{api_settings.USER_ID_FIELD: user_id},
+                    deleted_at__isnull=True,
+                )
+                .values(*CACHED_USER_FIELDS)
+                .first()
+            )
+            if state is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            cache.set(key, state, settings.AUTH_USER_CACHE.get("TIMEOUT"))
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not state["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        return self.build_user(state)
+
+    @staticmethod
+    def build_user(state: dict[str, Any]) -> User:
+        """Build a user as loaded from the database, with the missing fields deferred."""
+
+        field_names: list[str] = [
+            field.attname for field in User._meta.concrete_fields if field.attname in state
+        ]
+        return User.from_db(  # type: ignore
+            User.objects.db,
+            field_names,
+            [state[field_name] for field_name in field_names],
+        )
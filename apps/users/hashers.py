@@ -0,0 +1,143 @@
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+from typing import Any, Callable, Optional
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    ScryptPasswordHasher,
+    make_password,
+    verify_password,
+)
+from django.utils.crypto import get_random_string
+from rest_framework.exceptions import APIException
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    """Scrypt hasher with the cost set by ``PASSWORD_HASHING["SCRYPT"]``."""
+
+    work_factor = settings.PASSWORD_HASHING["SCRYPT"]["work_factor"]
+    block_size = settings.PASSWORD_HASHING["SCRYPT"]["block_size"]
+    parallelism = settings.PASSWORD_HASHING["SCRYPT"]["parallelism"]
+    maxmem = settings.PASSWORD_HASHING["SCRYPT"]["maxmem"]
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2 hasher with the cost set by ``PASSWORD_HASHING["ARGON2"]``, needs argon2-cffi."""
+
+    time_cost = settings.PASSWORD_HASHING["ARGON2"]["time_cost"]
+    memory_cost = settings.PASSWORD_HASHING["ARGON2"]["memory_cost"]
+    parallelism = settings.PASSWORD_HASHING["ARGON2"]["parallelism"]
+
+
+class PasswordHashingBusy(APIException):
+    status_code = 503
+    default_detail = "Too many password checks in progress, try again later."
+    default_code = "password_hashing_busy"
+
+
+class PasswordHashingExecutor:
+    """
+    Runs password hashing and verification, optionally off the request thread.
+
+    In ``inline`` mode the work runs in the calling thread. In ``thread`` or
+    ``process`` mode it runs in a pool of ``max_workers``, which caps the cores
+    a login burst can take from the rest of the traffic. At most
+    ``max_pending`` operations wait for the pool; past that, callers are
+    rejected with ``PasswordHashingBusy`` instead of queueing, and so are
+    callers still waiting after ``timeout`` seconds.
+    """
+
+    MODES = ["inline", "thread", "process"]
+
+    def __init__(
+        self,
+        mode: str = "inline",
+        max_workers: int = 2,
+        max_pending: int = 64,
+        timeout: Optional[float] = None,
+    ) -> None:
+        if mode not in self.MODES:
+            raise ValueError(f"Password hashing mode must be one of {self.MODES}.")
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._pending = BoundedSemaphore(max_pending)
+        self._pool: Optional[Executor] = None
+        self._pool_lock = Lock()
+
+    def make_password(self, password: str) -> str:
+        """Hash the password with the preferred hasher."""
+        return self.run(make_password, password)
+
+    def verify_password(self, password: str, encoded: str) -> tuple[bool, bool]:
+        """Check the password, returning whether it matches and whether its hash must be updated."""
+        return self.run(verify_password, password, encoded)
+
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run the hashing function in the configured place."""
+
+        if self.mode == "inline":
+            return func(*args)
+
+        if not self._pending.acquire(blocking=False):
+            raise PasswordHashingBusy()
+        try:
+            future: Future = self.get_pool().submit(func, *args)
+        except BaseException:
+            self._pending.release()
+            raise
+        # Released when the work ends rather than when the caller stops
+        # waiting, so timed out operations still count against max_pending.
+        future.add_done_callback(lambda _: self._pending.release())
+
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise PasswordHashingBusy()
+
+    def get_pool(self) -> Executor:
+        """Get the worker pool, started on first use."""
+
+        with self._pool_lock:
+            if self._pool is None:
+                if self.mode == "process":
+                    # Workers hash with the hashers of the project settings.
+                    self._pool = ProcessPoolExecutor(self.max_workers, initializer=django.setup)
+                else:
+                    self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix="password-hashing")
+            return self._pool
+
+
+_password_hashing_executor: Optional[PasswordHashingExecutor] = None
+
+
+def get_password_hashing_executor() -> PasswordHashingExecutor:
+    """Get the process-wide executor configured by ``PASSWORD_HASHING``."""
+
+    global _password_hashing_executor
+    if _password_hashing_executor is None:
+        config: dict[str, Any] = settings.PASSWORD_HASHING
+        _password_hashing_executor = PasswordHashingExecutor(
+            mode=config["EXECUTOR"],
+            max_workers=config["MAX_WORKERS"],
+            max_pending=config["MAX_PENDING"],
+            timeout=config["TIMEOUT"],
+        )
+    return _password_hashing_executor
+
+
+_dummy_password_hash: Optional[str] = None
+
+
+def check_dummy_password(password: str) -> None:
+    """Verify the password against a throwaway hash of the preferred hasher, for constant timing."""
+
+    global _dummy_password_hash
+    executor: PasswordHashingExecutor = get_password_hashing_executor()
+    if _dummy_password_hash is None:
+        _dummy_password_hash = executor.make_password(get_random_string(32))
+    executor.verify_password(password, _dummy_password_hash)
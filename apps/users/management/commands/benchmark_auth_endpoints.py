@@ -0,0 +1,99 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from statistics import quantiles
+from time import perf_counter
+from typing import Any, Callable
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection
+from django.test import Client, override_settings
+
+from apps.users.hashers import get_password_hashing_executor
+from apps.users.models import User
+
+PASSWORD = "benchmark-password"
+
+
+class Command(BaseCommand):
+    """Measure the latency of the login and register endpoints."""
+
+    help = (
+        "Send concurrent requests to /api/auth/register and /api/auth/login in process "
+        "and report the p50/p99 latency and the response statuses. Throttling is off "
+        "unless --throttle is passed. The created users are deleted afterwards."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint.")
+        parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients.")
+        parser.add_argument("--throttle", action="store_true", help="Keep the throttles enabled.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with override_settings(THROTTLING={**settings.THROTTLING, "ENABLED": options["throttle"]}):
+            self.benchmark(options)
+
+    def benchmark(self, options: dict[str, Any]) -> None:
+        """Register then log in the benchmark users."""
+
+        executor = get_password_hashing_executor()
+        self.stdout.write(
+            f"Hashing executor: {executor.mode} ({executor.max_workers} workers), "
+            f"concurrency: {options['concurrency']}"
+        )
+
+        run_id: str = uuid4().hex[:8]
+        emails: list[str] = [f"bench-{run_id}-{index}@example.com" for index in range(options["requests"])]
+        try:
+            self.report(
+                "register",
+                lambda email: Client().post(
+                    "/api/auth/register",
+                    {"email": email, "password": PASSWORD},
+                    content_type="application/json",
+                ).status_code,
+                emails,
+                options["concurrency"],
+            )
+            self.report(
+                "login",
+                lambda email: Client().post(
+                    "/api/auth/login",
+                    {"email": email, "password": PASSWORD},
+                    content_type="application/json",
+                ).status_code,
+                emails,
+                options["concurrency"],
+            )
+        finally:
+            User.objects.filter(email__in=emails).delete()
+
+    def report(
+        self,
+        name: str,
+        send: Callable[[str], int],
+        emails: list[str],
+        concurrency: int,
+    ) -> None:
+        """Send one request per email and print the latency percentiles."""
+
+        def timed(email: str) -> tuple[float, int]:
+            started_at: float = perf_counter()
+            try:
+                status: int = send(email)
+            finally:
+                connection.close()
+            return (perf_counter() - started_at) * 1000, status
+
+        started_at: float = perf_counter()
+        with ThreadPoolExecutor(concurrency) as pool:
+            results: list[tuple[float, int]] = list(pool.map(timed, emails))
+        elapsed: float = perf_counter() - started_at
+
+        percentiles: list[float] = quantiles([timing for timing, _ in results], n=100)
+        statuses: Counter = Counter(status for _, status in results)
+        self.stdout.write(
+            f"{name:<9} p50={percentiles[49]:8.1f}ms p99={percentiles[98]:8.1f}ms "
+            f"throughput={len(results) / elapsed:7.1f}/s statuses={dict(statuses)}"
+        )
@@ -0,0 +1,64 @@
+from statistics import quantiles
+from time import perf_counter
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.request import Request
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.users.authentication import CachedJWTAuthentication, forget_cached_users
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    """Compare the cost of the JWT authentication classes."""
+
+    help = (
+        "Authenticate the same access token repeatedly with the plain and the cached "
+        "JWT authentication, reporting latency percentiles and queries per request."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--email", required=True, help="Email of the authenticated user.")
+        parser.add_argument("--requests", type=int, default=5000, help="Authentications per run.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            user: User = User.objects.get(email=options["email"])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['email']}' does not exist.")
+
+        token: str = str(AccessToken.for_user(user))
+        http_request = RequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        forget_cached_users([user.pk])
+
+        plain: JWTAuthentication = JWTAuthentication()
+        cached: CachedJWTAuthentication = CachedJWTAuthentication()
+        runs: dict[str, Callable[[], Any]] = {
+            # Signature and claims verification only, the floor of both classes.
+            "token only": lambda: plain.get_validated_token(token.encode()),
+            "JWTAuthentication": lambda: plain.authenticate(Request(http_request)),
+            "CachedJWTAuthentication": lambda: cached.authenticate(Request(http_request)),
+        }
+        for name, run in runs.items():
+            self.report(name, run, options["requests"])
+
+    def report(self, name: str, run: Callable[[], Any], requests: int) -> None:
+        """Time the runs and print the percentiles and the queries per request."""
+
+        timings: list[float] = []
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(requests):
+                started_at: float = perf_counter()
+                run()
+                timings.append((perf_counter() - started_at) * 1_000_000)
+
+        percentiles: list[float] = quantiles(timings, n=100)
+        self.stdout.write(
+            f"{name:<24} p50={percentiles[49]:8.1f}us p99={percentiles[98]:8.1f}us "
+            f"queries/request={len(queries) / requests:.3f}"
+        )
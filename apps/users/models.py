@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 
 from django.contrib.auth.models import (
     AbstractBaseUser,
@@ -16,6 +16,7 @@ from django.db.models import (
 )
 
 from apps.abstracts.models import AbstractBaseModel
+from apps.users.hashers import get_password_hashing_executor
 
 
 class UserManager(BaseUserManager):
@@ -156,3 +157,22 @@ class User(AbstractBaseUser, PermissionsMixin, AbstractBaseModel):  # type: igno
     REQUIRED_FIELDS = ["first_name", "last_name"]
 
     objects = UserManager()
+
+    def set_password(self, raw_password: Optional[str]) -> None:
+        """Hash the password through the password hashing executor."""
+
+        self.password = get_password_hashing_executor().make_password(raw_password)  # type: ignore
+        self._password = raw_password
+
+    def check_password(self, raw_password: str) -> bool:  # type: ignore
+        """Check the password, rehashing it when the hasher or its cost changed."""
+
+        is_correct, must_update = get_password_hashing_executor().verify_password(
+            raw_password,
+            self.password,
+        )
+        if is_correct and must_update:
+            self.set_password(raw_password)
+            self._password = None
+            self.save(update_fields=["password"])
+        return is_correct
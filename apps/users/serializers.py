@@ -3,6 +3,7 @@ from typing import Any, Optional
 from rest_framework.exceptions import ValidationError
 from rest_framework.serializers import CharField, EmailField, Serializer
 
+from apps.users.hashers import check_dummy_password
 from apps.users.models import User
 
 
@@ -25,12 +26,16 @@ class UserLoginSerializer(Serializer):
         user: Optional[User] = User.objects.filter(email=email).first()
 
         if not user:
+            # Spend the time of a real check, unknown emails can't be told apart.
+            check_dummy_password(password)
             raise ValidationError(
-                detail={"email": [f"User with email '{email}' does not exist."]}
+                detail={"non_field_errors": ["Incorrect email or password."]}
             )
 
         if not user.check_password(raw_password=password):
-            raise ValidationError(detail={"password": ["Incorrect password."]})
+            raise ValidationError(
+                detail={"non_field_errors": ["Incorrect email or password."]}
+            )
 
         attrs["user"] = user
 
@@ -0,0 +1,41 @@
+from typing import Any, Iterable
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.abstracts.signals import post_soft_delete
+from apps.users.authentication import forget_cached_users
+from apps.users.models import User
+
+
+def forget_on_commit(user_ids: Iterable[Any]) -> None:
+    """Drop the cached users now and once the current transaction is committed."""
+
+    user_ids = list(user_ids)
+    # The first drop covers reads from this transaction, the second one a
+    # concurrent request caching the old row before the commit.
+    forget_cached_users(user_ids)
+    transaction.on_commit(lambda: forget_cached_users(user_ids))
+
+
+@receiver(post_save, sender=User)
+def forget_saved_user(sender: Any, instance: User, created: bool, **kwargs: Any) -> None:
+    """Drop the cached state of a changed user."""
+
+    if not created:
+        forget_on_commit([instance.pk])
+
+
+@receiver(post_delete, sender=User)
+def forget_deleted_user(sender: Any, instance: User, **kwargs: Any) -> None:
+    """Drop the cached state of a deleted user."""
+
+    forget_on_commit([instance.pk])
+
+
+@receiver(post_soft_delete, sender=User)
+def forget_soft_deleted_users(sender: Any, pks: list[Any], **kwargs: Any) -> None:
+    """Drop the cached state of soft deleted users."""
+
+    forget_on_commit(pks)
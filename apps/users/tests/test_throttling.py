@@ -0,0 +1,89 @@
+from typing import Any
+from unittest import mock
+
+from django.conf import settings
+from django.http import HttpResponseBase
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.abstracts.cache import LocMemLRUCache
+from apps.abstracts.throttling import SlidingWindowCounter, get_counter_store
+
+# 20 seconds into a one minute bucket.
+NOW = 60 * 1000 + 20.0
+
+
+class SlidingWindowCounterTests(SimpleTestCase):
+    def setUp(self) -> None:
+        self.store = LocMemLRUCache()
+        self.counter = SlidingWindowCounter(self.store, limit=3, window=60)
+
+    def test_rejects_over_the_limit(self) -> None:
+        for _ in range(3):
+            self.assertIsNone(self.counter.hit("key", NOW))
+        self.assertEqual(self.counter.hit("key", NOW), 40)
+
+    def test_rejected_hits_dont_count(self) -> None:
+        for _ in range(5):
+            self.counter.hit("key", NOW)
+        self.assertEqual(self.store.get(self.counter.bucket_key("key", NOW)), 3)
+
+    def test_weighs_the_previous_bucket_by_its_overlap(self) -> None:
+        for _ in range(3):
+            self.counter.hit("key", NOW)
+
+        # Half of the previous bucket still overlaps the window: 1.5 hits.
+        later: float = NOW - 20 + 60 + 30
+        self.assertIsNone(self.counter.hit("key", later))
+        self.assertIsNone(self.counter.hit("key", later))
+        # 2 + 1.5 hits, back under the limit once the overlap drops to a third.
+        self.assertAlmostEqual(self.counter.hit("key", later), 10)
+
+    def test_forgets_buckets_out_of_the_window(self) -> None:
+        for _ in range(3):
+            self.counter.hit("key", NOW)
+        for _ in range(3):
+            self.assertIsNone(self.counter.hit("key", NOW + 120))
+
+    def test_undo(self) -> None:
+        for _ in range(3):
+            self.counter.hit("key", NOW)
+        self.counter.undo("key", NOW)
+        self.assertIsNone(self.counter.hit("key", NOW))
+
+
+@override_settings(
+    THROTTLING={
+        **settings.THROTTLING,
+        "ENABLED": True,
+        "RATES": {**settings.THROTTLING["RATES"], "login_ip": "3/min", "login_email": "2/min"},
+    }
+)
+@mock.patch("apps.abstracts.throttling.time", return_value=NOW)
+class LoginThrottleTests(TestCase):
+    def setUp(self) -> None:
+        get_counter_store().clear()
+
+    def login(self, email: str, **headers: Any) -> HttpResponseBase:
+        return self.client.post(
+            "/api/auth/login",
+            {"email": email, "password": "wrong-password"},
+            content_type="application/json",
+            **headers,
+        )
+
+    def test_spoofed_forwarded_for_is_ignored(self, _time: mock.Mock) -> None:
+        for index in range(3):
+            response = self.login(f"user-{index}@example.com", HTTP_X_FORWARDED_FOR=f"10.0.0.{index}")
+            self.assertNotEqual(response.status_code, 429)
+
+        response = self.login("user-3@example.com", HTTP_X_FORWARDED_FOR="10.0.0.3")
+        self.assertEqual(response.status_code, 429)
+
+    def test_requests_throttled_by_email_dont_count_for_the_address(self, _time: mock.Mock) -> None:
+        for _ in range(2):
+            self.assertNotEqual(self.login("user@example.com").status_code, 429)
+        self.assertEqual(self.login("user@example.com").status_code, 429)
+
+        # Third request of the address, the rejected one didn't count.
+        self.assertNotEqual(self.login("other@example.com").status_code, 429)
+        self.assertEqual(self.login("another@example.com").status_code, 429)
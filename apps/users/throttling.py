@@ -0,0 +1,33 @@
+from typing import Any
+
+from rest_framework.request import Request
+
+from apps.abstracts.throttling import SlidingWindowThrottle
+
+
+class IPThrottle(SlidingWindowThrottle):
+    """Counts the requests of every client address."""
+
+    def get_idents(self, request: Request, view: Any) -> list[str]:
+        return [self.get_ident(request)]
+
+
+class EmailThrottle(SlidingWindowThrottle):
+    """Counts the requests naming the same email, whatever the client address."""
+
+    def get_idents(self, request: Request, view: Any) -> list[str]:
+        data: Any = request.data
+        email: Any = data.get("email") if hasattr(data, "get") else None
+        return [email.strip().lower()] if isinstance(email, str) and email else []
+
+
+class LoginIPThrottle(IPThrottle):
+    scope = "login_ip"
+
+
+class LoginEmailThrottle(EmailThrottle):
+    scope = "login_email"
+
+
+class RegisterIPThrottle(IPThrottle):
+    scope = "register_ip"
@@ -8,8 +8,10 @@ from rest_framework.status import HTTP_200_OK
 from rest_framework.viewsets import ViewSet
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from apps.abstracts.decorators import validate_serializer_data
 from apps.users.models import User
 from apps.users.serializers import UserLoginSerializer, UserRegisterSerializer
+from apps.users.throttling import LoginEmailThrottle, LoginIPThrottle, RegisterIPThrottle
 
 
 class UserViewSet(ViewSet):
@@ -23,6 +25,7 @@ class UserViewSet(ViewSet):
         url_path="login",
         url_name="login",
         permission_classes=[AllowAny],
+        throttle_classes=[LoginIPThrottle, LoginEmailThrottle],
     )
     def login(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Login user."""
@@ -48,7 +51,9 @@ class UserViewSet(ViewSet):
         url_path="register",
         url_name="register",
         permission_classes=[AllowAny],
+        throttle_classes=[RegisterIPThrottle],
     )
+    @validate_serializer_data(UserRegisterSerializer)
     def register(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Register user."""
 
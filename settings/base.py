@@ -12,6 +12,9 @@ WSGI_APPLICATION = "settings.wsgi.application"
 ROOT_URLCONF = "settings.urls"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "users.User"
+DATABASE_ROUTERS = ["apps.abstracts.db_routers.ReplicaRouter"]
+# Replica aliases and their weights, filled by the env settings.
+DATABASE_REPLICAS: dict[str, int] = {}
 
 
 # ----------------------------------------------------------------
@@ -40,7 +43,10 @@ INSTALLED_APPS = DJANGO_AND_THIRD_PARTY_APPS + PROJECT_APPS
 # Middleware | Templates | Validators
 #
 MIDDLEWARE = [
+    "apps.abstracts.instrumentation.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "apps.abstracts.compression.CompressionMiddleware",
+    "apps.abstracts.db_routers.primary_pinning_middleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -86,3 +92,24 @@ LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
 USE_I18N = True
 USE_TZ = True
+
+
+# ----------------------------------------------------------------
+# Logging
+#
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        # One JSON line per request, see apps.abstracts.instrumentation.
+        "apps.request_metrics": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
+    },
+}
@@ -1,6 +1,6 @@
 from datetime import timedelta
 
-from decouple import config
+from decouple import Csv, config
 
 # --------------------------------------------
 # Env
@@ -43,6 +43,85 @@ DB_PORT = config(
     cast=str,
 )
 
+# Seconds a connection is reused across requests, 0 to close it after each
+# request. Ignored when DB_POOL is on. benchmark_db_connections against a
+# local Postgres 16 measured 4-5ms p50 per request for a new connection and
+# 0.15-0.3ms for a reused or pooled one.
+DB_CONN_MAX_AGE = config(
+    "DB_CONN_MAX_AGE",
+    default=60,
+    cast=int,
+)
+
+# Check a reused connection is still alive at the start of each request.
+DB_CONN_HEALTH_CHECKS = config(
+    "DB_CONN_HEALTH_CHECKS",
+    default=True,
+    cast=bool,
+)
+
+DB_CONNECT_TIMEOUT = config(
+    "DB_CONNECT_TIMEOUT",
+    default=5,
+    cast=int,
+)
+
+# Django's native connection pool. psycopg2 doesn't support it: install the
+# "pool" extra of the project (uv sync --extra pool), which adds psycopg 3
+# with its pool, and Django then uses psycopg 3 instead of psycopg2.
+DB_POOL = config(
+    "DB_POOL",
+    default=False,
+    cast=bool,
+)
+
+DB_POOL_MIN_SIZE = config(
+    "DB_POOL_MIN_SIZE",
+    default=2,
+    cast=int,
+)
+
+DB_POOL_MAX_SIZE = config(
+    "DB_POOL_MAX_SIZE",
+    default=10,
+    cast=int,
+)
+
+# Seconds a request waits for a free pooled connection before failing.
+DB_POOL_TIMEOUT = config(
+    "DB_POOL_TIMEOUT",
+    default=10,
+    cast=int,
+)
+
+# Read replicas of the prod database, as comma separated host[:port][=weight]
+# items sharing the credentials of the primary, e.g. "replica-1=3,replica-2:5433=1".
+DB_REPLICAS = config(
+    "DB_REPLICAS",
+    default="",
+    cast=str,
+)
+
+# Local replica: path of a second SQLite database, the main one included, to
+# exercise the replica routing locally.
+DB_LOCAL_REPLICA = config(
+    "DB_LOCAL_REPLICA",
+    default="",
+    cast=str,
+)
+
+# --------------------------------------------
+# Database routing
+#
+DATABASE_ROUTING = {
+    # Apps whose reads go to the replicas.
+    "APPS": ["blogs"],
+    # Seconds the requests of a client keep reading from the primary after a
+    # write, to cover the replication lag.
+    "PIN_SECONDS": config("DB_REPLICA_PIN_SECONDS", default=5, cast=int),
+    "PIN_COOKIE": "pin_primary",
+}
+
 # --------------------------------------------
 # Secret Key
 #
@@ -52,6 +131,10 @@ SECRET_KEY = "django-insecure-bqt7^m_m908t-xnc6!gh(bn&indw#)9sr!@3m&(#yn*_-sz03c
 # --------------------------------------------
 # Django Rest Framework
 #
+# NUM_PROXIES is the number of trusted proxies in front of the app, the
+# client address throttles count is then read from X-Forwarded-For past
+# them. Left at 0, the header is ignored and REMOTE_ADDR is used, so a
+# client can't pick its own address by forging the header.
 REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
@@ -60,8 +143,9 @@ REST_FRAMEWORK = {
         "rest_framework.filters.OrderingFilter",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.authentication.CachedJWTAuthentication",
     ),
+    "NUM_PROXIES": config("NUM_PROXIES", default=0, cast=int),
 }
 
 
@@ -101,3 +185,220 @@ SIMPLE_JWT = {
     "SLIDING_TOKEN_OBTAIN_SERIALIZER": "rest_framework_simplejwt.serializers.TokenObtainSlidingSerializer",
     "SLIDING_TOKEN_REFRESH_SERIALIZER": "rest_framework_simplejwt.serializers.TokenRefreshSlidingSerializer",
 }
+
+
+# ----------------------------------------------
+# Password hashing
+#
+PASSWORD_HASHING = {
+    # Preferred hasher: scrypt, argon2 (needs argon2-cffi) or pbkdf2.
+    # Hashes made by the others are upgraded on the next login.
+    "ALGORITHM": config("PASSWORD_HASHER", default="scrypt", cast=str),
+    "SCRYPT": {
+        "work_factor": config("PASSWORD_SCRYPT_WORK_FACTOR", default=2**14, cast=int),
+        "block_size": config("PASSWORD_SCRYPT_BLOCK_SIZE", default=8, cast=int),
+        "parallelism": config("PASSWORD_SCRYPT_PARALLELISM", default=5, cast=int),
+        "maxmem": config("PASSWORD_SCRYPT_MAXMEM", default=0, cast=int),
+    },
+    "ARGON2": {
+        "time_cost": config("PASSWORD_ARGON2_TIME_COST", default=2, cast=int),
+        "memory_cost": config("PASSWORD_ARGON2_MEMORY_COST", default=102400, cast=int),
+        "parallelism": config("PASSWORD_ARGON2_PARALLELISM", default=8, cast=int),
+    },
+    # Where hashing runs: inline (request thread), thread or process pool.
+    "EXECUTOR": config("PASSWORD_HASHING_EXECUTOR", default="inline", cast=str),
+    "MAX_WORKERS": config("PASSWORD_HASHING_MAX_WORKERS", default=2, cast=int),
+    # Operations allowed to wait for a pool worker before rejecting with 503.
+    "MAX_PENDING": config("PASSWORD_HASHING_MAX_PENDING", default=64, cast=int),
+    "TIMEOUT": config("PASSWORD_HASHING_TIMEOUT", default=10, cast=int),
+}
+
+PASSWORD_HASHER_CLASSES = {
+    "scrypt": "apps.users.hashers.TunedScryptPasswordHasher",
+    "argon2": "apps.users.hashers.TunedArgon2PasswordHasher",
+    "pbkdf2": "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+}
+
+PASSWORD_HASHERS = [
+    PASSWORD_HASHER_CLASSES[PASSWORD_HASHING["ALGORITHM"]],
+    *(
+        hasher
+        for algorithm, hasher in PASSWORD_HASHER_CLASSES.items()
+        if algorithm != PASSWORD_HASHING["ALGORITHM"]
+    ),
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+]
+
+
+# ----------------------------------------------
+# Throttling
+#
+# Sliding window counters of the auth endpoints. The in-process backend counts
+# per process, use apps.abstracts.cache.DjangoCacheBackend over a shared cache
+# (Redis, Memcached) to count across workers.
+THROTTLING = {
+    "ENABLED": config("THROTTLING_ENABLED", default=True, cast=bool),
+    "BACKEND": config(
+        "THROTTLING_BACKEND",
+        default="apps.abstracts.cache.LocMemLRUCache",
+        cast=str,
+    ),
+    "OPTIONS": {
+        "max_entries": config("THROTTLING_MAX_ENTRIES", default=100000, cast=int),
+        "alias": config("THROTTLING_ALIAS", default="default", cast=str),
+    },
+    "RATES": {
+        "login_ip": config("THROTTLING_LOGIN_IP_RATE", default="30/min", cast=str),
+        "login_email": config("THROTTLING_LOGIN_EMAIL_RATE", default="5/min", cast=str),
+        "register_ip": config("THROTTLING_REGISTER_IP_RATE", default="10/hour", cast=str),
+    },
+}
+
+
+# ----------------------------------------------
+# Authenticated users cache
+#
+# The in-process backend is only invalidated in the process saving the user,
+# other processes see the change once TIMEOUT expires. Use
+# apps.abstracts.cache.DjangoCacheBackend over a shared cache to avoid that.
+AUTH_USER_CACHE = {
+    "BACKEND": config(
+        "AUTH_USER_CACHE_BACKEND",
+        default="apps.abstracts.cache.LocMemLRUCache",
+        cast=str,
+    ),
+    "TIMEOUT": config("AUTH_USER_CACHE_TIMEOUT", default=60, cast=int),
+    "OPTIONS": {
+        "max_entries": config("AUTH_USER_CACHE_MAX_ENTRIES", default=10000, cast=int),
+        "alias": config("AUTH_USER_CACHE_ALIAS", default="default", cast=str),
+    },
+}
+
+
+# ----------------------------------------------
+# Post slug cache
+#
+# Resolves post slugs to ids so listing the comments of a post doesn't load
+# it, see apps.blogs.slugs. Like the users cache, the in-process backend is
+# only invalidated in the process changing the post, so elsewhere a renamed or
+# deleted post may keep listing its comments for up to TIMEOUT seconds; use
+# apps.abstracts.cache.DjangoCacheBackend over a shared cache so renames and
+# deletes are seen everywhere at once.
+POST_SLUG_CACHE = {
+    "BACKEND": config(
+        "POST_SLUG_CACHE_BACKEND",
+        default="apps.abstracts.cache.LocMemLRUCache",
+        cast=str,
+    ),
+    "TIMEOUT": config("POST_SLUG_CACHE_TIMEOUT", default=60, cast=int),
+    "OPTIONS": {
+        "max_entries": config("POST_SLUG_CACHE_MAX_ENTRIES", default=10000, cast=int),
+        "alias": config("POST_SLUG_CACHE_ALIAS", default="default", cast=str),
+    },
+}
+
+
+# ----------------------------------------------
+# Taxonomy snapshot
+#
+# In-memory copy of the tags and categories, see apps.blogs.taxonomy. The
+# backend only stores the version bumped by writes: with the in-process
+# backend, other processes pick up changes after TIMEOUT, with
+# apps.abstracts.cache.DjangoCacheBackend over a shared cache on their next read.
+TAXONOMY_SNAPSHOT = {
+    "BACKEND": config(
+        "TAXONOMY_SNAPSHOT_BACKEND",
+        default="apps.abstracts.cache.LocMemLRUCache",
+        cast=str,
+    ),
+    "TIMEOUT": config("TAXONOMY_SNAPSHOT_TIMEOUT", default=300, cast=int),
+    "OPTIONS": {
+        "max_entries": 16,
+        "alias": config("TAXONOMY_SNAPSHOT_ALIAS", default="default", cast=str),
+    },
+}
+
+
+# ----------------------------------------------
+# Response cache
+#
+RESPONSE_CACHE = {
+    "ENABLED": config("RESPONSE_CACHE_ENABLED", default=True, cast=bool),
+    "BACKEND": config(
+        "RESPONSE_CACHE_BACKEND",
+        default="apps.abstracts.cache.LocMemLRUCache",
+        cast=str,
+    ),
+    "TIMEOUT": config("RESPONSE_CACHE_TIMEOUT", default=300, cast=int),
+    "OPTIONS": {
+        # Used by LocMemLRUCache.
+        "max_entries": config("RESPONSE_CACHE_MAX_ENTRIES", default=2048, cast=int),
+        # Used by DjangoCacheBackend: alias of the CACHES entry to store into.
+        "alias": config("RESPONSE_CACHE_ALIAS", default="default", cast=str),
+    },
+}
+
+
+# ----------------------------------------------
+# Request metrics
+#
+# Query count and timings of every request, see
+# apps.abstracts.instrumentation. RAISE_ON_BUDGET turns exceeded query
+# budgets into errors and is meant for tests.
+REQUEST_METRICS = {
+    "ENABLED": config("REQUEST_METRICS_ENABLED", default=True, cast=bool),
+    "SERVER_TIMING": config("REQUEST_METRICS_SERVER_TIMING", default=True, cast=bool),
+    "LOG": config("REQUEST_METRICS_LOG", default=True, cast=bool),
+    "RAISE_ON_BUDGET": config("REQUEST_METRICS_RAISE_ON_BUDGET", default=False, cast=bool),
+}
+
+
+# ----------------------------------------------
+# Fast serialization
+#
+# Build the read-only post payloads from values() rows instead of
+# PostSerializer and encode them with orjson when it is installed, see
+# apps.blogs.serializers.fast. The output is the same; check it with the
+# benchmark_post_serialization command before turning it on.
+FAST_SERIALIZATION = {
+    "ENABLED": config("FAST_SERIALIZATION_ENABLED", default=False, cast=bool),
+}
+
+
+# ----------------------------------------------
+# Compression
+#
+# Negotiated compression of API responses, see apps.abstracts.compression.
+# ENCODINGS lists the preferred encodings first; br and zstd are skipped
+# unless brotli and zstd (compression.zstd or zstandard) are installed.
+# LEVELS trade CPU for size: gzip 1-9, brotli quality 0-11, zstd 1-22.
+# text/html is left out of CONTENT_TYPES: the browsable API pages hold the
+# CSRF token next to reflected input, which compression exposes to BREACH.
+COMPRESSION = {
+    "ENABLED": config("COMPRESSION_ENABLED", default=True, cast=bool),
+    "ENCODINGS": config("COMPRESSION_ENCODINGS", default="zstd,br,gzip", cast=Csv()),
+    "MIN_LENGTH": config("COMPRESSION_MIN_LENGTH", default=1024, cast=int),
+    "LEVELS": {
+        "GZIP": config("COMPRESSION_GZIP_LEVEL", default=6, cast=int),
+        "BROTLI": config("COMPRESSION_BROTLI_QUALITY", default=5, cast=int),
+        "ZSTD": config("COMPRESSION_ZSTD_LEVEL", default=3, cast=int),
+    },
+    "CONTENT_TYPES": [
+        "application/json",
+        "application/x-ndjson",
+        "text/csv",
+        "text/plain",
+    ],
+}
+
+
+# ----------------------------------------------
+# Exports
+#
+# Incremental exports stop SAFETY_LAG_SECONDS before now: updated_at is set
+# when a row is saved, not when its transaction commits, so rows of
+# transactions still open at export time are left to the next window. Keep it
+# above the longest write transaction.
+EXPORT = {
+    "SAFETY_LAG_SECONDS": config("EXPORT_SAFETY_LAG_SECONDS", default=60, cast=int),
+}
@@ -1,4 +1,5 @@
 from settings.base import *  # noqa
+from settings.conf import DB_LOCAL_REPLICA
 
 DEBUG = True
 
@@ -11,3 +12,11 @@ DATABASES = {
     }
 }
 
+
+if DB_LOCAL_REPLICA:
+    DATABASES["replica"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": DB_LOCAL_REPLICA,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS["replica"] = 1
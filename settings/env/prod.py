@@ -1,5 +1,19 @@
 from settings.base import *  # noqa
-from settings.conf import DB_HOST, DB_NAME, DB_PASSWORD, DB_PORT, DB_USER
+from settings.conf import (
+    DB_CONN_HEALTH_CHECKS,
+    DB_CONN_MAX_AGE,
+    DB_CONNECT_TIMEOUT,
+    DB_HOST,
+    DB_NAME,
+    DB_PASSWORD,
+    DB_POOL,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_MIN_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_PORT,
+    DB_REPLICAS,
+    DB_USER,
+)
 
 DEBUG = False
 
@@ -13,6 +27,31 @@ DATABASES = {
         "PASSWORD": DB_PASSWORD,
         "HOST": DB_HOST,
         "PORT": DB_PORT,
+        # Persistent connections can't be combined with the pool.
+        "CONN_MAX_AGE": 0 if DB_POOL else DB_CONN_MAX_AGE,
+        "CONN_HEALTH_CHECKS": DB_CONN_HEALTH_CHECKS,
+        "OPTIONS": {
+            "connect_timeout": DB_CONNECT_TIMEOUT,
+        },
     }
 }
 
+# Needs psycopg 3, from the "pool" extra of the project.
+if DB_POOL:
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": DB_POOL_MIN_SIZE,
+        "max_size": DB_POOL_MAX_SIZE,
+        "timeout": DB_POOL_TIMEOUT,
+    }
+
+for index, replica in enumerate(item.strip() for item in DB_REPLICAS.split(",") if item.strip()):
+    address, _, weight = replica.partition("=")
+    host, _, port = address.partition(":")
+    alias = f"replica_{index}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": port or DB_PORT,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS[alias] = int(weight or 1)